@@ -0,0 +1,11 @@
+"""Benchmarks de Neon Pulse (simulation et rendu).
+
+Les pilotes SDL factices sont choisis avant tout import de pygame / src :
+les benchmarks tournent sans fenêtre ni périphérique audio, mais avec un
+vrai rendu (il faut donc désactiver le mode headless de src.constants).
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["NEON_PULSE_HEADLESS"] = "0"
@@ -0,0 +1,119 @@
+"""Lance les benchmarks, écrit les résultats en JSON et les compare à une référence.
+
+    python -m benchmarks.run                     # tout, comparé à benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline     # enregistre la référence locale
+    python -m benchmarks.run --only multiball ball.check_collision --quick
+
+Le code de sortie vaut 1 si une mesure est plus lente que la référence de
+plus de --threshold (20 % par défaut).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from benchmarks.scenarios import (SCENARIOS, MICRO_BENCHMARKS, run_scenario, run_micro,
+                                  environment)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def flatten(results):
+    """{"scenario.nom.frames_per_sec": meilleur débit, ...} pour la comparaison"""
+    metrics = {}
+    for group in ("scenarios", "micro"):
+        for name, result in results.get(group, {}).items():
+            for key, value in result.items():
+                if isinstance(value, dict) and "best" in value:
+                    metrics[f"{group}.{name}.{key}"] = value["best"]
+    return metrics
+
+
+def compare(results, baseline, threshold):
+    """Liste des (mesure, référence, actuel, variation, régression) ; régression si variation < -threshold"""
+    current = flatten(results)
+    reference = flatten(baseline)
+    rows = []
+    for metric, value in current.items():
+        if metric in reference and reference[metric] > 0:
+            change = value / reference[metric] - 1
+            rows.append((metric, reference[metric], value, change, change < -threshold))
+    return rows
+
+
+def run(names, repeats, quick):
+    scale = 5 if quick else 1
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeats": repeats,
+        "quick": quick,
+        "environment": environment(),
+        "scenarios": {},
+        "micro": {},
+    }
+    for name in names:
+        start = time.perf_counter()
+        if name in SCENARIOS:
+            result = results["scenarios"][name] = run_scenario(
+                name, count_updates=600 // scale, count_frames=300 // scale, repeats=repeats)
+        else:
+            result = results["micro"][name] = run_micro(name, count=10000 // scale,
+                                                        repeats=repeats)
+        summary = ", ".join(f"{key} {value['best']:.0f}" for key, value in result.items()
+                            if isinstance(value, dict) and "best" in value)
+        print(f"{name:<24} {summary}  ({time.perf_counter() - start:.1f}s)")
+    return results
+
+
+def main(argv=None):
+    available = [*SCENARIOS, *MICRO_BENCHMARKS]
+    parser = argparse.ArgumentParser(description="Benchmarks de Neon Pulse")
+    parser.add_argument("--only", nargs="+", choices=available, metavar="NOM",
+                        help="benchmarks à lancer : " + ", ".join(available))
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="nombre de passages par mesure (le meilleur est retenu)")
+    parser.add_argument("--quick", action="store_true",
+                        help="mesures 5x plus courtes (moins précises)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="fichier JSON de référence")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre ces résultats comme nouvelle référence")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="ralentissement toléré par rapport à la référence")
+    args = parser.parse_args(argv)
+
+    results = run(args.only or available, args.repeats, args.quick)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Pas de référence : lancer avec --save-baseline pour en créer une")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = 0
+    for metric, reference, value, change, regressed in compare(results, baseline,
+                                                               args.threshold):
+        flag = "  RÉGRESSION" if regressed else ""
+        print(f"{metric:<48} {reference:10.0f} -> {value:10.0f} ({change:+.1%}){flag}")
+        regressions += regressed
+    if regressions:
+        print(f"{regressions} mesure(s) plus lente(s) de plus de {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
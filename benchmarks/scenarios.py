@@ -0,0 +1,217 @@
+"""Scénarios paramétrés construits directement à partir de Game / Ball / Brick"""
+import platform
+import statistics
+import time
+import numpy as np
+import pygame
+from src.constants import WIDTH, HEIGHT, INTERFACE_HEIGHT
+from src.game import Game
+from src.headless import NO_KEYS
+from src.startup import init_pygame
+
+SEED = 1234
+
+# Paramètres par défaut d'un scénario
+DEFAULTS = {
+    "rows": 3,          # rangées de 6 briques
+    "balls": 1,
+    "particles": 0,     # particules vivantes en permanence
+    "overlay": None,    # None, "pause", "victory" ou "game_over"
+    "hud": "idle",      # "idle" ou "active" (score et multiplicateur qui changent)
+}
+
+SCENARIOS = {
+    "level1": {},
+    "dense_field": {"rows": 12},
+    "multiball": {"rows": 8, "balls": 8},
+    "ball_storm": {"rows": 8, "balls": 300},
+    "particle_storm": {"rows": 8, "particles": 3000},
+    "hud_active": {"hud": "active"},
+    "pause_overlay": {"overlay": "pause"},
+    "victory_overlay": {"overlay": "victory"},
+    "worst_case": {"rows": 12, "balls": 8, "particles": 3000, "hud": "active"},
+}
+
+
+class BenchGame(Game):
+    """Partie de benchmark : vrai rendu, mais ni musique ni fichier de record"""
+
+    def __init__(self, seed=SEED):
+        super().__init__(headless=False, seed=seed)
+        # Arrête le thread de sauvegarde : save_high_score() ne fait plus rien
+        self.close()
+
+    def load_high_score(self):
+        return 0
+
+    def load_and_play_music(self):
+        pass
+
+    def split_balls(self, spread=0.35):
+        # Bonus multiball sans effet : le nombre de balles reste celui du scénario
+        pass
+
+
+def add_balls(game, balls):
+    """Complète la partie jusqu'à `balls` balles, réparties sur la largeur"""
+    for i in range(len(game.balls), balls):
+        ball = game.create_ball()
+        ball.speed_x = ball.BASE_SPEED * (-1) ** i * (1 + i % 3) / 2
+        ball.set_position((WIDTH - ball.rect.width) * i // balls, ball.rect.y - i % 40 * 5)
+
+
+def build_game(rows=3, balls=1, particles=0, overlay=None, hud="idle"):
+    """Construit une partie dans l'état décrit par les paramètres du scénario"""
+    game = BenchGame()
+    if rows != game.level + 2:
+        game.jump_to_level(rows - 2)
+
+    add_balls(game, balls)
+
+    if particles:
+        # Particules quasi immortelles et sans gravité : charge constante
+        game.particles.emit(WIDTH / 2, (HEIGHT + INTERFACE_HEIGHT) / 2, particles,
+                            (255, 182, 193), spread=(WIDTH, HEIGHT - INTERFACE_HEIGHT),
+                            vel_x=(-10, 10), vel_y=(-10, 10), lifetime=(1e9, 1e9),
+                            gravity=0)
+
+    if hud == "active":
+        game.score_multiplier = 2
+        game.multiplier_time = 10 ** 9
+
+    if overlay == "pause":
+        game.paused = True
+    elif overlay == "victory":
+        game.victory = True
+        game.victory_time = time.time()
+    elif overlay == "game_over":
+        game.game_over = True
+    return game
+
+
+def track_lowest_ball(game):
+    """Place la raquette sous la balle la plus basse (pilote automatique simple)"""
+    lowest = max(game.balls, key=lambda ball: ball.rect.y)
+    game.player.rect.centerx = lowest.rect.centerx
+
+
+def measure(setup, body, count, repeats):
+    """Chronomètre `count` appels de body(state) après setup(), `repeats` fois.
+
+    Retourne les opérations par seconde du meilleur passage et du passage médian.
+    """
+    durations = []
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        for _ in range(count):
+            body(state)
+        durations.append(time.perf_counter() - start)
+    return {
+        "best": count / min(durations),
+        "median": count / statistics.median(durations),
+    }
+
+
+def bench_updates(params, count, repeats):
+    """Mises à jour de la simulation par seconde (sans rendu)"""
+    hud_active = params["hud"] == "active"
+    balls = params["balls"]
+
+    def body(game):
+        track_lowest_ball(game)
+        # Charge constante : ni game over, ni fin de niveau, ni balle en plus
+        # ou en moins pendant la mesure
+        game.lives = 3
+        add_balls(game, balls)
+        if game.victory:
+            game.victory = False
+            game.create_bricks()
+        if hud_active:
+            game.score += 7
+        game.update(NO_KEYS)
+
+    return measure(lambda: build_game(**params), body, count, repeats)
+
+
+def bench_frames(params, count, repeats):
+    """Images par seconde du GameRenderer, la simulation étant figée"""
+    hud_active = params["hud"] == "active"
+
+    def setup():
+        game = build_game(**params)
+        game.renderer.draw()
+        return game
+
+    def body(game):
+        # Les animations avancent comme si la simulation tournait
+        game.animation_time += 0.05
+        if hud_active:
+            game.score += 7
+        game.score_display.update(game.score)
+        game.renderer.draw()
+
+    return measure(setup, body, count, repeats)
+
+
+def run_scenario(name, count_updates=600, count_frames=300, repeats=5):
+    params = dict(DEFAULTS, **SCENARIOS[name])
+    result = {"params": params}
+    # Sous un overlay, Game.update ne fait rien : seul le rendu est mesuré
+    if params["overlay"] is None:
+        result["updates_per_sec"] = bench_updates(params, count_updates, repeats)
+    result["frames_per_sec"] = bench_frames(params, count_frames, repeats)
+    return result
+
+
+def micro_check_collision(count, repeats):
+    """Ball.check_collision sur un champ dense, balle juste sous les briques"""
+    def setup():
+        game = build_game(rows=12)
+        ball = game.ball
+        lowest = max(brick.rect.bottom for brick in game.bricks)
+        ball.rect.top = lowest + 2
+        ball.pos_y = float(ball.rect.y)
+        return game
+
+    def body(game):
+        game.ball.check_collision(game.player, game.bricks, game.brick_grid)
+
+    return measure(setup, body, count, repeats)
+
+
+def micro_brick_draw(count, repeats):
+    """Dessin du champ de briques (BrickFieldRenderer.draw) à chaque phase"""
+    def setup():
+        game = build_game(rows=12)
+        field = game.renderer.brick_field
+        field.draw(game.screen, game.bricks, 0)
+        return [game, field, 0.0]
+
+    def body(state):
+        game, field, animation_time = state
+        state[2] = animation_time + 0.05
+        field.draw(game.screen, game.bricks, state[2])
+
+    return measure(setup, body, count, repeats)
+
+
+MICRO_BENCHMARKS = {
+    "ball.check_collision": micro_check_collision,
+    "brick_field.draw": micro_brick_draw,
+}
+
+
+def run_micro(name, count=10000, repeats=5):
+    return {"ops_per_sec": MICRO_BENCHMARKS[name](count, repeats)}
+
+
+def environment():
+    init_pygame()
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "video_driver": pygame.display.get_driver(),
+    }
@@ -1,41 +1,77 @@
+import time
+# Avant les autres imports : le rapport de démarrage mesure aussi leur durée
+STARTED_AT = time.perf_counter()
+import argparse
 import pygame
 import sys
+from src.autopilot import Autopilot
 from src.game import Game
 from src.menu import MainMenu
-from src.constants import WIDTH, HEIGHT
+from src.leaderboard_screen import LeaderboardScreen
+from src.timestep import FixedTimestep
+from src.profiler import FrameProfiler
+from src.replay import ReplayRecorder
+from src.scenes import SceneManager
+from src.startup import StartupReport, init_pygame, open_window
+from src.constants import SIMULATION_RATE, MAX_RENDER_RATE, SEED_LIMIT
 
 class GameController:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Arkanoid")
+    def __init__(self, record_path=None, seed=None, startup=None, autopilot=False):
+        # Étapes du démarrage jusqu'à la première frame du menu (--startup-report)
+        self.startup = startup
+        init_pygame()
+        self.screen = open_window()
         self.clock = pygame.time.Clock()
+        self.mark_startup("init")
         
-        self.game = None
-        self.menu = MainMenu()
-        self.current_state = "menu"  # "menu" ou "game"
+        # Temps par étape de chaque frame de jeu (F3 : overlay, F4 : export)
+        self.profiler = FrameProfiler()
+        # Menu et jeu sont construits une fois puis réutilisés d'une partie à l'autre
+        self.scenes = SceneManager()
+        self.scenes.register("menu", MainMenu)
+        self.scenes.register("game", self.create_game)
+        self.scenes.register("leaderboard", LeaderboardScreen)
+        self.game = None  # Partie en cours
+        self.leaderboard = None  # Écran PB, construit à la première visite
+        self.menu = self.scenes.enter("menu")
+        self.mark_startup("assets")
+        self.current_state = "menu"  # "menu", "game" ou "leaderboard"
         self.running = True
-        self.frame_rate = 60
+        # Simulation à pas fixe, rendu aussi rapide que la machine le permet
+        self.frame_rate = MAX_RENDER_RATE
+        self.timestep = FixedTimestep(SIMULATION_RATE)
+        # Enregistrement de la partie (--record) et graine imposée (--seed)
+        self.record_path = record_path
+        self.seed = seed
+        # Raquette pilotée (--autopilot) : parties enchaînées sans surveillance
+        self.autopilot = None
+        self.use_autopilot = autopilot
+        if autopilot:
+            self.current_state = "game"
 
     def run(self):
         """Boucle principale du jeu"""
         while self.running:
+            steps = self.timestep.advance()
             if self.current_state == "menu":
-                self.run_menu()
+                self.run_menu(steps)
             elif self.current_state == "game":
-                result = self.run_game()
+                self.profiler.begin_frame()
+                result = self.run_game(steps)
+                self.profiler.end_frame()
                 if result == "menu":
                     self.transition_to_menu()
+            elif self.current_state == "leaderboard":
+                self.run_leaderboard()
 
-            pygame.display.flip()
             self.clock.tick(self.frame_rate)
 
         self.cleanup()
 
-    def run_menu(self):
+    def run_menu(self, steps=1):
         """Gestion du menu principal"""
-        self.menu.update()
+        for _ in range(steps):
+            self.menu.update()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -54,16 +90,65 @@ class GameController:
                 self.running = False
                 return
             elif action == "PB":
-                # TODO: Implémenter l'écran des meilleurs scores
-                pass
+                self.transition_to_leaderboard()
+                return
 
         self.menu.draw(self.screen)
+        pygame.display.flip()
+        if self.startup is not None:
+            self.mark_startup("first_frame")
+            print(self.startup.format(), flush=True)
+            self.startup = None
+        # La scène de jeu est préparée une fois le menu affiché
+        if self.scenes.loaded("game") is None:
+            self.scenes.warm("game")
+
+    def run_leaderboard(self):
+        """Écran PB : pages du classement local"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            if self.leaderboard.handle_event(event) == "MENU":
+                self.transition_to_menu()
+                return
+
+        self.leaderboard.draw(self.screen)
+        pygame.display.flip()
 
-    def run_game(self):
-        """Gestion du jeu"""
+    def mark_startup(self, stage):
+        if self.startup is not None:
+            self.startup.mark(stage)
+
+    def run_game(self, steps=1):
+        """Gestion du jeu : `steps` pas de simulation puis une frame de rendu"""
         if not self.game:
-            self.game = Game()
+            self.new_game()
         
+        with self.profiler.stage("input"):
+            result = self.handle_game_events()
+        if result is not None:
+            return result
+
+        if self.autopilot is not None:
+            # Sans surveillance : niveau suivant après une victoire, nouvelle partie après un game over
+            if self.game.game_over:
+                self.game.reset_game()
+            elif self.game.victory:
+                self.game.start_next_level()
+
+        running = not self.game.paused and not self.game.game_over and not self.game.victory
+        if running:
+            keys = pygame.key.get_pressed()
+            for _ in range(steps):
+                self.game.update(keys if self.autopilot is None else self.autopilot())
+            self.game.renderer.draw(self.timestep.alpha)
+        else:
+            self.game.renderer.draw()
+        return None
+
+    def handle_game_events(self):
+        """Événements clavier / souris pendant la partie"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -80,6 +165,11 @@ class GameController:
                         self.game.reset_game()
                 elif event.key == pygame.K_r and self.game.game_over:
                     self.game.reset_game()
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif event.key == pygame.K_F4:
+                    for path in self.profiler.export():
+                        print(f"Profil exporté : {path}")
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
@@ -91,29 +181,61 @@ class GameController:
                 elif self.game.victory:
                     if self.game.renderer.next_level_button.collidepoint(mouse_pos):
                         self.game.start_next_level()
-
-        if not self.game.paused and not self.game.game_over:
-            self.game.update()
-        
-        self.game.renderer.draw()
         return None
 
+    def create_game(self):
+        """Construit la scène de jeu (une seule fois), instrumentée par le profiler"""
+        game = Game()
+        game.profiler = self.profiler
+        if self.use_autopilot:
+            # Parties du pilote : ni record ni classement du joueur touchés
+            game.close()
+            self.autopilot = Autopilot(game)
+        return game
+
+    def new_game(self):
+        """Démarre une partie sur la scène de jeu gardée, enregistrée si demandé"""
+        self.game = self.scenes.enter("game", seed=self.seed)
+        if self.record_path:
+            self.game.recorder = ReplayRecorder(self.game.seed)
+
+    def close_game(self):
+        """Termine la partie : écrit le replay éventuel (la scène reste prête)"""
+        if self.game.recorder is not None:
+            path = self.game.recorder.save(self.game, self.record_path)
+            print(f"Replay enregistré : {path}")
+            self.game.recorder = None
+        self.game = None
+
     def transition_to_game(self):
         """Transition vers le jeu"""
         self.current_state = "game"
-        self.game = Game()
-        pygame.mixer.music.stop()  # Arrête la musique du menu
+        if self.game:
+            self.close_game()
+        self.new_game()
 
     def transition_to_menu(self):
-        """Transition vers le menu"""
+        """Transition vers le menu (la musique s'arrête en quittant le jeu)"""
         self.current_state = "menu"
         if self.game:
-            pygame.mixer.music.stop()  # Arrête la musique du jeu
-            self.game = None
-        self.menu = MainMenu()
+            self.close_game()
+        self.menu = self.scenes.enter("menu")
+
+    def transition_to_leaderboard(self):
+        """Transition vers l'écran PB"""
+        self.current_state = "leaderboard"
+        self.leaderboard = self.scenes.enter("leaderboard")
 
     def cleanup(self):
         """Nettoyage avant de quitter"""
+        if self.game:
+            self.close_game()  # Écrit le replay
+        game = self.scenes.loaded("game")
+        if game is not None:
+            game.close()  # Écrit le record et les parties en attente
+        leaderboard = self.scenes.loaded("leaderboard")
+        if leaderboard is not None:
+            leaderboard.close()
         pygame.mixer.music.stop()
         pygame.mixer.quit()
         pygame.quit()
@@ -122,8 +244,25 @@ class GameController:
 
 # Point d'entrée principal
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Neon Pulse")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre la partie dans un replay (.nprp)")
+    parser.add_argument("--seed", type=int,
+                        help="graine de la partie (aléatoire par défaut)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="affiche la durée des étapes du démarrage")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="raquette pilotée automatiquement, parties enchaînées sans fin")
+    args = parser.parse_args()
+    if args.seed is not None and not 0 <= args.seed < SEED_LIMIT:
+        parser.error(f"--seed doit être compris entre 0 et {SEED_LIMIT - 1}")
+    startup = None
+    if args.startup_report:
+        startup = StartupReport(STARTED_AT)
+        startup.mark("import")
     try:
-        game_controller = GameController()
+        game_controller = GameController(record_path=args.record, seed=args.seed,
+                                         startup=startup, autopilot=args.autopilot)
         game_controller.run()
     except Exception as e:
         print(f"Une erreur est survenue : {str(e)}")
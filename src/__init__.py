@@ -1,8 +1,31 @@
-from .ball import Ball
-from .bonus_malus import BonusMalus
-from .brick import Brick
-from .game import Game
-from .player import Player
-from .score_display import ScoreDisplay
-from .game_render import GameRenderer
+"""Neon Pulse.
+
+Les constantes sont importées directement (sans pygame) ; les classes du jeu
+ne sont importées qu'au premier accès (PEP 562), pour que ``import src``
+reste rapide et n'initialise rien.
+"""
+from importlib import import_module
 from .constants import *
+
+_LAZY = {
+    "Ball": ".ball",
+    "BonusMalus": ".bonus_malus",
+    "Brick": ".brick",
+    "Game": ".game",
+    "Player": ".player",
+    "ScoreDisplay": ".score_display",
+    "GameRenderer": ".game_render",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,131 @@
+import pygame
+from src.headless import SilentSound
+from src.image_cache import ImageDiskCache
+
+
+class AssetRegistry:
+    """Cache global des sons, polices, images et musiques, chargés une seule fois par clé.
+
+    Les objets retournés sont partagés : ne pas les modifier (copier une image
+    avant de dessiner dessus).
+    """
+
+    def __init__(self):
+        self.sounds = {}
+        self.fonts = {}
+        self.images = {}
+        self.music_files = {}
+        # Images redimensionnées gardées sur disque d'un lancement à l'autre
+        self.image_cache = ImageDiskCache()
+        self.hits = {"sound": 0, "font": 0, "image": 0, "music": 0}
+        self.misses = {"sound": 0, "font": 0, "image": 0, "music": 0}
+
+    def sound(self, path, volume=None):
+        """Son chargé une fois ; muet si le mixer n'est pas initialisé"""
+        sound = self.sounds.get(path)
+        if sound is not None:
+            self.hits["sound"] += 1
+            return sound
+
+        self.misses["sound"] += 1
+        if pygame.mixer.get_init() is None:
+            sound = SilentSound()
+        else:
+            sound = pygame.mixer.Sound(path)
+            if volume is not None:
+                sound.set_volume(volume)
+        self.sounds[path] = sound
+        return sound
+
+    def font(self, name, size):
+        """Police (name=None pour la police par défaut de pygame)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits["font"] += 1
+            return font
+
+        self.misses["font"] += 1
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(name, size)
+        self.fonts[key] = font
+        return font
+
+    def image(self, path, size=None, alpha=False):
+        """Image décodée (et redimensionnée à size), au format de l'écran si possible.
+
+        Avec une taille cible, l'image redimensionnée vient du cache disque
+        quand il la contient (ni décodage ni redimensionnement).
+        """
+        key = (path, size, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits["image"] += 1
+            return image
+
+        self.misses["image"] += 1
+        if size is not None:
+            image = self.image_cache.load(path, size, alpha)
+        else:
+            image = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+        self.images[key] = image
+        return image
+
+    def music(self, path):
+        """Contenu d'un fichier de musique (lu une fois) ; None si le fichier manque"""
+        if path in self.music_files:
+            self.hits["music"] += 1
+            return self.music_files[path]
+
+        self.misses["music"] += 1
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = None
+        self.music_files[path] = data
+        return data
+
+    def memory_usage(self):
+        """Estimation de la mémoire occupée par type d'asset (octets)"""
+        sound_bytes = 0
+        mixer = pygame.mixer.get_init()
+        if mixer is not None:
+            frequency, size, channels = mixer
+            for sound in self.sounds.values():
+                if not isinstance(sound, SilentSound):
+                    sound_bytes += int(sound.get_length() * frequency) * (abs(size) // 8) * channels
+        image_bytes = sum(image.get_bytesize() * image.get_width() * image.get_height()
+                          for image in self.images.values())
+        music_bytes = sum(len(data) for data in self.music_files.values() if data is not None)
+        return {"sound": sound_bytes, "image": image_bytes, "music": music_bytes}
+
+    def stats(self):
+        """Statistiques : nombre d'assets, hits/misses et mémoire par type"""
+        memory = self.memory_usage()
+        stats = {
+            kind: {
+                "count": len(cache),
+                "hits": self.hits[kind],
+                "misses": self.misses[kind],
+                "bytes": memory.get(kind),
+            }
+            for kind, cache in (("sound", self.sounds), ("font", self.fonts), ("image", self.images),
+                                ("music", self.music_files))
+        }
+        stats["image_disk"] = {"hits": self.image_cache.hits, "misses": self.image_cache.misses}
+        return stats
+
+    def clear(self):
+        """Vide les caches (ex: après pygame.quit())"""
+        self.sounds.clear()
+        self.fonts.clear()
+        self.images.clear()
+        self.music_files.clear()
+
+
+# Registre partagé par tout le processus
+assets = AssetRegistry()
@@ -0,0 +1,179 @@
+import math
+import numpy as np
+import pygame
+from src.ball_set import BALL_SIZE, VECTORIZE_FROM
+from src.constants import WIDTH
+from src.headless import KeyState, NO_KEYS
+
+LEFT = KeyState([pygame.K_LEFT])
+RIGHT = KeyState([pygame.K_RIGHT])
+
+# Bonus que le pilote ne va pas chercher
+AVOIDED_BONUSES = {"decrease_paddle"}
+# Rebond sur la raquette (voir Ball.bounce_on_paddle) : vitesse verticale
+# 0.9 * v, vitesse horizontale 0.7 * v * 2 * (impact relatif - 0.5)
+BOUNCE_VERTICAL = 0.9
+BOUNCE_HORIZONTAL = 0.7 * 2
+# Décalage maximal de l'impact par rapport au centre de la raquette (fraction de la largeur)
+AIM_LIMIT = 0.4
+
+# Course horizontale du bord gauche d'une balle entre les deux murs
+SPAN = WIDTH - BALL_SIZE
+
+
+def fold(x):
+    """Abscisse après rebonds sur les murs latéraux (réflexions dans 0..SPAN)"""
+    x %= 2 * SPAN
+    return 2 * SPAN - x if x > SPAN else x
+
+
+def frames_to_land(y, speed_y, top, bottom):
+    """Frames avant que le haut de la balle atteigne bottom (rebond au plafond top compris).
+
+    None si la balle ne descend jamais ou est déjà passée sous bottom.
+    """
+    if speed_y > 0:
+        frames = (bottom - y) / speed_y
+        return frames if frames >= 0 else None
+    if speed_y < 0:
+        return ((y - top) + (bottom - top)) / -speed_y
+    return None
+
+
+class Autopilot:
+    """Pilote automatique de la raquette : remplace le clavier de Player.move.
+
+    Prévoit où chaque balle arrivera à hauteur de la raquette (rebonds sur les
+    murs et le plafond, briques ignorées), va sous la plus pressée en orientant
+    le rebond vers les briques restantes, et attrape au passage les bonus
+    qu'il a le temps de rejoindre. Appelé une fois par frame (Game.step,
+    GameController, soak), il retourne l'état du clavier à appliquer.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        # Cible courante (centre voulu de la raquette), pour le débogage
+        self.target = None
+        # Briques visées : la plus basse de chaque colonne (recalculé quand une brique tombe)
+        self.bricks = None
+        self.bricks_alive = None
+        self.exposed = []
+
+    def __call__(self):
+        return self.keys()
+
+    def keys(self):
+        """État du clavier pour la frame en cours"""
+        game = self.game
+        paddle = game.player.rect
+        speed = game.player.speed
+        top = game.interface_height
+        bottom = paddle.top - BALL_SIZE
+
+        landing = self.next_landing(top, bottom)
+        if landing is None:
+            target = WIDTH / 2
+        else:
+            x, frames, speed = landing
+            ball_center = x + BALL_SIZE / 2
+            target = ball_center - self.aim_offset(ball_center, speed, bottom, paddle.width)
+            bonus_x = self.bonus_target(paddle, speed, target, frames)
+            if bonus_x is not None:
+                target = bonus_x
+        self.target = target
+
+        delta = target - paddle.centerx
+        if delta > speed / 2:
+            return RIGHT
+        if delta < -speed / 2:
+            return LEFT
+        return NO_KEYS
+
+    def next_landing(self, top, bottom):
+        """(bord gauche, frames, vitesse) de la première balle à atteindre la raquette, ou None"""
+        balls = self.game.balls
+        n = len(balls)
+        if n == 0:
+            return None
+        if n >= VECTORIZE_FROM:
+            return self.next_landing_vectorized(balls.pos[:n], balls.vel[:n], top, bottom)
+
+        best = None
+        for (x, y), (speed_x, speed_y) in zip(balls.pos[:n].tolist(), balls.vel[:n].tolist()):
+            frames = frames_to_land(y, speed_y, top, bottom)
+            if frames is not None and (best is None or frames < best[1]):
+                best = (x + speed_x * frames, frames, math.hypot(speed_x, speed_y))
+        if best is None:
+            return None
+        return fold(best[0]), best[1], best[2]
+
+    @staticmethod
+    def next_landing_vectorized(pos, vel, top, bottom):
+        """Même calcul que next_landing, pour toutes les balles à la fois (NumPy)"""
+        y, speed_y = pos[:, 1], vel[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frames = np.where(speed_y > 0, (bottom - y) / speed_y,
+                              ((y - top) + (bottom - top)) / -speed_y)
+        frames[(speed_y == 0) | ~(frames >= 0)] = np.inf
+        index = int(np.argmin(frames))
+        if not np.isfinite(frames[index]):
+            return None
+        speed_x, speed_y = vel[index].tolist()
+        return (fold(float(pos[index, 0] + speed_x * frames[index])), float(frames[index]),
+                math.hypot(speed_x, speed_y))
+
+    def exposed_bricks(self):
+        """(centre x, bas) de la brique active la plus basse de chaque colonne"""
+        bricks = self.game.bricks
+        if bricks is not self.bricks or bricks.alive != self.bricks_alive:
+            lowest = {}
+            n = len(bricks)
+            for index in np.flatnonzero(bricks.active[:n]).tolist():
+                x, y, width, height = bricks.rects[index].tolist()
+                column = int(bricks.column[index])
+                if column not in lowest or y + height > lowest[column][1]:
+                    lowest[column] = (x + width / 2, y + height)
+            self.exposed = list(lowest.values())
+            self.bricks = bricks
+            self.bricks_alive = bricks.alive
+        return self.exposed
+
+    def aim_offset(self, ball_center, speed, bottom, width):
+        """Écart balle - centre de la raquette qui renvoie la balle vers la brique exposée la plus proche.
+
+        Si la raquette ne peut pas se placer (balle contre un mur), vise le
+        reflet de la brique dans ce mur : la balle y rebondit avant de monter.
+        """
+        exposed = self.exposed_bricks()
+        if not exposed or speed == 0:
+            return 0.0
+        goal_x, goal_y = min(exposed, key=lambda brick: abs(brick[0] - ball_center))
+        frames_up = max(bottom - goal_y, 1) / (speed * BOUNCE_VERTICAL)
+        offset = self.offset_towards(goal_x, ball_center, speed, frames_up, width)
+        paddle_center = ball_center - offset
+        if paddle_center > WIDTH - width / 2:
+            offset = self.offset_towards(2 * (WIDTH - BALL_SIZE / 2) - goal_x, ball_center, speed, frames_up, width)
+        elif paddle_center < width / 2:
+            offset = self.offset_towards(BALL_SIZE - goal_x, ball_center, speed, frames_up, width)
+        return offset
+
+    @staticmethod
+    def offset_towards(goal_x, ball_center, speed, frames_up, width):
+        shift = (goal_x - ball_center) / frames_up / (speed * BOUNCE_HORIZONTAL)
+        return max(-AIM_LIMIT, min(AIM_LIMIT, shift)) * width
+
+    def bonus_target(self, paddle, speed, ball_target, ball_frames):
+        """Centre d'un bonus attrapable sans manquer la balle, ou None"""
+        best = None
+        for bonus in self.game.bonus_malus_list:
+            if bonus.type in AVOIDED_BONUSES:
+                continue
+            frames = (paddle.top - bonus.rect.bottom) / bonus.speed_y
+            if frames < 0:
+                continue
+            x = bonus.rect.centerx
+            reach = abs(x - paddle.centerx) / speed
+            back = abs(ball_target - x) / speed
+            if reach <= frames and frames + back < ball_frames and (best is None or frames < best[0]):
+                best = (frames, x)
+        return None if best is None else best[1]
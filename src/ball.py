@@ -1,16 +1,37 @@
 import pygame
 import random
 import math
+from collections import deque
 from src.constants import WIDTH, HEIGHT, SOUND_PADDLE, SOUND_BRICK, SOUND_WALL
 from src.bonus_malus import BonusMalus
+from src.headless import SilentSound
+from src.assets import assets
+from src.ball_sprites import ball_sprites, TRAIL_LENGTH
+from src.ball_set import BallSet, BALL_SIZE
+
+SILENT_SOUND = SilentSound()
 
 class Ball:
-    def __init__(self, interface_height):
-        self.BASE_SPEED = 5
-        self.MIN_SPEED = 4
-        self.MAX_SPEED = 15
+    """Balle du jeu : vue sur une ligne d'un BallSet.
+
+    Position, vitesse et temps d'animation sont stockés dans les tableaux du
+    BallSet, qui déplace toutes les balles en une fois (BallSet.step).
+    """
+
+    BASE_SPEED = 5
+
+    def __init__(self, interface_height, silent=False, particles=None, bonus_pool=None,
+                 rng=random, ball_set=None):
         self.interface_height = interface_height
+        # Générateur aléatoire de la partie (service et tirage des bonus)
+        self.rng = rng
+        
+        # Stockage partagé (une balle isolée a son propre BallSet)
+        self.set = BallSet(capacity=1) if ball_set is None else ball_set
+        self.index = self.set.add(self)
         
+        self.rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+        self.previous_rect = self.rect.copy()
         self.initial_position()
         
         # Couleurs néon
@@ -19,56 +40,103 @@ class Ball:
         self.trail_color = (255, 20, 147)  # Rose foncé pour la traînée
         self.radius = 8
         
-        # Variables d'animation
-        self.animation_time = 0
-        self.pulse_speed = 0.1
+        # Système de particules pour les impacts et pool de bonus (optionnels)
+        self.particles = particles
+        self.bonus_pool = bonus_pool
         
-        # Sons
-        self.paddle_sound = pygame.mixer.Sound(SOUND_PADDLE)
-        self.brick_sound = pygame.mixer.Sound(SOUND_BRICK)
-        self.wall_sound = pygame.mixer.Sound(SOUND_WALL)
-        self.paddle_sound.set_volume(0.3)
-        self.brick_sound.set_volume(0.1)
-        self.wall_sound.set_volume(0.09)
+        # Sons partagés par toutes les balles (muets en mode headless)
+        if silent:
+            self.paddle_sound = self.brick_sound = self.wall_sound = SILENT_SOUND
+        else:
+            self.paddle_sound = assets.sound(SOUND_PADDLE, volume=0.3)
+            self.brick_sound = assets.sound(SOUND_BRICK, volume=0.1)
+            self.wall_sound = assets.sound(SOUND_WALL, volume=0.09)
+
+    @property
+    def pos_x(self):
+        return float(self.set.pos[self.index, 0])
+
+    @pos_x.setter
+    def pos_x(self, value):
+        self.set.pos[self.index, 0] = value
+
+    @property
+    def pos_y(self):
+        return float(self.set.pos[self.index, 1])
+
+    @pos_y.setter
+    def pos_y(self, value):
+        self.set.pos[self.index, 1] = value
+
+    @property
+    def speed_x(self):
+        return float(self.set.vel[self.index, 0])
+
+    @speed_x.setter
+    def speed_x(self, value):
+        self.set.vel[self.index, 0] = value
+
+    @property
+    def speed_y(self):
+        return float(self.set.vel[self.index, 1])
+
+    @speed_y.setter
+    def speed_y(self, value):
+        self.set.vel[self.index, 1] = value
+
+    @property
+    def animation_time(self):
+        return float(self.set.animation_time[self.index])
+
+    def set_position(self, x, y):
+        """Place la balle en (x, y) sans traînée ni interpolation depuis l'ancienne position"""
+        self.rect.topleft = (x, y)
+        self.previous_rect = self.rect.copy()
+        self.pos_x, self.pos_y = float(x), float(y)
+        # Centres des derniers pas de simulation (pour la traînée)
+        self.position_history = deque([self.rect.center], maxlen=TRAIL_LENGTH)
+
+    def reset(self, rng=None):
+        """Remet la balle en jeu au point de départ (après BallSet.clear)"""
+        if rng is not None:
+            self.rng = rng
+        if self.index is None:
+            self.index = self.set.add(self)
+        self.initial_position()
 
     def initial_position(self):
         """Positionne la balle au centre de l'écran"""
-        self.rect = pygame.Rect(WIDTH // 2 - 10, self.interface_height + 100, 20, 20)
+        self.set_position(WIDTH // 2 - 10, self.interface_height + 100)
         self.speed_x = self.BASE_SPEED
         self.speed_y = -self.BASE_SPEED
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.speed_x *= -1
 
-    def check_collision(self, player, bricks):
-        """Vérifie les collisions"""
+    def check_collision(self, player, bricks, grid=None):
+        """Résout les recouvrements déjà présents (ex: raquette déplacée sur la balle)
+
+        grid : BrickGrid optionnelle pour limiter les tests aux cellules traversées.
+        """
         points = 0
         bonus_malus = None
+        start = self.rect.topleft
         
         # Collision avec la raquette
-        if self.rect.colliderect(player.rect):
-            # Calcul de l'angle de rebond basé sur le point d'impact
-            relative_x = (self.rect.centerx - player.rect.left) / player.rect.width
-            angle = relative_x * 60 - 30  # Angle entre -30 et +30 degrés
-            
-            # Ajustement de la vitesse
-            current_speed = (self.speed_x ** 2 + self.speed_y ** 2) ** 0.5
-            self.speed_y = -abs(current_speed * 0.9)
-            self.speed_x = current_speed * 0.7 * (relative_x - 0.5) * 2
-            
+        if player is not None and self.rect.colliderect(player.rect):
+            self.bounce_on_paddle(player)
             self.rect.bottom = player.rect.top
-            self.paddle_sound.play()
 
-            # Effet de particules lors de la collision
-            self.create_collision_particles()
-
-        # Collisions avec les briques
+        # Collisions avec les briques (seulement celles des cellules traversées)
+        if grid is not None:
+            bricks = grid.query(self.previous_rect.union(self.rect))
         for brick in bricks:
-            if brick.active and self.rect.colliderect(brick.rect):
+            brick_rect = brick.rect
+            if self.rect.colliderect(brick_rect) and brick.active:
                 # Détermine de quel côté la collision s'est produite
-                overlap_left = self.rect.right - brick.rect.left
-                overlap_right = brick.rect.right - self.rect.left
-                overlap_top = self.rect.bottom - brick.rect.top
-                overlap_bottom = brick.rect.bottom - self.rect.top
+                overlap_left = self.rect.right - brick_rect.left
+                overlap_right = brick_rect.right - self.rect.left
+                overlap_top = self.rect.bottom - brick_rect.top
+                overlap_bottom = brick_rect.bottom - self.rect.top
 
                 # Trouve la plus petite superposition
                 min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
@@ -78,115 +146,113 @@ class Ball:
                     self.speed_x *= -1
                     # Ajuste la position pour éviter les collisions multiples
                     if min_overlap == overlap_left:
-                        self.rect.right = brick.rect.left
+                        self.rect.right = brick_rect.left
                     else:
-                        self.rect.left = brick.rect.right
+                        self.rect.left = brick_rect.right
                 else:
                     self.speed_y *= -1
                     # Ajuste la position pour éviter les collisions multiples
                     if min_overlap == overlap_top:
-                        self.rect.bottom = brick.rect.top
+                        self.rect.bottom = brick_rect.top
                     else:
-                        self.rect.top = brick.rect.bottom
-
-                brick.start_flash()
-                points += brick.points
-                self.brick_sound.play()
-                
-                if random.random() < 0.15:  # 15% de chance de bonus
-                    bonus_malus = BonusMalus(brick.rect.centerx, brick.rect.bottom)
+                        self.rect.top = brick_rect.bottom
+
+                points, bonus_malus = self.hit_brick(brick, grid)
                 break
 
+        if self.rect.topleft != start:
+            self.pos_x, self.pos_y = float(self.rect.x), float(self.rect.y)
         return points, bonus_malus
 
-    def create_collision_particles(self):
-        """Crée des particules lors des collisions (à implémenter si désiré)"""
-        pass  # Cette méthode peut être développée pour ajouter des effets de particules
-
-    def move(self):
-        """Déplace la balle"""
-        # Animation du temps
-        self.animation_time += self.pulse_speed
+    def bounce_on_paddle(self, player):
+        """Rebond sur la raquette, l'angle dépend du point d'impact"""
+        relative_x = (self.rect.centerx - player.rect.left) / player.rect.width
         
-        # Déplacement
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # Collisions avec les murs
-        if self.rect.left <= 0:
-            self.rect.left = 0
-            self.speed_x = abs(self.speed_x)
-            self.wall_sound.play()
-        elif self.rect.right >= WIDTH:
-            self.rect.right = WIDTH
-            self.speed_x = -abs(self.speed_x)
-            self.wall_sound.play()
-
-        if self.rect.top <= self.interface_height:
-            self.rect.top = self.interface_height
-            self.speed_y = abs(self.speed_y)
-            self.wall_sound.play()
-
-        # Limite de vitesse
+        # Ajustement de la vitesse
         current_speed = (self.speed_x ** 2 + self.speed_y ** 2) ** 0.5
-        if current_speed > self.MAX_SPEED:
-            factor = self.MAX_SPEED / current_speed
-            self.speed_x *= factor
-            self.speed_y *= factor
-        elif current_speed < self.MIN_SPEED:
-            factor = self.MIN_SPEED / current_speed
-            self.speed_x *= factor
-            self.speed_y *= factor
+        self.speed_y = -abs(current_speed * 0.9)
+        self.speed_x = current_speed * 0.7 * (relative_x - 0.5) * 2
+        
+        self.paddle_sound.play()
+
+        # Effet de particules lors de la collision
+        self.create_collision_particles()
+
+    def hit_brick(self, brick, grid=None):
+        """Détruit la brique touchée ; retourne (points, bonus éventuel)"""
+        rect = brick.rect
+        brick.start_flash()
+        if grid is not None:
+            grid.remove(brick)
+        self.brick_sound.play()
+        
+        # Éclats de la brique
+        if self.particles is not None:
+            self.particles.emit_burst(rect.centerx, rect.centery, 24,
+                                      brick.base_color, spread=rect.size)
+        
+        bonus_malus = None
+        if self.rng.random() < 0.15:  # 15% de chance de bonus
+            if self.bonus_pool is not None:
+                bonus_malus = self.bonus_pool.acquire(rect.centerx, rect.bottom,
+                                                      self.rng)
+            else:
+                bonus_malus = BonusMalus(rect.centerx, rect.bottom, self.rng)
+        return brick.points, bonus_malus
+
+    def create_collision_particles(self):
+        """Crée des étincelles au point d'impact sur la raquette"""
+        if self.particles is not None:
+            self.particles.emit(self.rect.centerx, self.rect.bottom, 12, self.glow_color,
+                                vel_x=(-120, 120), vel_y=(-160, -60), lifetime=(0.2, 0.5),
+                                gravity=300)
 
     def is_out(self):
         """Vérifie si la balle est sortie de l'écran"""
         return self.rect.top >= HEIGHT
 
+    def get_trail_positions(self):
+        """Points de la traînée, espacés d'un demi-pas, tirés de l'historique"""
+        cx, cy = self.rect.center
+        history = self.position_history
+        positions = [(cx, cy)]
+        for i in range(1, TRAIL_LENGTH):
+            # Position i/2 pas en arrière, interpolée dans l'historique
+            back = i * 0.5
+            index = min(int(back), len(history) - 1)
+            frac = back - index if index + 1 < len(history) else 0
+            newest_x, newest_y = history[-1]
+            ax, ay = history[-1 - index]
+            if frac:
+                bx, by = history[-2 - index]
+                ax += (bx - ax) * frac
+                ay += (by - ay) * frac
+            positions.append((cx - int(newest_x - ax), cy - int(newest_y - ay)))
+        return positions
+
+    def get_dirty_rect(self):
+        """Zone de l'écran touchée par draw() (lueur et traînée comprises)"""
+        glow_size = int(self.radius * 3)
+        dirty = pygame.Rect(0, 0, glow_size * 2, glow_size * 2)
+        dirty.center = self.rect.center
+        trail_radius = self.radius + 6
+        for x, y in self.get_trail_positions()[1:]:
+            dirty.union_ip(pygame.Rect(x - trail_radius, y - trail_radius,
+                                       trail_radius * 2, trail_radius * 2))
+        return dirty
+
     def draw(self, screen):
-        """Dessine la balle avec effet néon"""
+        """Dessine la balle avec effet néon à partir des sprites pré-rendus"""
         # Calcul de la pulsation pour l'effet de brillance
         pulse = abs(math.sin(self.animation_time)) * 0.3 + 0.7
+        trails, core = ball_sprites.get(self.radius, self.core_color, self.glow_color,
+                                        self.trail_color, ball_sprites.quantize(pulse))
         
-        # Effet de traînée luminescente
-        for i in range(3):
-            trail_pos = (
-                self.rect.centerx - int(self.speed_x * i * 0.5),
-                self.rect.centery - int(self.speed_y * i * 0.5)
-            )
-            # Lueur externe
-            glow_radius = self.radius + (3 - i) * 2
-            glow_alpha = int((100 - i * 30) * pulse)
-            glow = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (*self.glow_color, glow_alpha), 
-                             (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow, (trail_pos[0] - glow_radius, trail_pos[1] - glow_radius))
-            
-            # Traînée principale
-            trail_alpha = int((150 - i * 50) * pulse)
-            trail = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail, (*self.trail_color, trail_alpha),
-                             (self.radius, self.radius), self.radius - i)
-            screen.blit(trail, (trail_pos[0] - self.radius, trail_pos[1] - self.radius))
-        
-        # Effet de lueur principal
-        glow_size = int(self.radius * 3)
-        glow = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        
-        # Multiple cercles pour créer l'effet de lueur
-        for i in range(3):
-            alpha = int((60 - i * 20) * pulse)
-            pygame.draw.circle(glow, (*self.core_color, alpha),
-                             (glow_size, glow_size),
-                             self.radius + i * 2)
-        
-        screen.blit(glow, (self.rect.centerx - glow_size,
-                          self.rect.centery - glow_size))
-        
-        # Noyau brillant
-        pygame.draw.circle(screen, self.core_color, self.rect.center, self.radius)
-        
-        # Point central plus brillant
-        bright_center = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(bright_center, (255, 255, 255, int(200 * pulse)),
-                          (2, 2), 2)
-        screen.blit(bright_center, (self.rect.centerx - 2, self.rect.centery - 2))
\ No newline at end of file
+        # Effet de traînée luminescente puis lueur principale et noyau
+        blits = []
+        for sprite, (x, y) in zip(trails, self.get_trail_positions()):
+            half = sprite.get_width() // 2
+            blits.append((sprite, (x - half, y - half)))
+        half = core.get_width() // 2
+        blits.append((core, (self.rect.centerx - half, self.rect.centery - half)))
+        screen.blits(blits, doreturn=False)
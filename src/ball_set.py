@@ -0,0 +1,558 @@
+import math
+import numpy as np
+import pygame
+from src.constants import WIDTH, HEIGHT
+
+# Taille de la boîte de collision d'une balle (carré)
+BALL_SIZE = 20
+MIN_SPEED = 4
+MAX_SPEED = 15
+# Nombre maximal d'impacts résolus par frame et par balle
+MAX_COLLISION_ITERATIONS = 4
+# Avance de l'animation de pulsation par frame
+PULSE_SPEED = 0.1
+# Au-delà de ce nombre de balles, le calcul par lots NumPy devient plus rapide
+# que la boucle Python balle par balle
+VECTORIZE_FROM = 8
+# Au-delà de ce nombre de paires balle x brique, les candidats sont cherchés
+# dans les cellules de la BrickGrid plutôt que dans la matrice complète (le
+# coût de la grille ne dépend pas du nombre de briques, mais il est plus élevé
+# au départ)
+GRID_PAIRS_FROM = 40000
+
+# Types d'obstacle touché pendant un pas de déplacement
+NOTHING, WALL, PADDLE, BRICK = 0, 1, 2, 3
+
+
+def sweep_rect(x, y, dx, dy, target):
+    """Swept AABB d'une balle : premier instant t (0..1) où elle touche target.
+
+    Retourne (t, normale_x, normale_y) ou None. Les recouvrements déjà
+    présents sont laissés à check_collision.
+    """
+    w = h = BALL_SIZE
+    
+    if dx > 0:
+        tx_entry = (target.left - (x + w)) / dx
+        tx_exit = (target.right - x) / dx
+    elif dx < 0:
+        tx_entry = (target.right - x) / dx
+        tx_exit = (target.left - (x + w)) / dx
+    elif x + w <= target.left or x >= target.right:
+        return None
+    else:
+        tx_entry, tx_exit = -math.inf, math.inf
+    
+    if dy > 0:
+        ty_entry = (target.top - (y + h)) / dy
+        ty_exit = (target.bottom - y) / dy
+    elif dy < 0:
+        ty_entry = (target.bottom - y) / dy
+        ty_exit = (target.top - (y + h)) / dy
+    elif y + h <= target.top or y >= target.bottom:
+        return None
+    else:
+        ty_entry, ty_exit = -math.inf, math.inf
+    
+    entry = max(tx_entry, ty_entry)
+    if entry > min(tx_exit, ty_exit) or entry < 0 or entry > 1:
+        return None
+    if tx_entry > ty_entry:
+        return entry, (-1 if dx > 0 else 1), 0
+    return entry, 0, (-1 if dy > 0 else 1)
+
+
+def sweep_walls(x, y, dx, dy, interface_height):
+    """Premier mur touché pendant le déplacement : (t, normale_x, normale_y) ou None"""
+    best = None
+    if dx < 0:
+        best = (max(-x / dx, 0), 1, 0)
+    elif dx > 0:
+        best = (max((WIDTH - BALL_SIZE - x) / dx, 0), -1, 0)
+    if dy < 0:
+        t = max((interface_height - y) / dy, 0)
+        if best is None or t < best[0]:
+            best = (t, 0, 1)
+    if best is not None and best[0] > 1:
+        return None
+    return best
+
+
+def sweep_entry(x, y, dx, dy, left, top, right, bottom):
+    """Swept AABB vectorisé : instant d'entrée (0..1) de chaque balle dans chaque rect.
+
+    Les arguments sont diffusés (broadcast) : colonnes (k, 1) des balles et
+    lignes (m,) des obstacles, ou paires déjà alignées. Retourne (entry,
+    x_axis) : entry vaut inf s'il n'y a pas de contact pendant le pas, x_axis
+    indique un choc sur une face verticale. Les recouvrements déjà présents
+    sont laissés à check_collision.
+    """
+    w = h = BALL_SIZE
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tx_entry = np.where(dx > 0, (left - (x + w)) / dx,
+                            np.where(dx < 0, (right - x) / dx, -np.inf))
+        tx_exit = np.where(dx > 0, (right - x) / dx,
+                           np.where(dx < 0, (left - (x + w)) / dx, np.inf))
+        ty_entry = np.where(dy > 0, (top - (y + h)) / dy,
+                            np.where(dy < 0, (bottom - y) / dy, -np.inf))
+        ty_exit = np.where(dy > 0, (bottom - y) / dy,
+                           np.where(dy < 0, (top - (y + h)) / dy, np.inf))
+    separated = (((dx == 0) & ((x + w <= left) | (x >= right)))
+                 | ((dy == 0) & ((y + h <= top) | (y >= bottom))))
+    entry = np.maximum(tx_entry, ty_entry)
+    valid = (~separated & (entry <= np.minimum(tx_exit, ty_exit))
+             & (entry >= 0) & (entry <= 1))
+    return np.where(valid, entry, np.inf), tx_entry > ty_entry
+
+
+class BallSet:
+    """Balles du jeu stockées dans des tableaux NumPy (positions, vitesses).
+
+    Les objets Ball ne sont que des vues sur une ligne des tableaux. step()
+    déplace toutes les balles à la fois : murs, raquette et briques sont
+    testés par lots, seuls les impacts (sons, particules, bonus) passent par
+    du code Python balle par balle.
+    """
+
+    def __init__(self, capacity=16):
+        self.capacity = capacity
+        self.count = 0
+        self.views = []
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.animation_time = np.zeros(capacity)
+
+        # Colonnes du BrickStore du niveau (reprises quand le niveau change)
+        self.bricks = None
+        self.brick_bounds = np.zeros((4, 0))
+        self.brick_active = np.zeros(0, dtype=bool)
+        self.field_rect = (0, 0, 0, 0)
+        # Cellules de la BrickGrid du niveau : indices de briques, -1 en bouche-trou
+        self.grid = None
+        self.cell_bricks = None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __getitem__(self, index):
+        return self.views[index]
+
+    def add(self, ball):
+        """Réserve une ligne pour la balle ; retourne son index"""
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name in ("pos", "vel", "animation_time"):
+                array = getattr(self, name)
+                grown = np.zeros((self.capacity, *array.shape[1:]))
+                grown[:self.count] = array[:self.count]
+                setattr(self, name, grown)
+        index = self.count
+        self.pos[index] = 0
+        self.vel[index] = 0
+        self.animation_time[index] = 0
+        self.views.append(ball)
+        self.count += 1
+        return index
+
+    def clear(self):
+        for ball in self.views:
+            ball.index = None
+        self.views = []
+        self.count = 0
+
+    def remove_out(self):
+        """Retire les balles sorties par le bas ; retourne leur nombre"""
+        n = self.count
+        if n < VECTORIZE_FROM:
+            # Peu de balles : les rects des vues, synchronisés par step(), suffisent
+            if all(ball.rect.top < HEIGHT for ball in self.views):
+                return 0
+        out = self.pos[:n, 1].round() >= HEIGHT
+        if not out.any():
+            return 0
+        keep = np.flatnonzero(~out)
+        for array in (self.pos, self.vel, self.animation_time):
+            array[:len(keep)] = array[keep]
+        for index in np.flatnonzero(out).tolist():
+            self.views[index].index = None
+        self.views = [self.views[index] for index in keep.tolist()]
+        for index, ball in enumerate(self.views):
+            ball.index = index
+        self.count = len(keep)
+        return n - self.count
+
+    def sync_bricks(self, bricks):
+        """Colonnes du BrickStore du niveau (état actif partagé, sans copie)"""
+        if bricks is self.bricks and len(bricks) == len(self.brick_active):
+            return
+        self.bricks = bricks
+        self.brick_bounds = bricks.bounds()
+        self.brick_active = bricks.active[:len(bricks)]
+        if len(bricks):
+            left, top, right, bottom = self.brick_bounds
+            self.field_rect = (left.min(), top.min(), right.max(), bottom.max())
+
+    def sync_grid(self, grid):
+        """Copie NumPy des cellules de la BrickGrid (une fois par niveau).
+
+        La grille ne fait que perdre des briques pendant un niveau : les
+        briques détruites depuis la copie sont écartées par brick_active.
+        """
+        if grid is self.grid:
+            return
+        self.grid = grid
+        if grid is None or not grid.cells:
+            self.cell_bricks = None
+            return
+        depth = max(1, max(len(cell) for cell in grid.cells))
+        self.cell_bricks = np.full((len(grid.cells), depth), -1)
+        for cell, indices in enumerate(grid.cells):
+            self.cell_bricks[cell, :len(indices)] = indices
+
+    def brick_candidates(self, x0, y0, x1, y1):
+        """Paires (balle, brique active) dont les boîtes [x0, x1] x [y0, y1] touchent la brique.
+
+        Au-delà de GRID_PAIRS_FROM paires, seules les briques des cellules de
+        la BrickGrid couvertes par chaque boîte sont testées ; sinon (ou sans
+        grille), toutes les briques le sont.
+        """
+        left, top, right, bottom = self.brick_bounds
+        if self.cell_bricks is None or x0.size * len(right) < GRID_PAIRS_FROM:
+            candidates = ((x0[:, None] <= right) & (x1[:, None] >= left)
+                          & (y0[:, None] <= bottom) & (y1[:, None] >= top) & self.brick_active)
+            return np.nonzero(candidates)
+
+        # Cellules couvertes (un pixel de marge : une brique juste touchée compte)
+        grid = self.grid
+        bounds = grid.bounds
+        first_column = np.clip((np.floor(x0) - 1 - bounds.left) // grid.cell_width, 0, grid.columns - 1)
+        last_column = np.clip((np.ceil(x1) - bounds.left) // grid.cell_width, 0, grid.columns - 1)
+        first_row = np.clip((np.floor(y0) - 1 - bounds.top) // grid.cell_height, 0, grid.rows - 1)
+        last_row = np.clip((np.ceil(y1) - bounds.top) // grid.cell_height, 0, grid.rows - 1)
+        columns = (first_column[:, None, None]
+                   + np.arange(int((last_column - first_column).max()) + 1)[None, None, :])
+        rows = (first_row[:, None, None]
+                + np.arange(int((last_row - first_row).max()) + 1)[None, :, None])
+        inside = (columns <= last_column[:, None, None]) & (rows <= last_row[:, None, None])
+        cells = np.where(inside, rows * grid.columns + columns, 0).astype(int)
+        bricks = np.where(inside[..., None], self.cell_bricks[cells], -1)
+        balls = np.broadcast_to(np.arange(x0.size)[:, None, None, None], bricks.shape)
+        # Une brique sur deux cellules peut sortir deux fois : sans effet sur le résultat
+        listed = bricks >= 0
+        balls, bricks = balls[listed], bricks[listed]
+
+        touching = (self.brick_active[bricks] & (x0[balls] <= right[bricks])
+                    & (x1[balls] >= left[bricks]) & (y0[balls] <= bottom[bricks])
+                    & (y1[balls] >= top[bricks]))
+        return balls[touching], bricks[touching]
+
+    def near_field(self, x, y, dx, dy):
+        """Masque des balles dont le déplacement peut toucher le champ de briques"""
+        left, top, right, bottom = self.field_rect
+        return ((np.minimum(x, x + dx) <= right) & (np.maximum(x, x + dx) + BALL_SIZE >= left)
+                & (np.minimum(y, y + dy) <= bottom) & (np.maximum(y, y + dy) + BALL_SIZE >= top))
+
+    def sweep_bricks(self, x, y, dx, dy):
+        """Première brique touchée par chaque balle pendant le pas.
+
+        Retourne (instant, indice de la brique, choc sur une face verticale) ;
+        l'instant vaut inf sans contact. Seules les paires candidates
+        (brick_candidates) passent par le swept AABB.
+        """
+        x0, x1 = np.minimum(x, x + dx), np.maximum(x, x + dx) + BALL_SIZE
+        y0, y1 = np.minimum(y, y + dy), np.maximum(y, y + dy) + BALL_SIZE
+        balls, bricks = self.brick_candidates(x0, y0, x1, y1)
+        brick_t = np.full(x.size, np.inf)
+        first = np.zeros(x.size, dtype=int)
+        axis = np.zeros(x.size, dtype=bool)
+        if balls.size:
+            left, top, right, bottom = self.brick_bounds
+            entry, x_axis = sweep_entry(x[balls], y[balls], dx[balls], dy[balls],
+                                        left[bricks], top[bricks], right[bricks], bottom[bricks])
+            # Par balle : le plus petit instant, puis le plus petit indice de brique
+            order = np.lexsort((bricks, entry, balls))
+            leading = np.ones(order.size, dtype=bool)
+            leading[1:] = balls[order[1:]] != balls[order[:-1]]
+            best = order[leading]
+            brick_t[balls[best]] = entry[best]
+            first[balls[best]] = bricks[best]
+            axis[balls[best]] = x_axis[best]
+        return brick_t, first, axis
+
+    def resolve_overlaps(self, player, bricks, grid):
+        """Recouvrements présents avant le déplacement (rares) : traités balle par balle"""
+        n = self.count
+        x = np.round(self.pos[:n, 0])
+        y = np.round(self.pos[:n, 1])
+        overlapping = np.zeros(n, dtype=bool)
+        if player is not None:
+            paddle = player.rect
+            overlapping |= ((x < paddle.right) & (x + BALL_SIZE > paddle.left)
+                            & (y < paddle.bottom) & (y + BALL_SIZE > paddle.top))
+        if self.brick_active.any():
+            left, top, right, bottom = self.brick_bounds
+            balls, bricks = self.brick_candidates(x, y, x + BALL_SIZE, y + BALL_SIZE)
+            inside = ((x[balls] < right[bricks]) & (x[balls] + BALL_SIZE > left[bricks])
+                      & (y[balls] < bottom[bricks]) & (y[balls] + BALL_SIZE > top[bricks]))
+            overlapping[balls[inside]] = True
+
+        points, bonuses = 0, []
+        if overlapping.any():
+            for index in np.flatnonzero(overlapping).tolist():
+                ball_points, bonus = self.views[index].check_collision(player, bricks, grid)
+                points += ball_points
+                if bonus is not None:
+                    bonuses.append(bonus)
+        return points, bonuses
+
+    def step(self, player, bricks, grid=None):
+        """Déplace toutes les balles d'une frame avec collisions continues.
+
+        Retourne (points gagnés, liste des bonus lâchés).
+        """
+        n = self.count
+        if n == 0:
+            return 0, []
+        self.sync_bricks(bricks)
+        self.sync_grid(grid)
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        self.animation_time[:n] += PULSE_SPEED
+        start = [ball.rect.topleft for ball in self.views]
+
+        if n < VECTORIZE_FROM:
+            points, bonuses = 0, []
+            for index in range(n):
+                ball_points, ball_bonuses = self.step_ball(index, player, bricks, grid)
+                points += ball_points
+                bonuses.extend(ball_bonuses)
+            self.sync_views(start)
+            return points, bonuses
+
+        points, bonuses = self.resolve_overlaps(player, bricks, grid)
+
+        remaining = np.ones(n)
+        moving = np.ones(n, dtype=bool)
+        interface_height = self.views[0].interface_height
+        for _ in range(MAX_COLLISION_ITERATIONS):
+            idx = np.flatnonzero(moving)
+            if idx.size == 0:
+                break
+            x, y = pos[idx, 0], pos[idx, 1]
+            dx = vel[idx, 0] * remaining[idx]
+            dy = vel[idx, 1] * remaining[idx]
+
+            # Murs (gauche, droit, haut)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.where(dx < 0, np.maximum(-x / dx, 0),
+                             np.where(dx > 0, np.maximum((WIDTH - BALL_SIZE - x) / dx, 0),
+                                      np.inf))
+                t_top = np.where(dy < 0, np.maximum((interface_height - y) / dy, 0), np.inf)
+            normal_x = np.where(dx < 0, 1, -1)
+            normal_y = np.zeros(idx.size, dtype=int)
+            top_first = t_top < t
+            t = np.where(top_first, t_top, t)
+            normal_x = np.where(top_first, 0, normal_x)
+            normal_y = np.where(top_first, 1, normal_y)
+            t = np.where(t <= 1, t, np.inf)
+            kind = np.where(np.isfinite(t), WALL, NOTHING)
+            target = np.full(idx.size, -1)
+
+            # Raquette (seulement en descendant)
+            if player is not None:
+                paddle = player.rect
+                entry, x_axis = sweep_entry(x[:, None], y[:, None], dx[:, None], dy[:, None],
+                                            paddle.left, paddle.top, paddle.right, paddle.bottom)
+                entry = np.where(dy > 0, entry[:, 0], np.inf)
+                better = entry < t
+                t = np.where(better, entry, t)
+                kind = np.where(better, PADDLE, kind)
+                axis = x_axis[:, 0]
+                normal_x = np.where(better, np.where(axis, np.where(dx > 0, -1, 1), 0), normal_x)
+                normal_y = np.where(better, np.where(axis, 0, np.where(dy > 0, -1, 1)), normal_y)
+
+            # Briques, pour les balles proches du champ seulement
+            if self.brick_active.any():
+                near = np.flatnonzero(self.near_field(x, y, dx, dy))
+                if near.size:
+                    brick_t, first, axis = self.sweep_bricks(x[near], y[near], dx[near], dy[near])
+                    better = brick_t < t[near]
+                    hit = near[better]
+                    axis = axis[better]
+                    t[hit] = brick_t[better]
+                    kind[hit] = BRICK
+                    target[hit] = first[better]
+                    normal_x[hit] = np.where(axis, np.where(dx[hit] > 0, -1, 1), 0)
+                    normal_y[hit] = np.where(axis, 0, np.where(dy[hit] > 0, -1, 1))
+
+            # Balles sans obstacle : déplacement complet
+            free = kind == NOTHING
+            pos[idx[free], 0] += dx[free]
+            pos[idx[free], 1] += dy[free]
+            moving[idx[free]] = False
+
+            hit = ~free
+            if not hit.any():
+                break
+            balls = idx[hit]
+            t_hit = t[hit]
+            pos[balls, 0] += dx[hit] * t_hit
+            pos[balls, 1] += dy[hit] * t_hit
+            remaining[balls] *= 1 - t_hit
+            kind, target = kind[hit], target[hit]
+            normal_x, normal_y = normal_x[hit], normal_y[hit]
+
+            points_gained, new_bonuses = self.respond(balls, kind, target, normal_x, normal_y,
+                                                      player, grid)
+            points += points_gained
+            bonuses.extend(new_bonuses)
+
+        # Limite de vitesse
+        speed = np.sqrt(vel[:, 0] ** 2 + vel[:, 1] ** 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(speed > MAX_SPEED, MAX_SPEED / speed,
+                              np.where(speed < MIN_SPEED, MIN_SPEED / speed, 1.0))
+        vel *= factor[:, None]
+
+        self.sync_views(start)
+        return points, bonuses
+
+    def step_ball(self, index, player, bricks, grid):
+        """Même déplacement que step(), pour une seule balle en Python pur"""
+        ball = self.views[index]
+        points, bonus = ball.check_collision(player, bricks, grid)
+        bonuses = [] if bonus is None else [bonus]
+        x, y = self.pos[index].tolist()
+        speed_x, speed_y = self.vel[index].tolist()
+        
+        remaining = 1.0
+        for _ in range(MAX_COLLISION_ITERATIONS):
+            dx = speed_x * remaining
+            dy = speed_y * remaining
+            
+            hit = sweep_walls(x, y, dx, dy, ball.interface_height)
+            target = None
+            if player is not None and dy > 0:
+                paddle_hit = sweep_rect(x, y, dx, dy, player.rect)
+                if paddle_hit is not None and (hit is None or paddle_hit[0] < hit[0]):
+                    hit, target = paddle_hit, player
+            
+            # Briques dans la boîte englobante du déplacement
+            swept = pygame.Rect(math.floor(min(x, x + dx)), math.floor(min(y, y + dy)),
+                                math.ceil(abs(dx)) + BALL_SIZE + 1,
+                                math.ceil(abs(dy)) + BALL_SIZE + 1)
+            candidates = grid.query(swept) if grid is not None else bricks
+            for brick in candidates:
+                if not brick.active:
+                    continue
+                brick_hit = sweep_rect(x, y, dx, dy, brick.rect)
+                if brick_hit is not None and (hit is None or brick_hit[0] < hit[0]):
+                    hit, target = brick_hit, brick
+            
+            if hit is None:
+                x += dx
+                y += dy
+                break
+            
+            t, normal_x, normal_y = hit
+            x += dx * t
+            y += dy * t
+            remaining *= 1 - t
+            ball.rect.topleft = (round(x), round(y))
+            
+            if target is None:
+                # Murs
+                if normal_x:
+                    speed_x = abs(speed_x) * normal_x
+                else:
+                    speed_y = abs(speed_y)
+                ball.wall_sound.play()
+            elif target is player:
+                # Angle de rebond selon le point d'impact sur la raquette
+                relative_x = (ball.rect.centerx - player.rect.left) / player.rect.width
+                speed = (speed_x ** 2 + speed_y ** 2) ** 0.5
+                speed_y = -abs(speed * 0.9)
+                speed_x = speed * 0.7 * (relative_x - 0.5) * 2
+                y = player.rect.top - BALL_SIZE
+                ball.paddle_sound.play()
+                ball.create_collision_particles()
+            else:
+                if normal_x:
+                    speed_x *= -1
+                else:
+                    speed_y *= -1
+                brick_points, bonus = ball.hit_brick(target, grid)
+                points += brick_points
+                if bonus is not None:
+                    bonuses.append(bonus)
+        
+        # Limite de vitesse
+        speed = (speed_x ** 2 + speed_y ** 2) ** 0.5
+        if speed > MAX_SPEED:
+            speed_x *= MAX_SPEED / speed
+            speed_y *= MAX_SPEED / speed
+        elif speed < MIN_SPEED:
+            speed_x *= MIN_SPEED / speed
+            speed_y *= MIN_SPEED / speed
+        
+        self.pos[index] = x, y
+        self.vel[index] = speed_x, speed_y
+        return points, bonuses
+
+    def respond(self, balls, kind, target, normal_x, normal_y, player, grid):
+        """Rebonds des balles qui ont touché un obstacle ; effets des impacts"""
+        pos, vel = self.pos, self.vel
+        points, bonuses = 0, []
+
+        walls = balls[kind == WALL]
+        if walls.size:
+            side = normal_x[kind == WALL]
+            vel[walls, 0] = np.where(side != 0, np.abs(vel[walls, 0]) * side, vel[walls, 0])
+            vel[walls, 1] = np.where(side != 0, vel[walls, 1], np.abs(vel[walls, 1]))
+            self.views[walls[0]].wall_sound.play()
+
+        paddled = balls[kind == PADDLE]
+        if paddled.size:
+            paddle = player.rect
+            # Angle de rebond selon le point d'impact sur la raquette
+            center_x = np.round(pos[paddled, 0]) + BALL_SIZE // 2
+            relative_x = (center_x - paddle.left) / paddle.width
+            speed = np.sqrt(vel[paddled, 0] ** 2 + vel[paddled, 1] ** 2)
+            vel[paddled, 1] = -np.abs(speed * 0.9)
+            vel[paddled, 0] = speed * 0.7 * (relative_x - 0.5) * 2
+            pos[paddled, 1] = paddle.top - BALL_SIZE
+            self.views[paddled[0]].paddle_sound.play()
+            for index in paddled.tolist():
+                ball = self.views[index]
+                ball.rect.topleft = (round(pos[index, 0]), round(pos[index, 1]))
+                ball.create_collision_particles()
+
+        hit_bricks = kind == BRICK
+        if hit_bricks.any():
+            for index, brick_index, side in zip(balls[hit_bricks].tolist(),
+                                                target[hit_bricks].tolist(),
+                                                (normal_x[hit_bricks] != 0).tolist()):
+                # Deux balles sur la même brique : seule la première rebondit et la
+                # détruit, l'autre poursuit son déplacement à l'itération suivante
+                if not self.brick_active[brick_index]:
+                    continue
+                vel[index, 0 if side else 1] *= -1
+                ball = self.views[index]
+                ball.rect.topleft = (round(pos[index, 0]), round(pos[index, 1]))
+                brick_points, bonus = ball.hit_brick(self.bricks[brick_index], grid)
+                points += brick_points
+                if bonus is not None:
+                    bonuses.append(bonus)
+        return points, bonuses
+
+    def sync_views(self, start):
+        """Recopie positions et traînées dans les objets Ball (rendu, interpolation)"""
+        half = BALL_SIZE // 2
+        for ball, previous, (x, y) in zip(self.views, start, self.pos[:self.count].tolist()):
+            x, y = round(x), round(y)
+            ball.previous_rect.topleft = previous
+            ball.rect.topleft = (x, y)
+            ball.position_history.append((x + half, y + half))
@@ -0,0 +1,72 @@
+import pygame
+
+# Nombre de niveaux de pulsation pré-rendus (pulse entre 0.7 et 1.0)
+PULSE_LEVELS = 8
+TRAIL_LENGTH = 3
+
+
+class BallSpriteCache:
+    """Sprites pré-rendus de la balle (traînées, lueur, noyau).
+
+    Clé : rayon, couleurs et pulsation quantifiée. Une balle se dessine avec
+    TRAIL_LENGTH + 1 blits, sans aucune allocation de surface par frame.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+
+    @staticmethod
+    def quantize(pulse):
+        """Index du niveau de pulsation le plus proche"""
+        level = round((pulse - 0.7) / 0.3 * (PULSE_LEVELS - 1))
+        return min(max(level, 0), PULSE_LEVELS - 1)
+
+    def get(self, radius, core_color, glow_color, trail_color, pulse_level):
+        """Retourne (sprites de traînée, sprite principal) pour ce niveau de pulsation"""
+        key = (radius, core_color, glow_color, trail_color, pulse_level)
+        sprites = self.sprites.get(key)
+        if sprites is None:
+            pulse = 0.7 + 0.3 * pulse_level / (PULSE_LEVELS - 1)
+            trails = [self.render_trail(radius, glow_color, trail_color, pulse, i)
+                      for i in range(TRAIL_LENGTH)]
+            sprites = (trails, self.render_core(radius, core_color, pulse))
+            self.sprites[key] = sprites
+        return sprites
+
+    def render_trail(self, radius, glow_color, trail_color, pulse, i):
+        """Lueur externe + traînée principale du i-ème point de traînée"""
+        glow_radius = radius + (3 - i) * 2
+        sprite = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        glow_alpha = int((100 - i * 30) * pulse)
+        pygame.draw.circle(sprite, (*glow_color, glow_alpha),
+                           (glow_radius, glow_radius), glow_radius)
+
+        trail = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        trail_alpha = int((150 - i * 50) * pulse)
+        pygame.draw.circle(trail, (*trail_color, trail_alpha), (radius, radius), radius - i)
+        sprite.blit(trail, (glow_radius - radius, glow_radius - radius))
+        return sprite
+
+    def render_core(self, radius, core_color, pulse):
+        """Lueur principale, noyau opaque et point central"""
+        glow_size = int(radius * 3)
+        sprite = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        center = (glow_size, glow_size)
+
+        # Multiple cercles pour créer l'effet de lueur
+        for i in range(3):
+            alpha = int((60 - i * 20) * pulse)
+            pygame.draw.circle(sprite, (*core_color, alpha), center, radius + i * 2)
+
+        # Noyau brillant
+        pygame.draw.circle(sprite, (*core_color, 255), center, radius)
+
+        # Point central plus brillant
+        bright_center = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(bright_center, (255, 255, 255, int(200 * pulse)), (2, 2), 2)
+        sprite.blit(bright_center, (glow_size - 2, glow_size - 2))
+        return sprite
+
+
+# Cache partagé par toutes les balles
+ball_sprites = BallSpriteCache()
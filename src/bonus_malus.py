@@ -1,60 +1,80 @@
 import pygame
 import random
+from bisect import bisect_left
+from itertools import accumulate
+from src.assets import assets
 from src.constants import WIDTH, HEIGHT
 
+# Types de bonus/malus avec leurs probabilités
+BONUS_TYPES = {
+    "extra_life": 15,        # Vie supplémentaire (15%)
+    "increase_paddle": 20,    # Agrandir la raquette (20%)
+    "decrease_paddle": 15,    # Rétrécir la raquette (15%)
+    "speed_up_ball": 0,     # Accélérer la balle (15%)
+    "slow_ball": 0,         # Ralentir la balle (20%)
+    "points_multiplier": 0,  # Multiplicateur de points x2 (15%)
+    "multiball": 10          # Chaque balle se divise en trois
+}
+
+BONUS_COLORS = {
+    "extra_life": (0, 255, 0),        # Vert
+    "increase_paddle": (0, 0, 255),    # Bleu
+    "decrease_paddle": (255, 165, 0),  # Orange
+    "speed_up_ball": (255, 0, 0),      # Rouge
+    "slow_ball": (0, 255, 255),        # Cyan
+    "points_multiplier": (148, 0, 211),  # Violet
+    "multiball": (255, 20, 147)         # Rose
+}
+
+BONUS_SYMBOLS = {
+    "extra_life": "♥",
+    "increase_paddle": "↔",
+    "decrease_paddle": "↕",
+    "speed_up_ball": "⚡",
+    "slow_ball": "⊙",
+    "points_multiplier": "×2",
+    "multiball": "×3"
+}
+
+# Tirage pondéré pré-calculé (poids cumulés)
+_TYPE_NAMES = list(BONUS_TYPES)
+_CUMULATIVE_WEIGHTS = list(accumulate(BONUS_TYPES.values()))
+
+
+def sample_bonus_type(rng=random):
+    """Tire un type de bonus selon les probabilités de BONUS_TYPES"""
+    rand = rng.randint(1, _CUMULATIVE_WEIGHTS[-1])
+    return _TYPE_NAMES[bisect_left(_CUMULATIVE_WEIGHTS, rand)]
+
+
 class BonusMalus:
-    def __init__(self, x, y):
+    # Sprites pré-rendus par type (fond, contour et symbole)
+    sprites = {}
+
+    def __init__(self, x, y, rng=random):
         self.rect = pygame.Rect(x, y, 30, 30)
         self.speed_y = 3
         self.active_time = 10000
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        """Réinitialise le bonus pour une nouvelle chute (réutilisation par le pool)"""
+        self.rect.topleft = (x, y)
+        self.previous_rect = self.rect.copy()
         self.start_time = None
         
-        # Types de bonus/malus avec leurs probabilités
-        self.bonus_types = {
-            "extra_life": 15,        # Vie supplémentaire (15%)
-            "increase_paddle": 20,    # Agrandir la raquette (20%)
-            "decrease_paddle": 15,    # Rétrécir la raquette (15%)
-            "speed_up_ball": 0,     # Accélérer la balle (15%)
-            "slow_ball": 0,         # Ralentir la balle (20%)
-            "points_multiplier": 0   # Multiplicateur de points x2 (15%)
-        }
-        
         # Sélection du type basée sur les probabilités
-        total = sum(self.bonus_types.values())
-        rand = random.randint(1, total)
-        current = 0
-        
-        for bonus_type, prob in self.bonus_types.items():
-            current += prob
-            if rand <= current:
-                self.type = bonus_type
-                break
-                
+        self.type = sample_bonus_type(rng)
         self.color = self.get_color()
 
     def get_color(self):
-        colors = {
-            "extra_life": (0, 255, 0),        # Vert
-            "increase_paddle": (0, 0, 255),    # Bleu
-            "decrease_paddle": (255, 165, 0),  # Orange
-            "speed_up_ball": (255, 0, 0),      # Rouge
-            "slow_ball": (0, 255, 255),        # Cyan
-            "points_multiplier": (148, 0, 211)  # Violet
-        }
-        return colors.get(self.type, (255, 255, 255))
+        return BONUS_COLORS.get(self.type, (255, 255, 255))
 
     def get_symbol(self):
-        symbols = {
-            "extra_life": "♥",
-            "increase_paddle": "↔",
-            "decrease_paddle": "↕",
-            "speed_up_ball": "⚡",
-            "slow_ball": "⊙",
-            "points_multiplier": "×2"
-        }
-        return symbols.get(self.type, "?")
+        return BONUS_SYMBOLS.get(self.type, "?")
 
     def move(self):
+        self.previous_rect = self.rect.copy()
         self.rect.y += self.speed_y
 
     def is_out(self):
@@ -78,17 +98,54 @@ class BonusMalus:
                 ball.speed_y *= 0.7
         elif self.type == "points_multiplier":
             game.score_multiplier = 2
-            game.multiplier_time = pygame.time.get_ticks()
+            game.multiplier_time = game.get_ticks()
+        elif self.type == "multiball":
+            game.split_balls()
+
+    def get_dirty_rect(self):
+        """Zone de l'écran touchée par draw()"""
+        return self.rect.copy()
+
+    def get_sprite(self):
+        """Sprite du type courant, rendu une seule fois"""
+        sprite = BonusMalus.sprites.get(self.type)
+        if sprite is None:
+            sprite = pygame.Surface(self.rect.size)
+            sprite_rect = sprite.get_rect()
+            
+            # Fond du bonus
+            sprite.fill(self.color)
+            
+            # Contour
+            pygame.draw.rect(sprite, (255, 255, 255), sprite_rect, 2)
+            
+            # Symbole
+            font = assets.font(None, 30)
+            symbol = font.render(self.get_symbol(), True, (0, 0, 0))
+            sprite.blit(symbol, symbol.get_rect(center=sprite_rect.center))
+            BonusMalus.sprites[self.type] = sprite
+        return sprite
 
     def draw(self, screen):
-        # Dessiner le fond du bonus
-        pygame.draw.rect(screen, self.color, self.rect)
-        
-        # Contour
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
-        
-        # Symbole
-        font = pygame.font.Font(None, 30)
-        symbol = font.render(self.get_symbol(), True, (0, 0, 0))
-        symbol_rect = symbol.get_rect(center=self.rect.center)
-        screen.blit(symbol, symbol_rect)
\ No newline at end of file
+        screen.blit(self.get_sprite(), self.rect)
+
+
+class BonusMalusPool:
+    """Réserve de bonus réutilisables : pas d'allocation par chute"""
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.free = []
+
+    def acquire(self, x, y, rng=random):
+        """Bonus prêt à tomber depuis (x, y), type tiré avec rng"""
+        if self.free:
+            bonus = self.free.pop()
+            bonus.reset(x, y, rng)
+            return bonus
+        return BonusMalus(x, y, rng)
+
+    def release(self, bonus):
+        """Rend un bonus au pool (ramassé, sorti de l'écran ou effacé)"""
+        if len(self.free) < self.capacity:
+            self.free.append(bonus)
@@ -1,110 +1,178 @@
 import pygame
 import time
 import math
+import numpy as np
 
-class Brick:
-    def __init__(self, x, y, column, points):
-        self.rect = pygame.Rect(x, y, 80, 20)
-        self.points = points
-        self.active = True
-        self.column = column
-        self.flash_start = 0
-        self.flashing = False
-        self.animation_time = 0
-        
-        # Définition des couleurs néon en fonction des points
-        if points <= 5:
-            self.base_color = (255, 51, 102)  # Rose néon
-            self.glow_color = (255, 102, 153)
-        elif points <= 10:
-            self.base_color = (102, 204, 255)  # Bleu néon
-            self.glow_color = (153, 217, 255)
-        else:
-            self.base_color = (57, 255, 20)    # Vert néon
-            self.glow_color = (153, 255, 153)
-        
-        self.pulse_speed = 0.05
+# Couleurs néon (base, lueur) par palier de points
+TIER_COLORS = (
+    ((255, 51, 102), (255, 102, 153)),   # Rose néon (<= 5 points)
+    ((102, 204, 255), (153, 217, 255)),  # Bleu néon (<= 10 points)
+    ((57, 255, 20), (153, 255, 153)),    # Vert néon
+)
+BRICK_WIDTH = 80
+BRICK_HEIGHT = 20
+# Avance de la pulsation par frame et durée du flash de destruction
+PULSE_SPEED = 0.05
+FLASH_DURATION = 0.2
+
+
+def color_tier(points):
+    """Palier de couleur d'une brique selon ses points"""
+    if points <= 5:
+        return 0
+    if points <= 10:
+        return 1
+    return 2
+
+
+class BrickStore:
+    """Briques d'un niveau stockées en colonnes NumPy.
+
+    Rectangles, points, état actif, palier de couleur et début du flash sont
+    des tableaux ; seul un pygame.Rect est gardé par brique, les Brick sont
+    des vues créées à la demande. Le nombre de briques vivantes est tenu à
+    jour à chaque destruction et la pulsation est commune à tout le champ :
+    update() ne dépend pas du nombre de briques.
+    """
+
+    def __init__(self, capacity=16):
+        self.capacity = capacity
+        self.count = 0
+        self.alive = 0
+        self.rects = np.zeros((capacity, 4), dtype=np.int32)  # x, y, largeur, hauteur
+        self.points = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.tier = np.zeros(capacity, dtype=np.uint8)
+        self.column = np.zeros(capacity, dtype=np.uint8)
+        self.flash_start = np.zeros(capacity)
+        # Mêmes rectangles en objets pygame pour les tests de collision balle par balle
+        self.rect_list = []
+
+        # Pulsation partagée par toutes les briques
+        self.animation_time = 0.0
         self.glow_intensity = 1.0
 
-    def start_flash(self):
-        """Active le flash et désactive la brique"""
-        self.flashing = True
-        self.flash_start = time.time()
-        self.active = False  # Désactive immédiatement la brique
+        # Appelé avec la brique détruite (ex: BrickFieldRenderer)
+        self.on_deactivate = None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return (Brick(self, index) for index in range(self.count))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Brick(self, i) for i in range(self.count)[index]]
+        return Brick(self, range(self.count)[index])
+
+    def add(self, x, y, column, points, width=BRICK_WIDTH, height=BRICK_HEIGHT):
+        """Ajoute une brique active ; retourne sa vue"""
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name in ("rects", "points", "active", "tier", "column", "flash_start"):
+                array = getattr(self, name)
+                grown = np.zeros((self.capacity, *array.shape[1:]), dtype=array.dtype)
+                grown[:self.count] = array[:self.count]
+                setattr(self, name, grown)
+        index = self.count
+        # Même arrondi que pygame.Rect pour les positions non entières
+        rect = pygame.Rect(x, y, width, height)
+        self.rects[index] = tuple(rect)
+        self.rect_list.append(rect)
+        self.points[index] = points
+        self.active[index] = True
+        self.tier[index] = color_tier(points)
+        self.column[index] = column
+        self.flash_start[index] = 0
+        self.count += 1
+        self.alive += 1
+        return Brick(self, index)
+
+    def deactivate(self, index):
+        """Détruit la brique index (flash compris) ; sans effet si déjà détruite"""
+        if not self.active[index]:
+            return
+        self.active[index] = False
+        self.alive -= 1
+        self.flash_start[index] = time.time()
+        if self.on_deactivate is not None:
+            self.on_deactivate(Brick(self, index))
+
+    def bounds(self):
+        """Bords (gauche, haut, droite, bas) de toutes les briques, en flottants"""
+        x, y, width, height = self.rects[:self.count].T.astype(float)
+        return np.array([x, y, x + width, y + height])
+
+    def active_in(self, rect):
+        """Briques actives qui recouvrent rect, dans l'ordre de la disposition"""
+        x, y, width, height = self.rects[:self.count].T
+        hit = (self.active[:self.count] & (x < rect.right) & (x + width > rect.left)
+               & (y < rect.bottom) & (y + height > rect.top))
+        return [Brick(self, index) for index in np.flatnonzero(hit).tolist()]
 
     def update(self):
-        """Met à jour les animations"""
-        current_time = time.time()
-        self.animation_time += self.pulse_speed
-        
-        # Animation de pulsation
+        """Avance la pulsation commune (un seul sinus par frame)"""
+        self.animation_time += PULSE_SPEED
         self.glow_intensity = 0.7 + math.sin(self.animation_time * 2) * 0.3
-        
-        # Désactive le flash après 0.2 secondes
-        if self.flashing and current_time - self.flash_start > 0.2:
-            self.flashing = False
-
-    def draw_glow(self, surface, color, alpha):
-        """Dessine l'effet de lueur"""
-        glow_surf = pygame.Surface((self.rect.width + 10, self.rect.height + 10), pygame.SRCALPHA)
-        glow_rect = pygame.Rect(5, 5, self.rect.width, self.rect.height)
-        
-        for i in range(3):
-            expanded_rect = glow_rect.inflate(i * 2, i * 2)
-            glow_alpha = int(alpha * (1 - i * 0.3))
-            pygame.draw.rect(glow_surf, (*color, glow_alpha), expanded_rect, border_radius=3)
-        
-        surface.blit(glow_surf, (self.rect.x - 5, self.rect.y - 5))
-
-    def draw_neon_effect(self, surface):
-        """Dessine l'effet néon principal"""
-        # Valeurs d'alpha basées sur l'intensité
-        base_alpha = int(255 * self.glow_intensity)
-        glow_alpha = int(160 * self.glow_intensity)
-        
-        # Lueur externe
-        self.draw_glow(surface, self.glow_color, glow_alpha)
-        
-        # Rectangle principal avec gradient
-        gradient_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        for i in range(self.rect.height):
-            progress = i / self.rect.height
-            current_color = [
-                int(self.base_color[0] * (0.8 + 0.2 * progress)),
-                int(self.base_color[1] * (0.8 + 0.2 * progress)),
-                int(self.base_color[2] * (0.8 + 0.2 * progress))
-            ]
-            pygame.draw.line(gradient_surf, (*current_color, base_alpha),
-                           (0, i), (self.rect.width, i))
-        
-        surface.blit(gradient_surf, self.rect)
-        
-        # Bordure brillante
-        pygame.draw.rect(surface, (*self.base_color, base_alpha), self.rect, 2, border_radius=2)
-        
-        # Reflet supérieur
-        highlight_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, 2)
-        pygame.draw.rect(surface, (255, 255, 255, int(100 * self.glow_intensity)), 
-                        highlight_rect)
-
-    def draw_flash_effect(self, surface):
-        """Dessine l'effet de flash"""
-        if not self.flashing:
-            return
-            
-        flash_progress = (time.time() - self.flash_start) / 0.2  # 0.2 secondes de flash
-        if flash_progress >= 1:
-            return
-            
-        flash_alpha = int(255 * (1 - flash_progress))
-        flash_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(flash_surf, (255, 255, 255, flash_alpha), flash_surf.get_rect())
-        surface.blit(flash_surf, self.rect)
-
-    def draw(self, screen):
-        """Dessine la brique si elle est active"""
-        if not self.active:
-            return
-            
-        self.draw_neon_effect(screen)
-        self.draw_flash_effect(screen)
\ No newline at end of file
+
+
+class Brick:
+    """Brique du jeu : vue sur une ligne d'un BrickStore.
+
+    Les vues sont éphémères (créées à chaque accès au BrickStore) : deux vues
+    de la même brique ont le même index, pas la même identité.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, Brick) and other.store is self.store
+                and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    @property
+    def rect(self):
+        return self.store.rect_list[self.index]
+
+    @property
+    def points(self):
+        return int(self.store.points[self.index])
+
+    @property
+    def active(self):
+        return bool(self.store.active[self.index])
+
+    @property
+    def column(self):
+        return int(self.store.column[self.index])
+
+    @property
+    def base_color(self):
+        return TIER_COLORS[self.store.tier[self.index]][0]
+
+    @property
+    def glow_color(self):
+        return TIER_COLORS[self.store.tier[self.index]][1]
+
+    @property
+    def flash_start(self):
+        return float(self.store.flash_start[self.index])
+
+    @property
+    def flashing(self):
+        return not self.active and time.time() - self.flash_start <= FLASH_DURATION
+
+    @property
+    def glow_intensity(self):
+        return self.store.glow_intensity
+
+    def start_flash(self):
+        """Active le flash et désactive la brique"""
+        self.store.deactivate(self.index)
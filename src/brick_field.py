@@ -0,0 +1,170 @@
+import pygame
+import math
+import time
+from src.brick import FLASH_DURATION
+
+# Nombre de phases de pulsation pré-calculées par couleur de brique
+PULSE_PHASES = 12
+# Marge autour de chaque brique pour la lueur externe
+GLOW_MARGIN = 5
+
+
+class BrickFieldRenderer:
+    """Rendu du champ de briques à partir de sprites et de calques pré-calculés.
+
+    Chaque couleur de brique est pré-rendue à PULSE_PHASES intensités, et le
+    champ complet est composé une fois par phase. Chaque frame ne coûte plus
+    qu'un blit ; un calque n'est retouché que lorsqu'une brique est détruite.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+        self.layers = []
+        self.layer_rect = pygame.Rect(0, 0, 0, 0)
+        self.bricks = None
+        self.phase_offsets = []
+        self.pending = []
+        self.flashing = []
+        self.flash_surface = None
+        self.last_phase = None
+        self.dirty_rects = []
+
+    def get_sprite(self, brick, phase):
+        """Retourne (en le créant si besoin) le sprite d'une couleur à une phase"""
+        key = (brick.base_color, brick.glow_color, brick.rect.size, phase)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.render_sprite(brick, phase)
+            self.sprites[key] = sprite
+        return sprite
+
+    def render_sprite(self, brick, phase):
+        """Rend une brique comme Brick.draw_neon_effect à l'intensité de la phase"""
+        glow_intensity = 0.7 + math.sin(2 * math.pi * phase / PULSE_PHASES) * 0.3
+        base_alpha = int(255 * glow_intensity)
+        glow_alpha = int(160 * glow_intensity)
+        width, height = brick.rect.size
+
+        sprite = pygame.Surface((width + GLOW_MARGIN * 2, height + GLOW_MARGIN * 2),
+                                pygame.SRCALPHA)
+        body = pygame.Rect(GLOW_MARGIN, GLOW_MARGIN, width, height)
+
+        # Lueur externe
+        for i in range(3):
+            expanded_rect = body.inflate(i * 2, i * 2)
+            alpha = int(glow_alpha * (1 - i * 0.3))
+            pygame.draw.rect(sprite, (*brick.glow_color, alpha), expanded_rect, border_radius=3)
+
+        # Rectangle principal avec gradient
+        gradient_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i in range(height):
+            progress = i / height
+            current_color = [int(c * (0.8 + 0.2 * progress)) for c in brick.base_color]
+            gradient_surf.fill((*current_color, base_alpha), (0, i, width, 1))
+        sprite.blit(gradient_surf, body)
+
+        # Bordure brillante et reflet supérieur (opaques, comme à l'écran)
+        pygame.draw.rect(sprite, (*brick.base_color, 255), body, 2, border_radius=2)
+        sprite.fill((255, 255, 255, 255), (body.x, body.y, width, 2))
+        return sprite
+
+    def build(self, bricks):
+        """Compose les calques de toutes les phases pour une nouvelle disposition"""
+        self.bricks = bricks
+        self.pending = []
+        self.flashing = []
+        self.layers = []
+        self.phase_offsets = []
+
+        if not bricks:
+            self.layer_rect = pygame.Rect(0, 0, 0, 0)
+            return
+
+        # Décalage de phase par brique : une vague diagonale plutôt qu'un
+        # clignotement à l'unisson
+        rows = sorted({brick.rect.y for brick in bricks})
+        row_index = {y: i for i, y in enumerate(rows)}
+        self.phase_offsets = [(brick.column + row_index[brick.rect.y]) % PULSE_PHASES
+                              for brick in bricks]
+        bricks.on_deactivate = self.invalidate
+
+        self.layer_rect = bricks[0].rect.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2)
+        for brick in bricks[1:]:
+            self.layer_rect.union_ip(brick.rect.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2))
+
+        for phase in range(PULSE_PHASES):
+            layer = pygame.Surface(self.layer_rect.size, pygame.SRCALPHA)
+            self.compose(layer, phase, bricks)
+            self.layers.append(layer)
+
+    def compose(self, layer, phase, bricks):
+        """Dessine les briques actives sur le calque d'une phase"""
+        ox, oy = self.layer_rect.topleft
+        layer.blits([
+            (self.get_sprite(brick, (phase + self.phase_offsets[brick.index]) % PULSE_PHASES),
+             (brick.rect.x - GLOW_MARGIN - ox, brick.rect.y - GLOW_MARGIN - oy))
+            for brick in bricks if brick.active
+        ], doreturn=False)
+
+    def invalidate(self, brick):
+        """Appelé par BrickStore.deactivate : la brique sera effacée des calques"""
+        self.pending.append(brick)
+        self.flashing.append(brick)
+
+    def patch(self):
+        """Efface les briques détruites et redessine les lueurs voisines"""
+        ox, oy = self.layer_rect.topleft
+        for destroyed in self.pending:
+            area = destroyed.rect.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2)
+            # Briques actives dont la lueur déborde sur la zone effacée
+            neighbours = self.bricks.active_in(area.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2))
+            local_area = area.move(-ox, -oy)
+            for phase, layer in enumerate(self.layers):
+                layer.fill((0, 0, 0, 0), local_area)
+                layer.set_clip(local_area)
+                self.compose(layer, phase, neighbours)
+                layer.set_clip(None)
+        self.pending = []
+
+    def get_phase(self, animation_time):
+        """Phase courante de la pulsation (même période que BrickStore.update)"""
+        cycle = (animation_time * 2) / (2 * math.pi)
+        return int(cycle * PULSE_PHASES) % PULSE_PHASES
+
+    def draw_flashes(self, screen):
+        """Dessine le flash blanc des briques qui viennent d'être détruites"""
+        if not self.flashing:
+            return
+        now = time.time()
+        still_flashing = []
+        for brick in self.flashing:
+            progress = (now - brick.flash_start) / FLASH_DURATION
+            if progress >= 1:
+                continue
+            still_flashing.append(brick)
+            self.dirty_rects.append(brick.rect.copy())
+            if self.flash_surface is None or self.flash_surface.get_size() != brick.rect.size:
+                self.flash_surface = pygame.Surface(brick.rect.size)
+                self.flash_surface.fill((255, 255, 255))
+            self.flash_surface.set_alpha(int(255 * (1 - progress)))
+            screen.blit(self.flash_surface, brick.rect)
+        self.flashing = still_flashing
+
+    def draw(self, screen, bricks, animation_time):
+        """Dessine tout le champ de briques"""
+        self.dirty_rects = []
+        phase = self.get_phase(animation_time)
+        if bricks is not self.bricks:
+            self.dirty_rects.append(self.layer_rect.copy())
+            self.build(bricks)
+            self.last_phase = None
+        if self.pending:
+            for brick in self.pending:
+                self.dirty_rects.append(brick.rect.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2))
+            self.patch()
+        if phase != self.last_phase:
+            self.dirty_rects.append(self.layer_rect.copy())
+            self.last_phase = phase
+        if self.layers:
+            screen.blit(self.layers[phase], self.layer_rect)
+        self.draw_flashes(screen)
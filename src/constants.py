@@ -1,10 +1,23 @@
-import pygame
+import os
 
-# Configuration de la fenêtre
+# Mode headless : pas de fenêtre, pas de son, pas de rendu (simulation seule)
+HEADLESS = os.environ.get("NEON_PULSE_HEADLESS", "0") == "1"
+
+# Configuration de la fenêtre (ouverte par src.startup.open_window, jamais à l'import)
 WIDTH = 800
 HEIGHT = 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Arkanoid - Niveaux")
+WINDOW_TITLE = "Arkanoid"
+
+# Hauteur de l'interface (HUD) en haut de l'écran
+INTERFACE_HEIGHT = 100
+
+# Cadence de la simulation (mises à jour par seconde)
+SIMULATION_RATE = 60
+# Cadence maximale du rendu (images par seconde)
+MAX_RENDER_RATE = 144
+
+# Graines de partie acceptées : 0 <= graine < SEED_LIMIT (entier 32 bits des replays)
+SEED_LIMIT = 2 ** 32
 
 # Définition des couleurs
 BLANC = (255, 255, 255)
@@ -21,7 +34,20 @@ SOUND_WALL = "assets/sounds/wall.wav"
 MUSIC_BACKGROUND_1 = "assets/sounds/bg_music_1.wav"
 MUSIC_BACKGROUND_2 = "assets/sounds/bg_music_1.wav"
 
+# Nombre maximal de bonus/malus en chute simultanément
+MAX_ACTIVE_BONUSES = 64
+# Nombre maximal de balles en jeu (bonus multiball)
+MAX_BALLS = 512
+
+# Fichier du meilleur score
+HIGHSCORE_FILE = "highscore.txt"
+# Base SQLite du classement local (écran PB)
+LEADERBOARD_FILE = "leaderboard.db"
+
 # Chemin de l'image de fond
 BACKGROUND_IMAGE = "assets/images/bg_menu.jpg"
 BACKGROUND_IMAGE_GAME = "assets/images/bg_game.jpg"
 
+# Cache disque des images redimensionnées (None pour le désactiver)
+IMAGE_CACHE_DIR = os.environ.get("NEON_PULSE_IMAGE_CACHE", ".cache/images") or None
+
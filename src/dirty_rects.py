@@ -0,0 +1,52 @@
+import pygame
+
+
+class DirtyRectTracker:
+    """Collecte les zones de l'écran modifiées et présente la frame.
+
+    Les zones de la frame précédente sont aussi présentées, pour effacer les
+    anciennes positions des entités. Au-delà de full_update_ratio de l'écran,
+    on revient à un flip complet.
+    """
+
+    def __init__(self, full_update_ratio=0.5):
+        self.full_update_ratio = full_update_ratio
+        self.enabled = True
+        self.rects = []
+        self.previous_rects = []
+        self.full_update = True
+
+    def add(self, rect):
+        """Marque une zone comme modifiée"""
+        if rect is not None and rect.width > 0 and rect.height > 0:
+            self.rects.append(rect)
+
+    def add_all(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate_all(self):
+        """Force un flip complet pour cette frame"""
+        self.full_update = True
+
+    def present(self):
+        """Présente la frame : display.update(rects) ou flip complet"""
+        screen = pygame.display.get_surface()
+        if screen is None:
+            return
+
+        if self.full_update or not self.enabled:
+            pygame.display.flip()
+        else:
+            screen_rect = screen.get_rect()
+            rects = [rect.clip(screen_rect) for rect in self.previous_rects + self.rects]
+            rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area > self.full_update_ratio * screen_rect.width * screen_rect.height:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full_update = False
@@ -1,35 +1,100 @@
+import io
+import os
 import pygame
+import math
+import random
 import time
-from src.constants import WIDTH, HEIGHT, screen, MUSIC_BACKGROUND_1
+from src.constants import (WIDTH, HEIGHT, MUSIC_BACKGROUND_1, HEADLESS,
+                           INTERFACE_HEIGHT, SIMULATION_RATE, MAX_ACTIVE_BONUSES, MAX_BALLS,
+                           SEED_LIMIT)
 from src.player import Player
 from src.ball import Ball
+from src.ball_set import BallSet
 from src.score_display import ScoreDisplay
-from src.bonus_malus import BonusMalus
-from src.brick import Brick
+from src.bonus_malus import BonusMalusPool
+from src.brick import BrickStore
+from src.spatial_grid import BrickGrid
+from src.highscore import HighScoreWriter, load_high_score
+from src.leaderboard import LeaderboardWriter, new_run
 from src.game_render import GameRenderer
+from src.headless import NO_KEYS
+from src.particles import ParticleSystem
+from src.profiler import NULL_PROFILER
+from src.startup import open_window
+from src.assets import assets
 import sys
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(self, headless=None, seed=None):
+        # En mode headless : ni fenêtre, ni mixer, ni polices, ni musique
+        self.headless = HEADLESS if headless is None else headless
         
-        # Configuration de l'écran et du jeu
-        self.screen = screen
+        # Configuration de l'écran et du jeu (fenêtre ouverte au premier besoin)
+        self.screen = None if self.headless else open_window()
         self.clock = pygame.time.Clock()
+        # Instrumentation par étape (remplacée par un FrameProfiler si activée)
+        self.profiler = NULL_PROFILER
         
-        # Créer d'abord le score display
-        self.score_display = ScoreDisplay()
-        interface_height = self.score_display.get_interface_height()
+        # Créer d'abord le score display (polices inutiles en headless)
+        self.score_display = None if self.headless else ScoreDisplay()
+        self.interface_height = INTERFACE_HEIGHT
         
-        # Initialiser les objets du jeu
-        self.player = Player()
-        self.ball = Ball(interface_height)
-        self.balls = [self.ball]
+        # Particules partagées (étincelles, impacts, éclats de briques),
+        # graine fixée par new_session()
+        self.particles = ParticleSystem()
+        # Bonus/malus réutilisables
+        self.bonus_pool = BonusMalusPool(capacity=MAX_ACTIVE_BONUSES)
+        
+        # Objets du jeu, gardés d'une partie à l'autre et remis à zéro sur place
+        # (balles stockées dans des tableaux NumPy)
+        self.player = self.create_player()
+        self.balls = BallSet()
+        self.ball = None
+        self.bonus_malus_list = []
+        self.active_effects = []
+        
+        # Meilleur score
+        self.high_score = self.load_high_score()
+        # Pas de sauvegarde du record en headless (soak-tests)
+        self.high_score_writer = None if self.headless else HighScoreWriter()
+        # Parties terminées ajoutées au classement (écran PB), hors headless
+        self.leaderboard_writer = None if self.headless else LeaderboardWriter()
+        
+        # Musique : lue une fois ici, jouée par enter()
+        self.current_music = MUSIC_BACKGROUND_1
+        if not self.headless:
+            assets.music(self.current_music)
+        
+        self.new_session(seed)
+        
+        # Initialiser le renderer et construire le fond dès la préparation de la
+        # scène : enter() ne décode ni ne lit aucune image
+        self.renderer = None if self.headless else GameRenderer(self)
+        if self.renderer is not None:
+            self.renderer.get_backdrop()
+
+    def new_session(self, seed=None):
+        """Remet toute la partie à zéro sur les objets existants, sans aucun chargement.
+
+        Graine de la partie : rejouer la même graine et les mêmes entrées
+        redonne exactement la même partie (voir src.replay).
+        """
+        if seed is not None and not 0 <= seed < SEED_LIMIT:
+            raise ValueError(f"graine invalide : {seed} (attendu 0 <= graine < {SEED_LIMIT})")
+        self.seed = random.randrange(SEED_LIMIT) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        # Enregistreur d'entrées optionnel (ReplayRecorder)
+        self.recorder = None
+        self.frame_count = 0
+        # Début de la partie en cours (durée enregistrée dans le classement)
+        self.run_start_frame = 0
+        self.particles.reset(self.seed)
+        
+        self.player.reset()
+        self.reset_balls()
         
         # Score et progression
         self.score = 0
-        self.high_score = self.load_high_score()
         self.score_multiplier = 1
         self.level = 1
         self.lives = 3
@@ -40,103 +105,158 @@ class Game:
         self.victory = False
         self.paused = False
         self.showing_level_selector = False
+        self.showing_music_selector = False
         
         # Éléments du jeu
         self.create_bricks()
-        self.bonus_malus_list = []
-        self.active_effects = []
+        self.clear_bonuses()
+        self.active_effects.clear()
         
         # Temps et animations
         self.victory_time = None
         self.multiplier_time = 0
         self.animation_time = 0
-        
-        # Initialiser le renderer
-        self.renderer = GameRenderer(self)
-        
-        # Musique
-        self.current_music = MUSIC_BACKGROUND_1
-        self.showing_music_selector = False
-        self.load_and_play_music()
 
-        # Score display et autres initialisations...
-        self.score_display = ScoreDisplay()
-        interface_height = self.score_display.get_interface_height()
+    def enter(self, seed=None):
+        """Scène de jeu : démarre une nouvelle partie et sa musique"""
+        self.new_session(seed)
+        if not self.headless:
+            self.renderer.reset()
+            self.load_and_play_music()
+
+    def leave(self):
+        """Scène de jeu quittée : arrête la musique (les sauvegardes continuent en arrière-plan)"""
+        if not self.headless:
+            pygame.mixer.music.stop()
+
+    def create_ball(self):
+        """Ajoute une balle au jeu (muette en mode headless)"""
+        return Ball(self.interface_height, silent=self.headless, particles=self.particles,
+                    bonus_pool=self.bonus_pool, rng=self.rng, ball_set=self.balls)
+
+    def reset_balls(self):
+        """Remplace toutes les balles par la balle principale, au point de départ"""
+        self.balls.clear()
+        if self.ball is None:
+            self.ball = self.create_ball()
+        else:
+            self.ball.reset(self.rng)
+
+    def split_balls(self, spread=0.35):
+        """Bonus multiball : chaque balle en lance deux autres, de part et d'autre"""
+        for ball in list(self.balls):
+            for angle in (spread, -spread):
+                if len(self.balls) >= MAX_BALLS:
+                    return
+                cos, sin = math.cos(angle), math.sin(angle)
+                new_ball = self.create_ball()
+                new_ball.set_position(*ball.rect.topleft)
+                new_ball.pos_x, new_ball.pos_y = ball.pos_x, ball.pos_y
+                new_ball.speed_x = ball.speed_x * cos - ball.speed_y * sin
+                new_ball.speed_y = ball.speed_x * sin + ball.speed_y * cos
+
+    def create_player(self):
+        """Crée la raquette, reliée au système de particules du jeu"""
+        return Player(particles=self.particles)
+
+    def clear_bonuses(self):
+        """Retire tous les bonus en chute et les rend au pool"""
+        for bonus in self.bonus_malus_list:
+            self.bonus_pool.release(bonus)
+        self.bonus_malus_list.clear()
+
+    def get_ticks(self):
+        """Temps de simulation en millisecondes, calculé à partir des frames simulées"""
+        return self.frame_count * 1000 // SIMULATION_RATE
+
+    def record_command(self, command, value=0):
+        """Note une commande qui modifie la partie hors de update() (rejouable)"""
+        if self.recorder is not None:
+            self.recorder.record_command(command, value)
 
     def load_high_score(self):
-        try:
-            with open('highscore.txt', 'r') as f:
-                return int(f.read())
-        except:
-            return 0
+        return load_high_score()
 
     def save_high_score(self):
-        try:
-            with open('highscore.txt', 'w') as f:
-                f.write(str(self.high_score))
-        except:
-            pass
+        """Demande la sauvegarde du record (écriture en arrière-plan, fusionnée)"""
+        if self.high_score_writer is not None:
+            self.high_score_writer.submit(self.high_score)
+
+    def record_run(self):
+        """Ajoute la partie terminée au classement (insertion en arrière-plan)"""
+        if self.leaderboard_writer is not None:
+            duration = (self.frame_count - self.run_start_frame) / SIMULATION_RATE
+            self.leaderboard_writer.submit(new_run(self.score, self.level, duration))
+
+    def close(self):
+        """Écrit le record et les parties en attente, arrête les threads de sauvegarde"""
+        if self.high_score_writer is not None:
+            self.high_score_writer.close()
+            self.high_score_writer = None
+        if self.leaderboard_writer is not None:
+            self.leaderboard_writer.close()
+            self.leaderboard_writer = None
 
     def create_bricks(self):
-        self.bricks = []
         brick_width = 80
         brick_height = 20
         rows = self.level + 2
+        self.bricks = BrickStore(capacity=rows * 6)
         spacing_x = (WIDTH - (6 * brick_width)) / 7
         
-        start_y = self.score_display.get_interface_height() + 20
+        start_y = self.interface_height + 20
         
         for row in range(rows):
             y = start_y + (row * (brick_height + 5))
             for col in range(6):
                 x = spacing_x + col * (brick_width + spacing_x)
                 points = (rows - row) * 5
-                self.bricks.append(Brick(x, y, col, points))
+                self.bricks.add(x, y, col, points, brick_width, brick_height)
+        
+        self.brick_grid = BrickGrid(self.bricks)
 
     def jump_to_level(self, level):
-        interface_height = self.score_display.get_interface_height()
+        self.record_command("jump_to_level", level)
         self.level = level
-        self.ball = Ball(interface_height)
-        self.balls = [self.ball]
-        self.player = Player()
+        self.reset_balls()
+        self.player.reset()
         self.victory = False
         self.paused = False
         self.game_over = False
         self.create_bricks()
-        self.bonus_malus_list.clear()
+        self.clear_bonuses()
         self.victory_time = None
         self.active_effects.clear()
 
     def reset_game(self):
-        interface_height = self.score_display.get_interface_height()
-        self.ball = Ball(interface_height)
-        self.balls = [self.ball]
-        self.player = Player()
+        self.record_command("reset_game")
+        self.run_start_frame = self.frame_count
+        self.reset_balls()
+        self.player.reset()
         self.game_over = False
         self.victory = False
         self.score = 0
         self.level = 1
         self.lives = 3
         self.create_bricks()
-        self.bonus_malus_list.clear()
+        self.clear_bonuses()
         self.active_effects.clear()
         self.score_multiplier = 1
 
     def start_next_level(self):
-        interface_height = self.score_display.get_interface_height()
+        self.record_command("start_next_level")
         self.level += 1
-        self.ball = Ball(interface_height)
-        self.balls = [self.ball]
-        self.player = Player()
+        self.reset_balls()
+        self.player.reset()
         self.victory = False
         self.paused = False
         self.create_bricks()
-        self.bonus_malus_list.clear()
+        self.clear_bonuses()
         self.victory_time = None
         self.active_effects.clear()
 
     def update_effects(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
         
         if self.score_multiplier > 1 and current_time - self.multiplier_time > 10000:
             self.score_multiplier = 1
@@ -144,56 +264,99 @@ class Game:
         if self.player.is_strong and current_time - self.player.strong_time > 10000:
             self.player.is_strong = False
 
-    def update(self):
+    def update(self, keys=None):
+        """Une frame de simulation (keys absent : clavier réel, aucune touche en headless)"""
         if not self.game_over and not self.victory and not self.paused:
+            profiler = self.profiler
+            if keys is None:
+                keys = NO_KEYS if self.headless else pygame.key.get_pressed()
+            if self.recorder is not None:
+                self.recorder.record_tick(keys)
+            self.frame_count += 1
             self.animation_time += 0.05
-            self.player.update()
-            self.player.move()
+            if self.score_display is not None:
+                self.score_display.update(self.score)
+            with profiler.stage("paddle"):
+                self.player.update()
+                self.player.move(keys)
+            with profiler.stage("particles"):
+                self.particles.update(1 / SIMULATION_RATE)
             self.update_effects()
             
-            # Mise à jour des balles
-            for ball in self.balls[:]:
-                ball.move()
-                points, new_bonus = ball.check_collision(self.player, self.bricks)
-                
-                if points > 0:
-                    self.score += points * self.score_multiplier
-                    if self.score > self.high_score:
-                        self.high_score = self.score
-                        self.save_high_score()
-                
-                if new_bonus and len(self.bonus_malus_list) == 0:
-                    self.bonus_malus_list.append(new_bonus)
-                
-                if ball.is_out():
-                    self.balls.remove(ball)
-                    if len(self.balls) == 0:
-                        self.lives -= 1
-                        if self.lives > 0:
-                            self.ball = Ball(self.score_display.get_interface_height())
-                            self.balls = [self.ball]
-                        else:
-                            self.game_over = True
-            
-            # Mise à jour des bonus/malus
-            for bonus in self.bonus_malus_list[:]:
-                bonus.move()
-                if bonus.rect.colliderect(self.player.rect):
-                    bonus.apply_effect(self)
-                    self.bonus_malus_list.remove(bonus)
-                elif bonus.is_out():
-                    self.bonus_malus_list.remove(bonus)
+            # Mise à jour des balles (déplacement et collisions continues)
+            with profiler.stage("ball_physics"):
+                self.update_balls()
             
-            # Mise à jour des briques et vérification de la victoire
-            active_bricks = 0
-            for brick in self.bricks:
-                brick.update()
-                if brick.active:
-                    active_bricks += 1
+            # Mise à jour des bonus/malus (ramassés ou sortis : rendus au pool)
+            with profiler.stage("collisions"):
+                falling = []
+                for bonus in self.bonus_malus_list:
+                    bonus.move()
+                    if bonus.rect.colliderect(self.player.rect):
+                        bonus.apply_effect(self)
+                        self.bonus_pool.release(bonus)
+                    elif bonus.is_out():
+                        self.bonus_pool.release(bonus)
+                    else:
+                        falling.append(bonus)
+                self.bonus_malus_list = falling
             
-            if active_bricks == 0:
-                self.victory = True
-                self.victory_time = time.time()
+            # Pulsation commune des briques et victoire (compteur de briques vivantes)
+            with profiler.stage("bricks_update"):
+                self.bricks.update()
+                if self.bricks.alive == 0:
+                    self.victory = True
+                    self.victory_time = time.time()
+
+    def update_balls(self):
+        """Déplace toutes les balles en une fois (BallSet) puis applique les résultats"""
+        points, new_bonuses = self.balls.step(self.player, self.bricks, self.brick_grid)
+        
+        if points > 0:
+            self.score += points * self.score_multiplier
+            if self.score > self.high_score:
+                self.high_score = self.score
+                self.save_high_score()
+        
+        for new_bonus in new_bonuses:
+            if len(self.bonus_malus_list) < MAX_ACTIVE_BONUSES:
+                self.bonus_malus_list.append(new_bonus)
+            else:
+                self.bonus_pool.release(new_bonus)
+        
+        if self.balls.remove_out():
+            if len(self.balls) == 0:
+                self.lives -= 1
+                if self.lives > 0:
+                    self.reset_balls()
+                else:
+                    self.game_over = True
+                    self.record_run()
+            elif self.ball.index is None:
+                self.ball = self.balls[0]
+
+    def step(self, n_frames=1, inputs=None):
+        """Avance la simulation de n_frames sans rendu, aussi vite que possible.
+
+        inputs : None (aucune touche), un état de clavier appliqué à chaque
+        frame, une séquence d'états de clavier (un par frame) ou un pilote
+        appelé à chaque frame (ex: Autopilot) qui retourne l'état du clavier.
+        Retourne le nombre de frames simulées (arrêt au game over ou à la victoire).
+        """
+        if inputs is None:
+            inputs = NO_KEYS
+        per_frame = isinstance(inputs, (list, tuple))
+        driven = callable(inputs)
+        
+        for i in range(n_frames):
+            if self.game_over or self.victory or self.paused:
+                return i
+            if driven:
+                keys = inputs()
+            else:
+                keys = inputs[i] if per_frame else inputs
+            self.update(keys)
+        return n_frames
 
     def process_events(self, events):
         for event in events:
@@ -216,7 +379,12 @@ class Game:
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self.renderer.handle_click(event.pos)
     def load_and_play_music(self):
-        pygame.mixer.music.load(self.current_music)
+        """Joue la musique depuis la mémoire ; pas de musique si le fichier manque"""
+        data = assets.music(self.current_music)
+        if data is None:
+            return
+        namehint = os.path.splitext(self.current_music)[1].lstrip(".")
+        pygame.mixer.music.load(io.BytesIO(data), namehint)
         pygame.mixer.music.set_volume(0.4)
         pygame.mixer.music.play(-1)
 
@@ -250,6 +418,7 @@ class Game:
         
         return None
     def run(self):
+        self.load_and_play_music()
         while self.running:
             result = self.handle_events()
             if result == "menu":
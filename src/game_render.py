@@ -1,5 +1,11 @@
 import pygame
 import math
+from src.assets import assets
+from src.brick_field import BrickFieldRenderer
+from src.dirty_rects import DirtyRectTracker
+from src.score_display import quantize_glow, glow_factor
+from src.text_cache import SurfaceCache
+from src.timestep import interpolated
 from src.constants import WIDTH, HEIGHT, BACKGROUND_IMAGE_GAME, MUSIC_BACKGROUND_1, MUSIC_BACKGROUND_2
 
 class GameRenderer:
@@ -7,9 +13,9 @@ class GameRenderer:
         self.game = game
         
         # Interface
-        self.font = pygame.font.Font(None, 74)
-        self.button_font = pygame.font.Font(None, 50)
-        self.small_font = pygame.font.Font(None, 36)
+        self.font = assets.font(None, 74)
+        self.button_font = assets.font(None, 50)
+        self.small_font = assets.font(None, 36)
         
         # Couleurs néon
         self.neon_pink = (255, 51, 102)
@@ -17,9 +23,29 @@ class GameRenderer:
         self.neon_green = (57, 255, 20)
         self.neon_yellow = (255, 255, 102)
         
-        # Charger et redimensionner l'image de fond
-        self.background_image = pygame.image.load(BACKGROUND_IMAGE_GAME)
-        self.background_image = pygame.transform.scale(self.background_image, (WIDTH, HEIGHT))
+        # Textes néon déjà rendus (LRU borné en mémoire)
+        self.text_cache = SurfaceCache()
+        
+        # Fond statique (image + scanlines + fond du HUD), construit à la demande
+        self.background_path = BACKGROUND_IMAGE_GAME
+        self.backdrop = None
+        self.backdrop_key = None
+        
+        # Champ de briques pré-rendu
+        self.brick_field = BrickFieldRenderer()
+        
+        # Présentation par zones modifiées (flip complet à la première frame)
+        self.dirty_rects = DirtyRectTracker()
+        self.overlay_shown = False
+        
+        # Scène figée et assombrie sous les overlays (pause, game over, victoire)
+        self.frozen_scene = None
+        self.frozen_key = None
+        self.overlay_layer = None
+        self.overlay_layer_key = None
+        self.overlay_foreground = []
+        # Zones redessinées à la frame précédente sur la scène figée
+        self.overlay_rects = []
         
         # Dimensions des boutons
         self.button_width = 200
@@ -70,8 +96,16 @@ class GameRenderer:
         ]
 
     def draw_neon_text(self, text, color, pos, font, glow_radius=2):
+        """Texte néon centré sur pos : (surface, x, y), surface rendue une fois puis gardée"""
+        surface = self.text_cache.get((text, color, font, glow_radius),
+                                      lambda: self.render_neon_text(text, color, font, glow_radius))
+        dest_rect = surface.get_rect(center=pos)
+        return surface, dest_rect.x, dest_rect.y
+
+    def render_neon_text(self, text, color, font, glow_radius):
+        """Rend le texte et sa lueur (blits additifs décalés) dans une surface"""
         glow_surface = font.render(text, True, color)
-        text_rect = glow_surface.get_rect(center=pos)
+        text_rect = glow_surface.get_rect()
         alpha_surface = pygame.Surface((text_rect.width + glow_radius*2, 
                                       text_rect.height + glow_radius*2), pygame.SRCALPHA)
         
@@ -86,10 +120,10 @@ class GameRenderer:
                                      special_flags=pygame.BLEND_RGBA_ADD)
         
         alpha_surface.blit(glow_surface, (glow_radius, glow_radius))
-        dest_rect = alpha_surface.get_rect(center=pos)
-        return alpha_surface, dest_rect.x, dest_rect.y
+        return alpha_surface
 
     def draw_neon_button(self, rect, color, hover=False, text="", font=None):
+        """Bouton néon ; retourne la zone dessinée (halo compris)"""
         glow = 3 if hover else 2
         for i in range(glow):
             expanded_rect = rect.inflate(i*4, i*4)
@@ -101,164 +135,187 @@ class GameRenderer:
         pygame.draw.rect(self.game.screen, color, rect, border_radius=5)
         pygame.draw.rect(self.game.screen, (255, 255, 255), rect, 2, border_radius=5)
         
+        area = rect.inflate(8, 8)
         if text and font:
             text_surf = font.render(text, True, (255, 255, 255))
             text_rect = text_surf.get_rect(center=rect.center)
-            self.game.screen.blit(text_surf, text_rect)
+            area.union_ip(self.game.screen.blit(text_surf, text_rect))
+        return area
 
-    def draw_pause(self):
-        """Dessine l'écran de pause"""
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.game.screen.blit(overlay, (0, 0))
-        
-        if self.game.showing_music_selector:
-            self.draw_music_selector()
-        elif self.game.showing_level_selector:
-            self.draw_level_selector()
+    def overlay_key(self):
+        """Overlay affiché (game over, victoire, pause et son sous-menu) ou None"""
+        if self.game.game_over:
+            return ("game_over",)
+        if self.game.victory:
+            return ("victory",)
+        if self.game.paused:
+            if self.game.showing_music_selector:
+                return ("pause", "music")
+            if self.game.showing_level_selector:
+                return ("pause", "level")
+            return ("pause",)
+        return None
+
+    def overlay_texts(self, key):
+        """Textes fixes d'un overlay : (texte, couleur, position, police, au-dessus des boutons)"""
+        if key == ("game_over",):
+            return [('Game Over', self.neon_pink, (WIDTH//2, HEIGHT//2 - 100), self.font, False)]
+        if key == ("pause", "music"):
+            return [('Sélection de la musique', self.neon_pink, (WIDTH//2, HEIGHT//2 - 100), self.font, False),
+                    ('Retour', self.neon_yellow, (WIDTH//2, HEIGHT//2 + 120), self.small_font, True)]
+        if key == ("pause", "level"):
+            return [('Choisir un niveau', self.neon_pink, (WIDTH//2, HEIGHT//2 - 160), self.font, False),
+                    ('Retour', self.neon_yellow, (WIDTH//2, HEIGHT//2 + 160), self.small_font, True)]
+        if key == ("pause",):
+            return [("ESC to return to main menu", self.neon_yellow, (WIDTH//2, HEIGHT//2 - 170),
+                     self.small_font, False),
+                    ('PAUSE', self.neon_blue, (WIDTH//2, HEIGHT//2 - 100), self.font, False)]
+        return []
+
+    def freeze_scene(self):
+        """Capture la scène qui vient d'être dessinée, assombrie une fois pour toutes"""
+        scene = self.game.screen.copy()
+        shade = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 180))
+        scene.blit(shade, (0, 0))
+        self.frozen_scene = scene
+        self.frozen_key = self.scene_key()
+        self.overlay_layer_key = None
+
+    def build_overlay_layer(self, key):
+        """Scène figée + textes fixes de l'overlay ; textes à redessiner sur les boutons"""
+        layer = self.frozen_scene.copy()
+        foreground = []
+        for text, color, pos, font, above in self.overlay_texts(key):
+            surface, x, y = self.draw_neon_text(text, color, pos, font)
+            if above:
+                foreground.append((surface, (x, y)))
+            else:
+                layer.blit(surface, (x, y))
+        return layer, foreground
+
+    def draw_overlay(self, key):
+        """Overlay sur la scène figée : seules les zones des boutons sont redessinées"""
+        screen = self.game.screen
+        if key != self.overlay_layer_key:
+            self.overlay_layer, self.overlay_foreground = self.build_overlay_layer(key)
+            self.overlay_layer_key = key
+            screen.blit(self.overlay_layer, (0, 0))
+            self.dirty_rects.invalidate_all()
         else:
-            # Message pour quitter
-            quit_text = "ESC to return to main menu"
-            quit_pos = (WIDTH//2, HEIGHT//2 - 170)
-            quit_surface, qx, qy = self.draw_neon_text(quit_text,
-                                                      self.neon_yellow,
-                                                      quit_pos,
-                                                      self.small_font)
-            self.game.screen.blit(quit_surface, (qx, qy))
-            
-            # Texte PAUSE
-            pause_pos = (WIDTH//2, HEIGHT//2 - 100)
-            text_surface, x, y = self.draw_neon_text('PAUSE',
-                                                    self.neon_blue,
-                                                    pause_pos,
-                                                    self.font)
-            self.game.screen.blit(text_surface, (x, y))
-            
-            mouse_pos = pygame.mouse.get_pos()
-            # Position verticale des boutons
-            button_spacing = 70
-            base_y = HEIGHT//2 - 20
+            # Restaure les zones touchées à la frame précédente
+            for rect in self.overlay_rects:
+                screen.blit(self.overlay_layer, rect, rect)
+        
+        if key == ("game_over",):
+            rects = self.draw_game_over()
+        elif key == ("victory",):
+            rects = self.draw_victory()
+        elif key == ("pause", "music"):
+            rects = self.draw_music_selector()
+        elif key == ("pause", "level"):
+            rects = self.draw_level_selector()
+        else:
+            rects = self.draw_pause()
+        for surface, pos in self.overlay_foreground:
+            rects.append(screen.blit(surface, pos))
+        self.overlay_rects = rects
+        self.dirty_rects.add_all(rects)
+
+    def draw_pause(self):
+        """Boutons de l'écran de pause ; retourne les zones dessinées"""
+        mouse_pos = pygame.mouse.get_pos()
+        # Position verticale des boutons
+        button_spacing = 70
+        base_y = HEIGHT//2 - 20
+        rects = []
 
-            # Bouton de niveau
-            self.level_selector_button.y = base_y
-            hover = self.level_selector_button.collidepoint(mouse_pos)
-            self.draw_neon_button(self.level_selector_button,
-                                self.neon_green,
-                                hover,
-                                'Niveau',
-                                self.small_font)
+        # Bouton de niveau
+        self.level_selector_button.y = base_y
+        hover = self.level_selector_button.collidepoint(mouse_pos)
+        rects.append(self.draw_neon_button(self.level_selector_button,
+                                           self.neon_green,
+                                           hover,
+                                           'Niveau',
+                                           self.small_font))
 
-            # Bouton de musique
-            self.music_selector_button.y = base_y + button_spacing
-            hover = self.music_selector_button.collidepoint(mouse_pos)
-            self.draw_neon_button(self.music_selector_button,
-                                self.neon_blue,
-                                hover,
-                                'Musique',
-                                self.small_font)
-            
-            # Bouton menu principal
-            self.menu_button.y = base_y + button_spacing * 2
-            hover = self.menu_button.collidepoint(mouse_pos)
-            self.draw_neon_button(self.menu_button,
-                                self.neon_pink,
-                                hover,
-                                'Menu Principal',
-                                self.small_font)
+        # Bouton de musique
+        self.music_selector_button.y = base_y + button_spacing
+        hover = self.music_selector_button.collidepoint(mouse_pos)
+        rects.append(self.draw_neon_button(self.music_selector_button,
+                                           self.neon_blue,
+                                           hover,
+                                           'Musique',
+                                           self.small_font))
+        
+        # Bouton menu principal
+        self.menu_button.y = base_y + button_spacing * 2
+        hover = self.menu_button.collidepoint(mouse_pos)
+        rects.append(self.draw_neon_button(self.menu_button,
+                                           self.neon_pink,
+                                           hover,
+                                           'Menu Principal',
+                                           self.small_font))
+        return rects
 
     def draw_level_selector(self):
-        title_pos = (WIDTH//2, HEIGHT//2 - 160)
-        text_surface, x, y = self.draw_neon_text('Choisir un niveau',
-                                                self.neon_pink,
-                                                title_pos,
-                                                self.font)
-        self.game.screen.blit(text_surface, (x, y))
-        
+        """Boutons de choix du niveau ; retourne les zones dessinées"""
         mouse_pos = pygame.mouse.get_pos()
+        rects = []
         for i, button in enumerate(self.level_buttons, 1):
             hover = button.collidepoint(mouse_pos)
-            self.draw_neon_button(button,
-                                self.neon_blue,
-                                hover,
-                                str(i),
-                                self.button_font)
-        
-        # Bouton retour
-        back_pos = (WIDTH//2, HEIGHT//2 + 160)
-        back_surface, bx, by = self.draw_neon_text('Retour',
-                                                  self.neon_yellow,
-                                                  back_pos,
-                                                  self.small_font)
-        self.game.screen.blit(back_surface, (bx, by))
+            rects.append(self.draw_neon_button(button,
+                                               self.neon_blue,
+                                               hover,
+                                               str(i),
+                                               self.button_font))
+        return rects
 
     def draw_music_selector(self):
-        title_pos = (WIDTH//2, HEIGHT//2 - 100)
-        text_surface, x, y = self.draw_neon_text('Sélection de la musique',
-                                                self.neon_pink,
-                                                title_pos,
-                                                self.font)
-        self.game.screen.blit(text_surface, (x, y))
-        
+        """Boutons de choix de la musique ; retourne les zones dessinées"""
         mouse_pos = pygame.mouse.get_pos()
         
         hover = self.music_buttons[0].collidepoint(mouse_pos)
-        self.draw_neon_button(self.music_buttons[0],
-                            self.neon_blue,
-                            hover,
-                            'Musique 1',
-                            self.button_font)
+        first = self.draw_neon_button(self.music_buttons[0],
+                                      self.neon_blue,
+                                      hover,
+                                      'Musique 1',
+                                      self.button_font)
         
         hover = self.music_buttons[1].collidepoint(mouse_pos)
-        self.draw_neon_button(self.music_buttons[1],
-                            self.neon_green,
-                            hover,
-                            'Musique 2',
-                            self.button_font)
-        
-        back_pos = (WIDTH//2, HEIGHT//2 + 120)
-        back_surface, bx, by = self.draw_neon_text('Retour',
-                                                  self.neon_yellow,
-                                                  back_pos,
-                                                  self.small_font)
-        self.game.screen.blit(back_surface, (bx, by))
+        second = self.draw_neon_button(self.music_buttons[1],
+                                       self.neon_green,
+                                       hover,
+                                       'Musique 2',
+                                       self.button_font)
+        return [first, second]
 
     def draw_game_over(self):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.game.screen.blit(overlay, (0, 0))
-        
-        title_pos = (WIDTH//2, HEIGHT//2 - 100)
-        text_surface, x, y = self.draw_neon_text('Game Over',
-                                                self.neon_pink,
-                                                title_pos,
-                                                self.font)
-        self.game.screen.blit(text_surface, (x, y))
-        
+        """Boutons de l'écran de game over ; retourne les zones dessinées"""
         restart_button = pygame.Rect(WIDTH//2 - 150, HEIGHT//2 - 10, 300, 50)
         menu_button = pygame.Rect(WIDTH//2 - 150, HEIGHT//2 + 60, 300, 50)
         
         mouse_pos = pygame.mouse.get_pos()
         hover = restart_button.collidepoint(mouse_pos)
-        self.draw_neon_button(restart_button,
-                            self.neon_blue,
-                            hover,
-                            'Press SPACE or R to restart',
-                            self.button_font)
+        restart = self.draw_neon_button(restart_button,
+                                        self.neon_blue,
+                                        hover,
+                                        'Press SPACE or R to restart',
+                                        self.button_font)
         
         hover = menu_button.collidepoint(mouse_pos)
-        self.draw_neon_button(menu_button,
-                            self.neon_green,
-                            hover,
-                            'ESC to back to menu',
-                            self.button_font)
+        menu = self.draw_neon_button(menu_button,
+                                     self.neon_green,
+                                     hover,
+                                     'ESC to back to menu',
+                                     self.button_font)
+        return [restart, menu]
 
     def draw_victory(self):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.game.screen.blit(overlay, (0, 0))
-        
+        """Titre pulsé et bouton de l'écran de victoire ; retourne les zones dessinées"""
         title_pos = (WIDTH//2, HEIGHT//2 - 100)
-        pulse = abs(math.sin(self.game.animation_time * 3)) * 0.3 + 0.7
+        # Pulsation quantifiée : quelques variantes, toutes gardées en cache
+        pulse = glow_factor(quantize_glow(abs(math.sin(self.game.animation_time * 3)) * 0.3 + 0.7))
         color = tuple(int(c * pulse) for c in self.neon_green)
         
         text_surface, x, y = self.draw_neon_text(
@@ -267,52 +324,135 @@ class GameRenderer:
             title_pos,
             self.font
         )
-        self.game.screen.blit(text_surface, (x, y))
+        title = self.game.screen.blit(text_surface, (x, y))
         
         mouse_pos = pygame.mouse.get_pos()
         hover = self.next_level_button.collidepoint(mouse_pos)
-        self.draw_neon_button(self.next_level_button, self.neon_green, hover,
-                            'Next Level', self.button_font)
+        button = self.draw_neon_button(self.next_level_button, self.neon_green, hover,
+                                       'Next Level', self.button_font)
+        return [title, button]
 
-    def draw(self):
-        self.game.screen.blit(self.background_image, (0, 0))
-        self._draw_scanlines()
-        
-        for brick in self.game.bricks:
-            brick.draw(self.game.screen)
-        
-        for ball in self.game.balls:
-            ball.draw(self.game.screen)
-        
-        for bonus in self.game.bonus_malus_list:
-            bonus.draw(self.game.screen)
-        
-        if self.game.player.is_strong:
-            self.game.player.draw_strong(self.game.screen)
-        else:
-            self.game.player.draw(self.game.screen)
-        
-        self.game.score_display.draw(self.game.screen,
-                                   self.game.score,
-                                   self.game.level,
-                                   self.game.lives,
-                                   self.game.high_score,
-                                   self.game.score_multiplier)
-        
-        if self.game.game_over:
-            self.draw_game_over()
-        elif self.game.victory:
-            self.draw_victory()
-        elif self.game.paused:
-            self.draw_pause()
-        
-        pygame.display.flip()
+    def set_theme(self, background_path):
+        """Change l'image de fond ; le fond statique sera reconstruit"""
+        self.background_path = background_path
+        self.backdrop_key = None
+
+    def reset(self):
+        """Nouvelle partie : la prochaine frame redessine tout l'écran (fond gardé)"""
+        self.overlay_shown = False
+        self.frozen_scene = None
+        self.overlay_layer_key = None
+        self.dirty_rects.invalidate_all()
+
+    def scene_key(self):
+        """Résolution et thème : si l'un change, fond et scène figée sont refaits"""
+        return (self.game.screen.get_size(), self.background_path)
+
+    def get_backdrop(self):
+        """Retourne le fond statique, reconstruit si la résolution ou le thème a changé"""
+        key = self.scene_key()
+        if key != self.backdrop_key:
+            self.backdrop = self._build_backdrop(key[0])
+            self.backdrop_key = key
+        return self.backdrop
+
+    def _build_backdrop(self, size):
+        """Combine l'image de fond, les scanlines et le fond du HUD en une surface"""
+        # Copie : l'image du registre est partagée
+        backdrop = assets.image(self.background_path, size).copy()
+        self._draw_scanlines(backdrop)
+        self.game.score_display.draw_background(backdrop)
+        return backdrop
+
+    def draw(self, alpha=1.0):
+        """Dessine la frame ; alpha interpole les entités entre les deux derniers pas"""
+        entities = [*self.game.balls, *self.game.bonus_malus_list, self.game.player]
+        with interpolated(entities, alpha):
+            self.draw_frame()
+
+    def draw_frame(self):
+        dirty = self.dirty_rects
+        profiler = self.game.profiler
+        overlay = self.overlay_key()
+        # Sous un overlay, la scène est dessinée une fois puis figée
+        frozen = (overlay is not None and self.frozen_scene is not None
+                  and self.frozen_key == self.scene_key())
+        if not frozen:
+            self.draw_scene()
+        
+        # La frame qui retire un overlay couvre tout l'écran
+        with profiler.stage("overlays"):
+            if overlay is not None:
+                if not frozen:
+                    self.freeze_scene()
+                self.draw_overlay(overlay)
+            else:
+                if self.overlay_shown:
+                    dirty.invalidate_all()
+                self.frozen_scene = None
+                self.overlay_layer = None
+                self.overlay_layer_key = None
+                self.overlay_rects = []
+            self.overlay_shown = overlay is not None
+            
+            # Overlay du profiler (F3), par-dessus tout le reste
+            profiler_rect = profiler.draw_overlay(self.game.screen)
+            dirty.add(profiler_rect)
+            if overlay is not None and profiler_rect is not None:
+                self.overlay_rects.append(profiler_rect)
+        
+        with profiler.stage("present"):
+            dirty.present()
+
+    def draw_scene(self):
+        """Dessine la scène de jeu (fond, briques, balles, sprites, HUD)"""
+        dirty = self.dirty_rects
+        profiler = self.game.profiler
+        with profiler.stage("background"):
+            backdrop_key = self.backdrop_key
+            self.game.screen.blit(self.get_backdrop(), (0, 0))
+            if self.backdrop_key != backdrop_key:
+                dirty.invalidate_all()
+        
+        with profiler.stage("brick_draw"):
+            self.brick_field.draw(self.game.screen, self.game.bricks, self.game.animation_time)
+            dirty.add_all(self.brick_field.dirty_rects)
+        
+        with profiler.stage("ball_draw"):
+            for ball in self.game.balls:
+                ball.draw(self.game.screen)
+                dirty.add(ball.get_dirty_rect())
+        
+        with profiler.stage("sprites"):
+            for bonus in self.game.bonus_malus_list:
+                bonus.draw(self.game.screen)
+                dirty.add(bonus.get_dirty_rect())
+            
+            if self.game.player.is_strong:
+                self.game.player.draw_strong(self.game.screen)
+            else:
+                self.game.player.draw(self.game.screen)
+            dirty.add(self.game.player.get_dirty_rect())
+            
+            self.game.particles.draw(self.game.screen)
+            dirty.add(self.game.particles.get_dirty_rect())
+        
+        with profiler.stage("hud"):
+            self.game.score_display.draw(self.game.screen,
+                                       self.game.score,
+                                       self.game.level,
+                                       self.game.lives,
+                                       self.game.high_score,
+                                       self.game.score_multiplier,
+                                       with_background=False)
+            dirty.add_all(self.game.score_display.dirty_rects)
 
-    def _draw_scanlines(self):
-        scanlines = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for y in range(0, HEIGHT, 2):
-            pygame.draw.line(scanlines, (0, 0, 0, 30), (0, y), (WIDTH, y))
-        self.game.screen.blit(scanlines, (0, 0))
+    def _draw_scanlines(self, surface):
+        width, height = surface.get_size()
+        scanlines = pygame.Surface((width, height), pygame.SRCALPHA)
+        for y in range(0, height, 2):
+            pygame.draw.line(scanlines, (0, 0, 0, 30), (0, y), (width, y))
+        surface.blit(scanlines, (0, 0))
 
     def handle_click(self, mouse_pos):
         if self.game.victory and self.next_level_button.collidepoint(mouse_pos):
@@ -0,0 +1,33 @@
+"""Outils pour faire tourner la simulation sans fenêtre ni périphérique audio"""
+
+
+class SilentSound:
+    """Remplace pygame.mixer.Sound quand le mixer n'est pas initialisé"""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+
+class KeyState:
+    """État du clavier compatible avec le résultat de pygame.key.get_pressed()"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __repr__(self):
+        return f"KeyState({sorted(self.pressed)})"
+
+
+NO_KEYS = KeyState()
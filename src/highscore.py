@@ -0,0 +1,104 @@
+import os
+import tempfile
+import threading
+from src.constants import HIGHSCORE_FILE
+
+# umask du processus, lue au chargement (os.umask ne sait que la remplacer :
+# pas depuis le thread d'écriture)
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def load_high_score(path=HIGHSCORE_FILE):
+    """Lit le meilleur score (0 si le fichier est absent ou illisible)"""
+    try:
+        with open(path, 'r') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 0
+
+
+def file_mode(path):
+    """Droits à donner au fichier : ceux du fichier existant, sinon 0666 moins l'umask"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except OSError:
+        return 0o666 & ~UMASK
+
+
+def write_high_score(path, score):
+    """Écrit le score de façon atomique (fichier temporaire puis rename)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.highscore-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(score))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crée le fichier en 0600 : os.replace garderait ces droits
+        os.chmod(temp_path, file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class HighScoreWriter:
+    """Sauvegarde le meilleur score dans un thread d'arrière-plan.
+
+    submit() ne fait que noter la dernière valeur : plusieurs scores soumis
+    avant l'écriture suivante sont fusionnés en une seule écriture.
+    """
+
+    def __init__(self, path=HIGHSCORE_FILE):
+        self.path = path
+        self.condition = threading.Condition()
+        self.pending = None
+        self.writing = False
+        self.closed = False
+        self.errors = 0
+        self.thread = threading.Thread(target=self._run, name="highscore-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, score):
+        """Demande l'écriture de score (non bloquant)"""
+        with self.condition:
+            if self.closed:
+                return
+            self.pending = score
+            self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Attend que le dernier score soumis soit écrit sur le disque"""
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: self.pending is None and not self.writing, timeout)
+
+    def close(self, timeout=None):
+        """Écrit le score en attente puis arrête le thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending is not None or self.closed)
+                if self.pending is None:
+                    return
+                score = self.pending
+                self.pending = None
+                self.writing = True
+
+            try:
+                write_high_score(self.path, score)
+            except OSError:
+                self.errors += 1
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
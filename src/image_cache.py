@@ -0,0 +1,86 @@
+import hashlib
+import os
+import tempfile
+import pygame
+from src.constants import IMAGE_CACHE_DIR
+
+# Incrémenté si le format des fichiers du cache change
+CACHE_VERSION = 1
+
+# frombytes / tobytes n'existent que depuis pygame 2.1.3
+image_from_bytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+image_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+class ImageDiskCache:
+    """Cache disque des images déjà redimensionnées, en pixels bruts.
+
+    Clé : empreinte du fichier source et taille cible. Au lancement suivant,
+    l'image est relue telle quelle, sans décodage JPEG ni redimensionnement.
+    Un fichier source modifié change d'empreinte : l'ancienne entrée est ignorée.
+    """
+
+    def __init__(self, directory=IMAGE_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, source, size, pixel_format):
+        """Chemin de l'entrée pour ce contenu source, cette taille et ce format"""
+        digest = hashlib.sha1(source).hexdigest()[:20]
+        name = f"v{CACHE_VERSION}-{digest}-{size[0]}x{size[1]}-{pixel_format}.raw"
+        return os.path.join(self.directory, name)
+
+    def load(self, path, size, alpha=False):
+        """Image de `path` à la taille `size` (non convertie au format de l'écran)"""
+        size = tuple(size)
+        pixel_format = "RGBA" if alpha else "RGB"
+        with open(path, "rb") as f:
+            source = f.read()
+        entry = None
+        if self.directory is not None:
+            entry = self.entry_path(source, size, pixel_format)
+            try:
+                with open(entry, "rb") as f:
+                    pixels = f.read()
+                if len(pixels) == size[0] * size[1] * len(pixel_format):
+                    self.hits += 1
+                    return image_from_bytes(pixels, size, pixel_format)
+            except OSError:
+                pass
+
+        self.misses += 1
+        image = pygame.image.load(path)
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        if entry is not None:
+            self.store(entry, image_to_bytes(image, pixel_format))
+        return image
+
+    def store(self, entry, pixels):
+        """Écrit une entrée de façon atomique ; un cache non inscriptible est ignoré"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".image-", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pixels)
+            os.replace(temp_path, entry)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Supprime toutes les entrées du cache disque"""
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".raw"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
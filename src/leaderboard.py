@@ -0,0 +1,149 @@
+import queue
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime
+from src.constants import LEADERBOARD_FILE
+
+# Une partie terminée : score, niveau atteint, durée (secondes de jeu) et date ISO
+Run = namedtuple("Run", "score level duration played_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    played_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, id);
+CREATE INDEX IF NOT EXISTS runs_by_level ON runs (level, score DESC, id);
+"""
+
+
+def new_run(score, level, duration):
+    """Partie terminée maintenant"""
+    return Run(score, level, round(duration, 2), datetime.now().isoformat(timespec="seconds"))
+
+
+def connect(path=LEADERBOARD_FILE):
+    """Connexion à la base des parties (créée au besoin, journal WAL)"""
+    connection = sqlite3.connect(path)
+    # WAL : les lectures de l'écran PB ne bloquent pas les insertions
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class Leaderboard:
+    """Lecture du classement : top N, par niveau, par pages (index score / niveau)"""
+
+    def __init__(self, path=LEADERBOARD_FILE):
+        self.path = path
+        self.connection = None
+
+    def _connection(self):
+        if self.connection is None:
+            self.connection = connect(self.path)
+        return self.connection
+
+    def count(self, level=None):
+        """Nombre de parties (d'un niveau atteint donné, si level)"""
+        if level is None:
+            row = self._connection().execute("SELECT COUNT(*) FROM runs").fetchone()
+        else:
+            row = self._connection().execute(
+                "SELECT COUNT(*) FROM runs WHERE level = ?", (level,)).fetchone()
+        return row[0]
+
+    def top(self, limit=10, offset=0, level=None):
+        """Meilleures parties, du meilleur score au moins bon (à égalité : la plus ancienne)"""
+        if level is None:
+            rows = self._connection().execute(
+                "SELECT score, level, duration, played_at FROM runs"
+                " ORDER BY score DESC, id LIMIT ? OFFSET ?", (limit, offset))
+        else:
+            rows = self._connection().execute(
+                "SELECT score, level, duration, played_at FROM runs WHERE level = ?"
+                " ORDER BY score DESC, id LIMIT ? OFFSET ?", (level, limit, offset))
+        return [Run(*row) for row in rows]
+
+    def levels(self):
+        """Niveaux atteints présents dans le classement"""
+        rows = self._connection().execute("SELECT DISTINCT level FROM runs ORDER BY level")
+        return [row[0] for row in rows]
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class LeaderboardWriter:
+    """Insère les parties terminées dans un thread d'arrière-plan.
+
+    submit() ne fait que mettre la partie en file ; les parties en attente
+    sont insérées ensemble, dans une seule transaction. Une erreur est
+    comptée dans errors et le thread continue avec les parties suivantes.
+    """
+
+    def __init__(self, path=LEADERBOARD_FILE):
+        self.path = path
+        self.queue = queue.Queue()
+        # Parties soumises pas encore traitées (attendues par flush)
+        self.condition = threading.Condition()
+        self.pending = 0
+        self.errors = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, run):
+        """Demande l'insertion de run (non bloquant)"""
+        if not self.closed:
+            with self.condition:
+                self.pending += 1
+            self.queue.put(run)
+
+    def flush(self, timeout=None):
+        """Attend que les parties soumises soient traitées ; False si timeout écoulé avant"""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending == 0, timeout)
+
+    def close(self, timeout=None):
+        """Écrit les parties en attente puis arrête le thread"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join(timeout)
+
+    def _run(self):
+        connection = None
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            runs = [run for run in batch if run is not None]
+            try:
+                if runs:
+                    if connection is None:
+                        connection = connect(self.path)
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO runs (score, level, duration, played_at)"
+                            " VALUES (?, ?, ?, ?)", runs)
+            except Exception:
+                self.errors += 1
+            finally:
+                with self.condition:
+                    self.pending -= len(runs)
+                    self.condition.notify_all()
+            if len(runs) < len(batch):
+                if connection is not None:
+                    connection.close()
+                return
@@ -0,0 +1,167 @@
+import pygame
+from src.assets import assets
+from src.constants import WIDTH, HEIGHT, BACKGROUND_IMAGE
+from src.leaderboard import Leaderboard
+
+# Parties affichées par page
+PAGE_SIZE = 10
+
+# Colonnes du tableau : (titre, abscisse du centre)
+COLUMNS = (("#", 110), ("Score", 230), ("Niveau", 360), ("Durée", 480), ("Date", 640))
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+class LeaderboardScreen:
+    """Écran PB : classement local, page par page.
+
+    Chaque page n'est lue dans la base qu'au premier affichage, puis gardée
+    (avec son rendu) jusqu'au prochain retour sur l'écran.
+    """
+
+    def __init__(self, leaderboard=None):
+        self.leaderboard = Leaderboard() if leaderboard is None else leaderboard
+
+        self.title_font = assets.font(None, 64)
+        self.row_font = assets.font(None, 32)
+        self.hint_font = assets.font(None, 24)
+
+        # Couleurs synthwave (comme le menu)
+        self.title_color = (255, 51, 102)
+        self.text_color = (102, 204, 255)
+        self.highlight_color = (255, 255, 102)
+
+        self.back_button = pygame.Rect(WIDTH // 2 - 80, HEIGHT - 60, 160, 40)
+
+        # Fond du menu, plus sombre sous le tableau
+        self.background = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT)).copy()
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(170)
+        self.background.blit(overlay, (0, 0))
+
+        self.level = None  # Filtre : None pour tous les niveaux
+        self.levels = []
+        self.page = 0
+        self.total = 0
+        self.pages = {}
+        self.page_surface = None
+        self.page_key = None
+
+    def enter(self):
+        """Arrivée sur l'écran : première page, tous niveaux, données relues"""
+        self.level = None
+        self.page = 0
+        self.reload()
+
+    def leave(self):
+        pass
+
+    def reload(self):
+        """Oublie les pages lues (nouvelles parties ou autre filtre)"""
+        self.total = self.leaderboard.count(self.level)
+        self.levels = self.leaderboard.levels()
+        self.pages.clear()
+        self.page_key = None
+
+    @property
+    def page_count(self):
+        return max(1, -(-self.total // PAGE_SIZE))
+
+    def get_page(self, page):
+        """Parties de la page (lues dans la base au premier accès)"""
+        runs = self.pages.get(page)
+        if runs is None:
+            runs = self.pages[page] = self.leaderboard.top(PAGE_SIZE, page * PAGE_SIZE, self.level)
+        return runs
+
+    def set_level(self, level):
+        self.level = level
+        self.page = 0
+        self.reload()
+
+    def cycle_level(self, step):
+        """Filtre suivant / précédent parmi : tous, puis chaque niveau atteint"""
+        choices = [None, *self.levels]
+        index = choices.index(self.level) if self.level in choices else 0
+        self.set_level(choices[(index + step) % len(choices)])
+
+    def handle_event(self, event):
+        """Retourne "MENU" pour revenir au menu principal"""
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE, pygame.K_RETURN):
+                return "MENU"
+            elif event.key in (pygame.K_LEFT, pygame.K_PAGEUP):
+                self.page = max(self.page - 1, 0)
+            elif event.key in (pygame.K_RIGHT, pygame.K_PAGEDOWN):
+                self.page = min(self.page + 1, self.page_count - 1)
+            elif event.key == pygame.K_UP:
+                self.cycle_level(-1)
+            elif event.key == pygame.K_DOWN:
+                self.cycle_level(1)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_button.collidepoint(event.pos):
+                return "MENU"
+
+        return None
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        key = (self.level, self.page)
+        if key != self.page_key:
+            self.page_surface = self.render_page()
+            self.page_key = key
+        screen.blit(self.background, (0, 0))
+        screen.blit(self.page_surface, (0, 0))
+
+    def render_page(self):
+        """Rend la page courante (titre, tableau, pagination) dans une surface"""
+        surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+        title = self.title_font.render("MEILLEURS SCORES", True, self.title_color)
+        surface.blit(title, title.get_rect(center=(WIDTH // 2, 60)))
+
+        level_filter = "Tous les niveaux" if self.level is None else f"Niveau {self.level}"
+        subtitle = self.hint_font.render(f"{level_filter}  -  {self.total} parties", True, self.text_color)
+        surface.blit(subtitle, subtitle.get_rect(center=(WIDTH // 2, 105)))
+
+        header_y = 140
+        for name, x in COLUMNS:
+            header = self.row_font.render(name, True, self.title_color)
+            surface.blit(header, header.get_rect(center=(x, header_y)))
+        pygame.draw.line(surface, self.title_color, (60, header_y + 18), (WIDTH - 60, header_y + 18), 1)
+
+        runs = self.get_page(self.page)
+        if not runs:
+            empty = self.row_font.render("Aucune partie pour l'instant", True, self.text_color)
+            surface.blit(empty, empty.get_rect(center=(WIDTH // 2, 260)))
+
+        first_rank = self.page * PAGE_SIZE + 1
+        for i, run in enumerate(runs):
+            y = header_y + 45 + i * 30
+            color = self.highlight_color if first_rank + i == 1 else self.text_color
+            cells = (str(first_rank + i), str(run.score), str(run.level),
+                     format_duration(run.duration), run.played_at.replace("T", " ")[:16])
+            for text, (_, x) in zip(cells, COLUMNS):
+                cell = self.row_font.render(text, True, color)
+                surface.blit(cell, cell.get_rect(center=(x, y)))
+
+        pages = self.hint_font.render(f"Page {self.page + 1} / {self.page_count}", True, self.text_color)
+        surface.blit(pages, pages.get_rect(center=(WIDTH // 2, HEIGHT - 115)))
+        hint = self.hint_font.render("Flèches gauche/droite : page   haut/bas : niveau", True,
+                                     self.text_color)
+        surface.blit(hint, hint.get_rect(center=(WIDTH // 2, HEIGHT - 92)))
+
+        pygame.draw.rect(surface, (*self.title_color, 120), self.back_button, border_radius=2)
+        back = self.row_font.render("Retour", True, (255, 255, 255))
+        surface.blit(back, back.get_rect(center=self.back_button.center))
+        return surface
+
+    def close(self):
+        self.leaderboard.close()
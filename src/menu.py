@@ -1,12 +1,13 @@
 import pygame
 import math
+from src.assets import assets
 from src.constants import WIDTH, HEIGHT, BACKGROUND_IMAGE
 
 class MainMenu:
     def __init__(self):
         # Polices réduites
-        self.title_font = pygame.font.Font(None, 80)
-        self.menu_font = pygame.font.Font(None, 36)
+        self.title_font = assets.font(None, 80)
+        self.menu_font = assets.font(None, 36)
         
         # Couleurs synthwave
         self.title_color = (255, 51, 102)  # Rose néon
@@ -14,7 +15,7 @@ class MainMenu:
         self.highlight_color = (255, 51, 153)  # Rose vif
         
         # Options du menu
-        self.menu_options = ['JOUER', 'PB (TODO)', 'QUITTER']
+        self.menu_options = ['JOUER', 'PB', 'QUITTER']
         self.selected_option = 0
         
         # Animation
@@ -25,9 +26,19 @@ class MainMenu:
         self.buttons = []
         self.create_buttons()
 
-        # Charger l'image de fond
-        self.background_image = pygame.image.load(BACKGROUND_IMAGE)
-        self.background_image = pygame.transform.scale(self.background_image, (WIDTH, HEIGHT))
+        # Charger l'image de fond, assombrie une fois pour toutes
+        self.background_image = assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT))
+        self.background = self.build_background()
+
+    def build_background(self):
+        """Fond du menu avec son overlay sombre, au format de l'écran"""
+        # Copie : l'image du registre est partagée
+        background = self.background_image.copy()
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(100)
+        background.blit(overlay, (0, 0))
+        return background
 
     def create_buttons(self):
         button_width = 160
@@ -102,6 +113,15 @@ class MainMenu:
         else:
             screen.blit(text_surface, text_rect)
 
+    def enter(self):
+        """Retour au menu : sélection et animation repartent du début"""
+        self.selected_option = 0
+        self.animation_time = 0
+        self.title_offset = 0
+
+    def leave(self):
+        pass
+
     def update(self):
         self.animation_time += 0.02
         self.title_offset = math.sin(self.animation_time) * 5
@@ -130,14 +150,8 @@ class MainMenu:
         return None
 
     def draw(self, screen):
-        # Fond
-        screen.blit(self.background_image, (0, 0))
-        
-        # Overlay dégradé subtil
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(100)
-        screen.blit(overlay, (0, 0))
+        # Fond (déjà assombri) : un seul blit plein écran
+        screen.blit(self.background, (0, 0))
         
         # Éléments du menu
         self.draw_title(screen)
@@ -0,0 +1,155 @@
+import numpy as np
+import pygame
+
+# Quantification des sprites : tailles et niveaux d'alpha pré-rendus
+SIZE_BUCKETS = 8
+ALPHA_LEVELS = 8
+MAX_PARTICLE_SIZE = 6.0
+
+
+class ParticleSystem:
+    """Moteur de particules stocké dans des tableaux NumPy pré-alloués.
+
+    Les particules vivantes occupent les `count` premières lignes des tableaux ;
+    les particules expirées sont compactées en une seule opération vectorisée.
+    Le rendu utilise un petit cache de sprites (couleur, taille, alpha).
+    """
+
+    def __init__(self, capacity=4096, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+
+        # Palette des couleurs utilisées (index stocké par particule)
+        self.colors = []
+        self.color_index = {}
+        self.sprites = {}
+
+    def get_color_index(self, color):
+        index = self.color_index.get(color)
+        if index is None:
+            index = len(self.colors)
+            self.colors.append(color)
+            self.color_index[color] = index
+        return index
+
+    def emit(self, x, y, count, color, spread=(0, 0), vel_x=(-20, 20), vel_y=(-50, -30),
+             size=(1, 3), lifetime=(0.3, 0.6), gravity=100):
+        """Crée `count` particules autour de (x, y) ; ignorées au-delà de la capacité"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+
+        rng = self.rng
+        start, end = self.count, self.count + count
+        self.pos[start:end, 0] = x + rng.uniform(-spread[0] / 2, spread[0] / 2, count)
+        self.pos[start:end, 1] = y + rng.uniform(-spread[1] / 2, spread[1] / 2, count)
+        self.vel[start:end, 0] = rng.uniform(vel_x[0], vel_x[1], count)
+        self.vel[start:end, 1] = rng.uniform(vel_y[0], vel_y[1], count)
+        self.size[start:end] = rng.uniform(size[0], size[1], count)
+        self.lifetime[start:end] = rng.uniform(lifetime[0], lifetime[1], count)
+        self.age[start:end] = 0
+        self.gravity[start:end] = gravity
+        self.color[start:end] = self.get_color_index(color)
+        self.count = end
+        return count
+
+    def emit_burst(self, x, y, count, color, speed=(60, 180), spread=(0, 0),
+                   size=(1, 3), lifetime=(0.3, 0.7), gravity=200):
+        """Explosion : vitesses réparties dans toutes les directions"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        start = self.count
+        self.emit(x, y, count, color, spread=spread, vel_x=(0, 0), vel_y=(0, 0),
+                  size=size, lifetime=lifetime, gravity=gravity)
+        angles = self.rng.uniform(0, 2 * np.pi, count)
+        speeds = self.rng.uniform(speed[0], speed[1], count)
+        self.vel[start:start + count, 0] = np.cos(angles) * speeds
+        self.vel[start:start + count, 1] = np.sin(angles) * speeds
+        return count
+
+    def update(self, dt):
+        """Avance toutes les particules de dt secondes et retire les expirées"""
+        n = self.count
+        if n == 0:
+            return
+
+        self.age[:n] += dt
+        alive = self.age[:n] < self.lifetime[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            n = len(keep)
+            for array in (self.pos, self.vel, self.age, self.lifetime,
+                          self.size, self.gravity, self.color):
+                array[:n] = array[keep]
+            self.count = n
+
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n, 1] += self.gravity[:n] * dt  # Légère gravité
+
+    def clear(self):
+        self.count = 0
+
+    def reset(self, seed=None):
+        """Vide le système et recommence le tirage aléatoire (sprites et palette gardés)"""
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+    def get_sprite(self, color_index, size_index, alpha_index):
+        """Sprite d'une particule (lueur + cœur), rendu une seule fois"""
+        key = (color_index, size_index, alpha_index)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            color = self.colors[color_index]
+            size = MAX_PARTICLE_SIZE * (size_index + 1) / SIZE_BUCKETS
+            alpha = int(255 * (alpha_index + 1) / ALPHA_LEVELS)
+            sprite = pygame.Surface((int(size * 4) + 1, int(size * 4) + 1), pygame.SRCALPHA)
+            center = (size * 2, size * 2)
+            # Lueur externe puis cœur de la particule
+            pygame.draw.circle(sprite, (*color, alpha // 4), center, size * 2)
+            pygame.draw.circle(sprite, (*color, alpha // 2), center, size * 1.5)
+            pygame.draw.circle(sprite, (*color, alpha), center, size)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface):
+        """Dessine toutes les particules en un seul appel à blits()"""
+        n = self.count
+        if n == 0:
+            return
+
+        ratio = np.clip(1 - self.age[:n] / self.lifetime[:n], 0, 1)
+        alpha_index = np.clip(np.ceil(ratio * ALPHA_LEVELS) - 1, 0, ALPHA_LEVELS - 1).astype(np.int32)
+        size = self.size[:n] * ratio * 2
+        size_index = np.clip(np.ceil(size / MAX_PARTICLE_SIZE * SIZE_BUCKETS) - 1,
+                             0, SIZE_BUCKETS - 1).astype(np.int32)
+        half = MAX_PARTICLE_SIZE * 2 * (size_index + 1) / SIZE_BUCKETS
+        x = (self.pos[:n, 0] - half).astype(np.int32).tolist()
+        y = (self.pos[:n, 1] - half).astype(np.int32).tolist()
+
+        get_sprite = self.get_sprite
+        surface.blits([
+            (get_sprite(c, s, a), (px, py))
+            for c, s, a, px, py in zip(self.color[:n].tolist(), size_index.tolist(),
+                                       alpha_index.tolist(), x, y)
+        ], doreturn=False)
+
+    def get_dirty_rect(self):
+        """Boîte englobante des particules vivantes (None s'il n'y en a pas)"""
+        n = self.count
+        if n == 0:
+            return None
+        margin = int(MAX_PARTICLE_SIZE * 2) + 1
+        left, top = self.pos[:n].min(axis=0)
+        right, bottom = self.pos[:n].max(axis=0)
+        return pygame.Rect(int(left) - margin, int(top) - margin,
+                           int(right - left) + margin * 2 + 1, int(bottom - top) + margin * 2 + 1)
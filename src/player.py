@@ -1,15 +1,12 @@
 import pygame
 import math
-import time
-import random
-from src.constants import WIDTH
+from src.constants import WIDTH, SIMULATION_RATE
+from src.particles import ParticleSystem
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self):
+    def __init__(self, particles=None):
         super().__init__()
-        self.rect = pygame.Rect(350, 550, 100, 15)
         self.speed = 20
-        self.original_width = self.rect.width
         
         # Couleurs néon
         self.base_color = (102, 204, 255)      # Bleu néon
@@ -17,63 +14,62 @@ class Player(pygame.sprite.Sprite):
         self.strong_base_color = (255, 215, 0)  # Or
         self.strong_glow_color = (255, 255, 0)  # Jaune vif
         
+        self.pulse_speed = 4.0
+        self.max_trail_length = 5
+        
+        # Particules (système partagé fourni par le jeu, sinon système propre)
+        self.owns_particles = particles is None
+        self.particles = ParticleSystem(capacity=256) if particles is None else particles
+        self.particle_spawn_delay = 0.05
+        
+        self.reset()
+
+    def reset(self):
+        """Remet la raquette dans son état de départ (nouvelle partie ou niveau)"""
+        self.rect = pygame.Rect(350, 550, 100, 15)
+        self.previous_rect = self.rect.copy()
+        self.original_width = self.rect.width
+        
         # Variables d'animation
         self.animation_time = 0
-        self.pulse_speed = 4.0
         self.glow_intensity = 1.0
         
         # Effets de traînée
         self.trail_positions = []
-        self.max_trail_length = 5
         self.last_pos = self.rect.centerx
         
         # État du bonus
         self.is_strong = False
-        self.strong_time = 0
+        self.strong_time = 0  # En ms de simulation (Game.get_ticks)
         
-        # Particules
-        self.particles = []
         self.particle_spawn_timer = 0
-        self.particle_spawn_delay = 0.05
 
     def create_particle(self):
-        """Crée une particule décorative"""
-        x = self.rect.centerx + random.uniform(-self.rect.width/2, self.rect.width/2)
-        return {
-            'pos': [x, self.rect.top],
-            'vel': [random.uniform(-20, 20), random.uniform(-50, -30)],
-            'size': random.uniform(1, 3),
-            'lifetime': random.uniform(0.3, 0.6),
-            'birth_time': time.time(),
-            'color': self.strong_glow_color if self.is_strong else self.glow_color
-        }
+        """Crée une particule décorative au-dessus de la raquette"""
+        color = self.strong_glow_color if self.is_strong else self.glow_color
+        self.particles.emit(self.rect.centerx, self.rect.top, 1, color,
+                            spread=(self.rect.width, 0))
 
     def update_particles(self, dt):
         """Met à jour les particules décoratives"""
-        current_time = time.time()
-        
-        # Mettre à jour les particules existantes
-        for particle in self.particles[:]:
-            particle['pos'][0] += particle['vel'][0] * dt
-            particle['pos'][1] += particle['vel'][1] * dt
-            particle['vel'][1] += 100 * dt  # Légère gravité
-            
-            # Supprimer les particules expirées
-            if current_time - particle['birth_time'] > particle['lifetime']:
-                self.particles.remove(particle)
+        # Le système partagé est mis à jour par le jeu
+        if self.owns_particles:
+            self.particles.update(dt)
         
         # Créer de nouvelles particules
         self.particle_spawn_timer += dt
         if self.particle_spawn_timer >= self.particle_spawn_delay:
-            self.particles.append(self.create_particle())
+            self.create_particle()
             self.particle_spawn_timer = 0
 
-    def move(self):
-        """Gère le mouvement du joueur"""
+    def move(self, keys=None):
+        """Gère le mouvement du joueur (keys : état du clavier, lu via pygame si absent)"""
         old_x = self.rect.x
+        self.previous_rect = self.rect.copy()
         
         # Mouvement
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT]:
             self.rect.x -= self.speed
         if keys[pygame.K_RIGHT]:
@@ -94,7 +90,7 @@ class Player(pygame.sprite.Sprite):
     def update(self):
         """Met à jour l'état et les animations"""
         self.animation_time += 0.05
-        dt = 1/60  # Delta time approximatif
+        dt = 1 / SIMULATION_RATE
         
         # Pulsation de la lueur
         self.glow_intensity = 0.8 + math.sin(self.animation_time * self.pulse_speed) * 0.2
@@ -102,9 +98,8 @@ class Player(pygame.sprite.Sprite):
         # Mise à jour des particules
         self.update_particles(dt)
         
-        # Vérifier la durée du bonus strong
-        if self.is_strong and time.time() - self.strong_time > 10:
-            self.is_strong = False
+        # La durée du bonus strong est vérifiée par Game.update_effects
+        # (temps de simulation, comme tous les minuteurs du jeu)
 
     def draw_glow(self, surface, color, alpha):
         """Dessine l'effet de lueur"""
@@ -135,31 +130,20 @@ class Player(pygame.sprite.Sprite):
 
     def draw_particles(self, surface):
         """Dessine les particules décoratives"""
-        current_time = time.time()
-        
-        for particle in self.particles:
-            lifetime_ratio = 1 - (current_time - particle['birth_time']) / particle['lifetime']
-            if lifetime_ratio <= 0:
-                continue
-                
-            alpha = int(255 * lifetime_ratio)
-            size = particle['size'] * lifetime_ratio * 2
-            
-            particle_surf = pygame.Surface((int(size * 4), int(size * 4)), pygame.SRCALPHA)
-            
-            # Lueur externe
-            pygame.draw.circle(particle_surf, (*particle['color'], alpha//4), 
-                             (size * 2, size * 2), size * 2)
-            pygame.draw.circle(particle_surf, (*particle['color'], alpha//2), 
-                             (size * 2, size * 2), size * 1.5)
-            
-            # Cœur de la particule
-            pygame.draw.circle(particle_surf, (*particle['color'], alpha), 
-                             (size * 2, size * 2), size)
-            
-            surface.blit(particle_surf, 
-                        (particle['pos'][0] - size * 2, 
-                         particle['pos'][1] - size * 2))
+        self.particles.draw(surface)
+
+    def get_dirty_rect(self):
+        """Zone de l'écran touchée par draw() (lueur, traînée et particules)"""
+        dirty = self.rect.inflate(12, 8)
+        for x, y in self.trail_positions:
+            trail_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+            trail_rect.center = (x, y)
+            dirty.union_ip(trail_rect)
+        if self.owns_particles:
+            particles_rect = self.particles.get_dirty_rect()
+            if particles_rect is not None:
+                dirty.union_ip(particles_rect)
+        return dirty
 
     def draw(self, screen):
         """Dessine le joueur normal"""
@@ -192,8 +176,9 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(screen, (255, 255, 255, int(100 * self.glow_intensity)), 
                         highlight_rect)
         
-        # Dessiner les particules
-        self.draw_particles(screen)
+        # Dessiner les particules (le système partagé est dessiné par le renderer)
+        if self.owns_particles:
+            self.draw_particles(screen)
 
     def draw_strong(self, screen):
         """Dessine le joueur en mode 'strong'"""
@@ -0,0 +1,207 @@
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from src.assets import assets
+
+# Étapes mesurées à chaque frame, dans l'ordre d'affichage
+STAGES = (
+    "input", "paddle", "ball_physics", "collisions", "particles", "bricks_update",
+    "background", "brick_draw", "ball_draw", "sprites", "hud", "overlays", "present",
+)
+
+
+class _Stage:
+    """Context manager réutilisable qui ajoute sa durée à l'étape de la frame"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Profiler inactif : coût quasi nul quand l'instrumentation est désactivée"""
+
+    enabled = False
+    overlay_visible = False
+    _stage = _NullStage()
+
+    def stage(self, name):
+        return self._stage
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def draw_overlay(self, screen):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Mesure le temps passé par étape à chaque frame.
+
+    Garde une fenêtre glissante pour l'overlay (moyennes, p95, p99, frames
+    hors budget) et un historique plus long pour l'export CSV / JSON.
+    """
+
+    enabled = True
+
+    def __init__(self, window=300, budget_ms=1000 / 60, max_recorded=60 * 60 * 10):
+        self.budget_ms = budget_ms
+        self.window = deque(maxlen=window)
+        self.recorded = deque(maxlen=max_recorded)
+        self.stages = {name: _Stage(self, name) for name in STAGES}
+        self.current = {}
+        self.frame_start = None
+        self.frame_index = 0
+        self.dropped_frames = 0
+
+        # Overlay (texte rafraîchi quelques fois par seconde seulement)
+        self.overlay_visible = False
+        self.overlay_refresh = 15
+        self.overlay_surface = None
+        self.font = None
+
+    def stage(self, name):
+        """Context manager qui chronomètre une étape de la frame courante"""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _Stage(self, name)
+        return stage
+
+    def begin_frame(self):
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_start = None
+        self.current["frame"] = total
+        if total > self.budget_ms:
+            self.dropped_frames += 1
+
+        self.window.append(self.current)
+        self.recorded.append((self.frame_index, self.current))
+        self.frame_index += 1
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+
+    def stats(self):
+        """Statistiques de la fenêtre glissante : {étape: {avg, p95, p99}}"""
+        result = {}
+        for name in ("frame", *self.stages):
+            values = sorted(frame.get(name, 0.0) for frame in self.window)
+            if not values:
+                continue
+            result[name] = {
+                "avg": sum(values) / len(values),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+            }
+        return result
+
+    def dropped_in_window(self):
+        return sum(1 for frame in self.window if frame["frame"] > self.budget_ms)
+
+    def render_overlay(self):
+        if self.font is None:
+            self.font = assets.font(None, 20)
+
+        stats = self.stats()
+        lines = [f"{'stage':<13}{'avg':>7}{'p95':>7}{'p99':>7}"]
+        for name, values in stats.items():
+            lines.append(f"{name:<13}{values['avg']:7.2f}{values['p95']:7.2f}{values['p99']:7.2f}")
+        lines.append(f"over budget: {self.dropped_in_window()}/{len(self.window)} "
+                     f"(total {self.dropped_frames})")
+
+        line_height = self.font.get_linesize()
+        rendered = [self.font.render(line, True, (200, 255, 200)) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        surface = pygame.Surface((width, line_height * len(lines) + 12), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 190))
+        for i, line in enumerate(rendered):
+            surface.blit(line, (6, 6 + i * line_height))
+        return surface
+
+    def draw_overlay(self, screen):
+        """Dessine l'overlay si visible ; retourne la zone touchée (ou None)"""
+        if not self.overlay_visible:
+            return None
+        if self.overlay_surface is None or self.frame_index % self.overlay_refresh == 0:
+            self.overlay_surface = self.render_overlay()
+        rect = self.overlay_surface.get_rect(topright=(screen.get_width() - 8, 108))
+        screen.blit(self.overlay_surface, rect)
+        return rect
+
+    def rows(self):
+        """Lignes de l'historique : index de frame, durée totale et chaque étape (ms)"""
+        names = list(self.stages)
+        for index, frame in self.recorded:
+            yield [index, round(frame.get("frame", 0.0), 4),
+                   *(round(frame.get(name, 0.0), 4) for name in names)]
+
+    def export_csv(self, path):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms", *(f"{name}_ms" for name in self.stages)])
+            writer.writerows(self.rows())
+        return path
+
+    def export_json(self, path):
+        names = list(self.stages)
+        data = {
+            "budget_ms": self.budget_ms,
+            "dropped_frames": self.dropped_frames,
+            "summary": self.stats(),
+            "columns": ["frame", "frame_ms", *(f"{name}_ms" for name in names)],
+            "frames": list(self.rows()),
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def export(self, directory="."):
+        """Exporte l'historique en CSV et JSON, horodatés ; retourne les chemins"""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = f"{directory}/profile-{stamp}"
+        return self.export_csv(base + ".csv"), self.export_json(base + ".json")
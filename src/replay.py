@@ -0,0 +1,181 @@
+"""Enregistrement et relecture déterministes d'une partie.
+
+Une partie est entièrement déterminée par sa graine, l'état du clavier à
+chaque pas de simulation et les commandes qui la modifient hors de
+Game.update (nouvelle partie, niveau suivant, saut de niveau). Le fichier de
+replay ne contient que cela, compressé, plus l'empreinte de l'état final.
+
+Relire un replay à vitesse maximale et vérifier l'empreinte :
+
+    python -m src.replay partie.nprp
+"""
+import argparse
+import hashlib
+import struct
+import sys
+import time
+import zlib
+import pygame
+from src.headless import KeyState
+from src.game import Game
+
+MAGIC = b"NPRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBIII32s")
+COMMAND = struct.Struct("<IBi")
+
+# Touches lues par la simulation (bit i du masque = RECORDED_KEYS[i])
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT)
+KEY_STATES = [KeyState(key for i, key in enumerate(RECORDED_KEYS) if mask >> i & 1)
+              for mask in range(1 << len(RECORDED_KEYS))]
+
+COMMANDS = ("reset_game", "start_next_level", "jump_to_level")
+COMMAND_CODES = {name: code for code, name in enumerate(COMMANDS)}
+
+
+class ReplayError(Exception):
+    pass
+
+
+def state_hash(game):
+    """Empreinte SHA-256 de l'état de la simulation (hors rendu et record chargé)"""
+    state = (
+        game.frame_count, game.score, game.lives, game.level, game.score_multiplier,
+        game.multiplier_time, game.game_over, game.victory,
+        tuple(game.player.rect), game.player.is_strong,
+        tuple((ball.pos_x, ball.pos_y, ball.speed_x, ball.speed_y, tuple(ball.rect))
+              for ball in game.balls),
+        tuple(game.bricks.active[:len(game.bricks)].tolist()),
+        tuple((bonus.type, tuple(bonus.rect)) for bonus in game.bonus_malus_list),
+        game.rng.getstate(),
+    )
+    return hashlib.sha256(repr(state).encode()).digest()
+
+
+class Replay:
+    """Graine, masques de touches par pas de simulation et commandes horodatées"""
+
+    def __init__(self, seed, keys=None, commands=None, final_hash=None):
+        self.seed = seed
+        self.keys = bytearray() if keys is None else keys
+        self.commands = [] if commands is None else commands  # (pas, code, valeur)
+        self.final_hash = final_hash
+
+    @property
+    def ticks(self):
+        return len(self.keys)
+
+    def save(self, path):
+        payload = bytes(self.keys) + b"".join(COMMAND.pack(*command)
+                                              for command in self.commands)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(self.keys),
+                                len(self.commands), self.final_hash or bytes(32)))
+            f.write(zlib.compress(payload, 9))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ReplayError(f"{path} : fichier de replay tronqué")
+        magic, version, seed, ticks, n_commands, final_hash = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ReplayError(f"{path} : format de replay inconnu")
+        try:
+            payload = zlib.decompress(data[HEADER.size:])
+        except zlib.error as e:
+            raise ReplayError(f"{path} : données corrompues ({e})") from e
+        if len(payload) != ticks + n_commands * COMMAND.size:
+            raise ReplayError(f"{path} : données incomplètes")
+        commands = [COMMAND.unpack_from(payload, ticks + i * COMMAND.size)
+                    for i in range(n_commands)]
+        return cls(seed, bytearray(payload[:ticks]), commands,
+                   None if final_hash == bytes(32) else final_hash)
+
+
+class ReplayRecorder:
+    """Branché sur Game.recorder : note les touches de chaque pas et les commandes"""
+
+    def __init__(self, seed):
+        self.replay = Replay(seed)
+
+    def record_tick(self, keys):
+        mask = 0
+        for i, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                mask |= 1 << i
+        self.replay.keys.append(mask)
+
+    def record_command(self, command, value=0):
+        self.replay.commands.append((self.replay.ticks, COMMAND_CODES[command], value))
+
+    def save(self, game, path):
+        """Termine l'enregistrement avec l'empreinte de l'état final et l'écrit"""
+        self.replay.final_hash = state_hash(game)
+        return self.replay.save(path)
+
+
+def apply_command(game, code, value):
+    command = COMMANDS[code]
+    if command == "jump_to_level":
+        game.jump_to_level(value)
+    else:
+        getattr(game, command)()
+
+
+def play_replay(replay):
+    """Rejoue un replay sans limite de cadence ; retourne des statistiques"""
+    game = Game(headless=True, seed=replay.seed)
+
+    commands = sorted(replay.commands, key=lambda command: command[0])
+    next_command = 0
+    start = time.perf_counter()
+    for tick, mask in enumerate(replay.keys):
+        while next_command < len(commands) and commands[next_command][0] <= tick:
+            apply_command(game, *commands[next_command][1:])
+            next_command += 1
+        game.update(KEY_STATES[mask])
+    for command in commands[next_command:]:
+        apply_command(game, *command[1:])
+    elapsed = time.perf_counter() - start
+
+    final_hash = state_hash(game)
+    return {
+        "ticks": replay.ticks,
+        "seconds": elapsed,
+        "ticks_per_second": replay.ticks / elapsed if elapsed > 0 else float("inf"),
+        "hash": final_hash.hex(),
+        "expected": replay.final_hash.hex() if replay.final_hash else None,
+        "ok": replay.final_hash is None or final_hash == replay.final_hash,
+        "score": game.score,
+        "level": game.level,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relecture d'un replay de Neon Pulse")
+    parser.add_argument("path", help="fichier .nprp enregistré avec main.py --record")
+    args = parser.parse_args(argv)
+
+    try:
+        result = play_replay(Replay.load(args.path))
+    except (OSError, ReplayError) as e:
+        print(f"Erreur : {e}")
+        return 2
+    print(f"{result['ticks']} pas en {result['seconds']:.3f}s "
+          f"({result['ticks_per_second']:.0f} pas/s), "
+          f"niveau {result['level']}, score {result['score']}")
+    if result["expected"] is None:
+        print(f"empreinte finale {result['hash']} (pas de référence)")
+    elif result["ok"]:
+        print(f"empreinte finale identique : {result['hash']}")
+    else:
+        print(f"DIVERGENCE : {result['hash']} au lieu de {result['expected']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
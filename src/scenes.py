@@ -0,0 +1,47 @@
+class SceneManager:
+    """Scènes longue durée (menu, jeu) créées une seule fois puis gardées.
+
+    Changer de scène appelle leave() sur la scène quittée et enter() sur la
+    nouvelle : l'état est remis à zéro sur place, sans recharger d'assets ni
+    lire de fichier, donc la transition tient dans une frame.
+    """
+
+    def __init__(self):
+        self.factories = {}
+        self.scenes = {}
+        self.current_name = None
+
+    def register(self, name, factory):
+        """Déclare une scène ; factory() la construit au premier besoin"""
+        self.factories[name] = factory
+
+    def get(self, name):
+        """Scène `name`, construite au premier appel puis réutilisée"""
+        scene = self.scenes.get(name)
+        if scene is None:
+            scene = self.scenes[name] = self.factories[name]()
+        return scene
+
+    def loaded(self, name):
+        """Scène `name` si elle a déjà été construite, None sinon"""
+        return self.scenes.get(name)
+
+    def warm(self, *names):
+        """Construit à l'avance les scènes qui ne le sont pas encore"""
+        for name in names:
+            self.get(name)
+
+    def enter(self, name, **kwargs):
+        """Quitte la scène courante et entre dans `name` (kwargs passés à enter())"""
+        if self.current_name is not None:
+            self.current.leave()
+        scene = self.get(name)
+        self.current_name = name
+        scene.enter(**kwargs)
+        return scene
+
+    @property
+    def current(self):
+        if self.current_name is None:
+            return None
+        return self.scenes[self.current_name]
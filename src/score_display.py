@@ -1,45 +1,93 @@
 import pygame
 import math
-from src.constants import WIDTH
+from src.assets import assets
+from src.constants import WIDTH, INTERFACE_HEIGHT
+
+# Nombre de variantes pré-teintées pour la pulsation des valeurs (glow 0.7..1.0)
+GLOW_LEVELS = 6
+# Nombre d'échelles pré-calculées pour le zoom du multiplicateur (1.0..1.2)
+SCALE_LEVELS = 5
+
+
+def quantize_glow(value):
+    """Index de la variante la plus proche pour une lueur entre 0.7 et 1.0"""
+    level = round((value - 0.7) / 0.3 * (GLOW_LEVELS - 1))
+    return min(max(level, 0), GLOW_LEVELS - 1)
+
+
+def glow_factor(level):
+    return 0.7 + 0.3 * level / (GLOW_LEVELS - 1)
+
 
 class ScoreDisplay:
+    """Interface (HUD) conservée dans un calque.
+
+    Les cadres des panneaux et les libellés sont rendus une fois ; chaque
+    panneau n'est redessiné dans le calque que si sa valeur ou sa variante de
+    lueur change. Chaque frame ne coûte alors qu'un blit du calque.
+    """
+
     def __init__(self):
-        self.title_font = pygame.font.Font(None, 40)
-        self.value_font = pygame.font.Font(None, 48)
-        self.level_font = pygame.font.Font(None, 45)
-        self.highscore_font = pygame.font.Font(None, 30)
-        
+        self.title_font = assets.font(None, 40)
+        self.value_font = assets.font(None, 48)
+        self.level_font = assets.font(None, 45)
+        self.highscore_font = assets.font(None, 30)
+
         # Couleurs néon
         self.neon_blue = (102, 204, 255)
         self.neon_pink = (255, 51, 102)
         self.neon_yellow = (255, 255, 102)
         self.neon_green = (57, 255, 20)
-        
+
         # Dimensions et positions
         panel_width = WIDTH // 5
         spacing = 20
-        self.interface_height = 100
-        
+        self.interface_height = INTERFACE_HEIGHT
+
         # Position des panneaux
         total_width = panel_width * 4 + spacing * 3
         start_x = (WIDTH - total_width) // 2
-        
+
         self.score_pos = (start_x, 20)
         self.lives_pos = (start_x + panel_width + spacing, 20)
         self.highscore_pos = (start_x + (panel_width + spacing) * 2, 20)
         self.level_pos = (start_x + (panel_width + spacing) * 3, 20)
-        
+
         # Animation
         self.score_animation = 0
         self.target_score = 0
         self.animation_speed = 0.1
         self.animation_time = 0
-        
+
         # Dimensions des panneaux
         self.panel_width = panel_width
         self.panel_height = 60
         self.border_radius = 10
 
+        # Calque du HUD : panneaux, puis multiplicateur et ligne de séparation
+        self.layer = pygame.Surface((WIDTH, self.interface_height + 40), pygame.SRCALPHA)
+        self.footer_rect = pygame.Rect(0, self.interface_height - 12,
+                                       WIDTH, self.layer.get_height() - self.interface_height + 12)
+
+        # Cadres et libellés rendus une seule fois
+        self.panels = {}
+        for name, pos, color, label in (
+                ("score", self.score_pos, self.neon_blue, "SCORE"),
+                ("lives", self.lives_pos, self.neon_pink, None),
+                ("highscore", self.highscore_pos, self.neon_green, "HIGH"),
+                ("level", self.level_pos, self.neon_yellow, "LEVEL")):
+            rect = pygame.Rect(pos[0], pos[1], self.panel_width, self.panel_height)
+            label_surface = self.title_font.render(label, True, color) if label else None
+            self.panels[name] = (rect, self.render_panel_chrome(rect, color), label_surface)
+
+        # Dernier état dessiné de chaque zone et textes pré-teintés
+        self.drawn_keys = {}
+        self.value_cache = {}
+        self.multiplier_cache = {}
+
+        # Zones de l'écran redessinées lors du dernier draw()
+        self.dirty_rects = []
+
     def draw_neon_panel(self, screen, rect, color, glow_intensity=1.0):
         """Dessine un panneau avec effet néon"""
         # Lueur externe
@@ -51,19 +99,48 @@ class ScoreDisplay:
             s = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
             pygame.draw.rect(s, (*color, alpha), s.get_rect(), border_radius=self.border_radius)
             screen.blit(s, glow_rect)
-        
+
         # Rectangle principal
         s = pygame.Surface(rect.size, pygame.SRCALPHA)
         pygame.draw.rect(s, (*color[:3], 40), s.get_rect(), border_radius=self.border_radius)
         screen.blit(s, rect)
-        
+
         # Bordure brillante
         pygame.draw.rect(screen, color, rect, 2, border_radius=self.border_radius)
-        
+
         # Reflet supérieur
         highlight_rect = pygame.Rect(rect.x, rect.y, rect.width, 2)
         pygame.draw.rect(screen, (255, 255, 255, int(50 * glow_intensity)), highlight_rect)
 
+    def render_panel_chrome(self, rect, color):
+        """Cadre néon d'un panneau, rendu une fois dans sa propre surface"""
+        area = rect.inflate(12, 8)
+        chrome = pygame.Surface(area.size, pygame.SRCALPHA)
+        local_rect = rect.move(-area.x, -area.y)
+        self.draw_neon_panel(chrome, local_rect, color)
+        # Bordure et reflet opaques, comme lorsqu'ils étaient dessinés sur l'écran
+        pygame.draw.rect(chrome, (*color, 255), local_rect, 2, border_radius=self.border_radius)
+        chrome.fill((255, 255, 255, 255), (local_rect.x, local_rect.y, local_rect.width, 2))
+        return chrome
+
+    def render_value(self, font, text, color, level):
+        """Texte d'une valeur dans une variante de lueur (rendu une fois par valeur)"""
+        key = (id(font), text, color, level)
+        surface = self.value_cache.get(key)
+        if surface is None:
+            # On ne garde que les variantes des valeurs récentes
+            if len(self.value_cache) > GLOW_LEVELS * 16:
+                self.value_cache.clear()
+            tint = tuple(int(c * glow_factor(level)) for c in color)
+            surface = font.render(text, True, tint)
+            self.value_cache[key] = surface
+        return surface
+
+    def update(self, score):
+        """Avance les animations du HUD d'un pas de simulation (pulsations, score)"""
+        self.animation_time += 0.05
+        self.animate_score(score)
+
     def animate_score(self, score):
         """Anime le score de manière fluide"""
         self.target_score = score
@@ -72,53 +149,57 @@ class ScoreDisplay:
         if abs(diff) < 1:
             self.score_animation = self.target_score
 
+    def begin_panel(self, name):
+        """Efface le panneau dans le calque et y replace son cadre et son libellé"""
+        rect, chrome, label = self.panels[name]
+        area = rect.inflate(12, 8)
+        self.layer.fill((0, 0, 0, 0), area)
+        self.layer.blit(chrome, area)
+        if label is not None:
+            self.layer.blit(label, (rect.x + 10, rect.y + 5))
+        self.dirty_rects.append(area)
+        return rect
+
+    def update_zone(self, name, key):
+        """Vrai si la zone doit être redessinée (sa clé a changé)"""
+        if self.drawn_keys.get(name) == key:
+            return False
+        self.drawn_keys[name] = key
+        return True
+
     def draw_score(self, screen, score):
         """Dessine le score avec animation et effet néon"""
-        self.animate_score(score)
         displayed_score = int(self.score_animation)
-        
-        panel_rect = pygame.Rect(self.score_pos[0], self.score_pos[1], 
-                               self.panel_width, self.panel_height)
-        self.draw_neon_panel(screen, panel_rect, self.neon_blue)
-        
-        # Textes avec effet de lueur
-        glow = abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7
-        score_text = self.title_font.render("SCORE", True, self.neon_blue)
-        score_value = self.value_font.render(f"{displayed_score:,}", True, 
-                                          tuple(int(c * glow) for c in self.neon_blue))
-        
-        screen.blit(score_text, (self.score_pos[0] + 10, self.score_pos[1] + 5))
-        screen.blit(score_value, (self.score_pos[0] + 10, self.score_pos[1] + 30))
+
+        level = quantize_glow(abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7)
+        if self.update_zone("score", (displayed_score, level)):
+            rect = self.begin_panel("score")
+            value = self.render_value(self.value_font, f"{displayed_score:,}", self.neon_blue, level)
+            self.layer.blit(value, (rect.x + 10, rect.y + 30))
 
     def draw_level(self, screen, level):
         """Dessine le niveau avec effet néon"""
-        panel_rect = pygame.Rect(self.level_pos[0], self.level_pos[1],
-                               self.panel_width, self.panel_height)
-        self.draw_neon_panel(screen, panel_rect, self.neon_yellow)
-        
-        # Textes avec effet de lueur
-        glow = abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7
-        level_title = self.title_font.render("LEVEL", True, self.neon_yellow)
-        level_value = self.level_font.render(str(level), True, 
-                                           tuple(int(c * glow) for c in self.neon_yellow))
-        
-        screen.blit(level_title, (self.level_pos[0] + 10, self.level_pos[1] + 5))
-        screen.blit(level_value, (self.level_pos[0] + 10, self.level_pos[1] + 30))
+        glow = quantize_glow(abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7)
+        if self.update_zone("level", (level, glow)):
+            rect = self.begin_panel("level")
+            value = self.render_value(self.level_font, str(level), self.neon_yellow, glow)
+            self.layer.blit(value, (rect.x + 10, rect.y + 30))
 
     def draw_lives(self, screen, lives):
         """Dessine les vies avec effet néon"""
-        panel_rect = pygame.Rect(self.lives_pos[0], self.lives_pos[1],
-                               self.panel_width, self.panel_height)
-        self.draw_neon_panel(screen, panel_rect, self.neon_pink)
-        
+        glows = tuple(quantize_glow(abs(math.sin(self.animation_time * 3 + i)) * 0.3 + 0.7)
+                      for i in range(lives))
+        if not self.update_zone("lives", glows):
+            return
+
+        self.begin_panel("lives")
         heart_spacing = (self.panel_width - 20) // lives if lives > 0 else 0
-        for i in range(lives):
+        for i, glow in enumerate(glows):
             x = self.lives_pos[0] + 10 + i * heart_spacing
             y = self.lives_pos[1] + 20
-            
-            glow = abs(math.sin(self.animation_time * 3 + i)) * 0.3 + 0.7
-            color = tuple(int(c * glow) for c in (255, 64, 64))
-            
+
+            color = tuple(int(c * glow_factor(glow)) for c in (255, 64, 64))
+
             heart_points = [
                 (x + 10, y + 5),
                 (x + 5, y),
@@ -127,43 +208,60 @@ class ScoreDisplay:
                 (x + 20, y + 5),
                 (x + 15, y)
             ]
-            pygame.draw.polygon(screen, color, heart_points)
+            pygame.draw.polygon(self.layer, color, heart_points)
 
     def draw_highscore(self, screen, highscore):
         """Dessine le high score avec effet néon"""
-        panel_rect = pygame.Rect(self.highscore_pos[0], self.highscore_pos[1],
-                               self.panel_width, self.panel_height)
-        self.draw_neon_panel(screen, panel_rect, self.neon_green)
-        
-        # Textes avec effet de lueur
-        glow = abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7
-        title = self.title_font.render("HIGH", True, self.neon_green)
-        value = self.value_font.render(f"{highscore:,}", True, 
-                                     tuple(int(c * glow) for c in self.neon_green))
-        
-        screen.blit(title, (self.highscore_pos[0] + 10, self.highscore_pos[1] + 5))
-        screen.blit(value, (self.highscore_pos[0] + 10, self.highscore_pos[1] + 30))
-
-    def draw_multiplier(self, screen, multiplier):
-        """Dessine le multiplicateur avec effet néon"""
-        if multiplier > 1:
-            glow = abs(math.sin(self.animation_time * 5)) * 0.3 + 0.7
-            color = tuple(int(c * glow) for c in self.neon_yellow)
-            
+        glow = quantize_glow(abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7)
+        if self.update_zone("highscore", (highscore, glow)):
+            rect = self.begin_panel("highscore")
+            value = self.render_value(self.value_font, f"{highscore:,}", self.neon_green, glow)
+            self.layer.blit(value, (rect.x + 10, rect.y + 30))
+
+    def get_multiplier_surface(self, multiplier, glow, scale_level):
+        """Texte du multiplicateur teinté et zoomé, mis en cache"""
+        key = (multiplier, glow, scale_level)
+        surface = self.multiplier_cache.get(key)
+        if surface is None:
+            color = tuple(int(c * glow_factor(glow)) for c in self.neon_yellow)
             text = self.value_font.render(f"x{multiplier}", True, color)
-            text_rect = text.get_rect(midtop=(WIDTH // 2, 90))
-            
-            scale = abs(math.sin(self.animation_time * 4)) * 0.2 + 1.0
-            scaled_text = pygame.transform.rotozoom(text, 0, scale)
-            scaled_rect = scaled_text.get_rect(center=text_rect.center)
-            
-            screen.blit(scaled_text, scaled_rect)
-
-    def draw(self, screen, score, level, lives, highscore=0, multiplier=1):
-        """Dessine l'interface complète"""
-        self.animation_time += 0.05
-        
-        # Fond semi-transparent avec effet de gradient
+            scale = 1.0 + 0.2 * scale_level / (SCALE_LEVELS - 1)
+            surface = pygame.transform.rotozoom(text, 0, scale)
+            self.multiplier_cache[key] = surface
+        return surface
+
+    def draw_footer(self, multiplier):
+        """Multiplicateur et ligne de séparation (zones qui se chevauchent)"""
+        separator_glow = quantize_glow(abs(math.sin(self.animation_time * 2)) * 0.3 + 0.7)
+        if multiplier > 1:
+            glow = quantize_glow(abs(math.sin(self.animation_time * 5)) * 0.3 + 0.7)
+            scale = abs(math.sin(self.animation_time * 4))
+            scale_level = min(round(scale * (SCALE_LEVELS - 1)), SCALE_LEVELS - 1)
+            key = (separator_glow, multiplier, glow, scale_level)
+        else:
+            key = (separator_glow,)
+        if not self.update_zone("footer", key):
+            return
+
+        self.layer.fill((0, 0, 0, 0), self.footer_rect)
+        self.dirty_rects.append(self.footer_rect)
+
+        # Multiplicateur avec effet néon
+        if multiplier > 1:
+            scaled_text = self.get_multiplier_surface(multiplier, glow, scale_level)
+            text_height = self.value_font.get_height()
+            scaled_rect = scaled_text.get_rect(center=(WIDTH // 2, 90 + text_height // 2))
+            self.layer.blit(scaled_text, scaled_rect)
+
+        # Ligne de séparation avec effet néon
+        separator_y = self.interface_height - 2
+        color = tuple(int(c * glow_factor(separator_glow)) for c in self.neon_blue)
+        for i in range(3):
+            pygame.draw.line(self.layer, (*color, 255),
+                             (0, separator_y + i), (WIDTH, separator_y + i))
+
+    def draw_background(self, screen):
+        """Dessine le fond semi-transparent en gradient de l'interface"""
         interface_surface = pygame.Surface((WIDTH, self.interface_height), pygame.SRCALPHA)
         for i in range(self.interface_height):
             alpha = 180 - int(i * 0.5)
@@ -171,23 +269,28 @@ class ScoreDisplay:
                 alpha = 0
             interface_surface.fill((20, 24, 32, alpha), (0, i, WIDTH, 1))
         screen.blit(interface_surface, (0, 0))
-        
-        # Éléments de l'interface
+
+    def invalidate(self):
+        """Force le rendu complet du calque à la prochaine frame"""
+        self.drawn_keys.clear()
+
+    def draw(self, screen, score, level, lives, highscore=0, multiplier=1,
+             with_background=True):
+        """Dessine l'interface complète (animations avancées par update())"""
+        self.dirty_rects = []
+
+        # Fond semi-transparent (déjà intégré au fond statique du GameRenderer)
+        if with_background:
+            self.draw_background(screen)
+
+        # Mise à jour des zones du calque dont le contenu a changé
         self.draw_score(screen, score)
         self.draw_level(screen, level)
         self.draw_lives(screen, lives)
         self.draw_highscore(screen, highscore)
-        self.draw_multiplier(screen, multiplier)
-        
-        # Ligne de séparation avec effet néon
-        separator_y = self.interface_height - 2
-        glow = abs(math.sin(self.animation_time * 2)) * 0.3 + 0.7
-        color = tuple(int(c * glow) for c in self.neon_blue)
-        
-        for i in range(3):
-            alpha = 255 - (i * 80)
-            pygame.draw.line(screen, (*color[:3], alpha),
-                           (0, separator_y + i), (WIDTH, separator_y + i))
+        self.draw_footer(multiplier)
+
+        screen.blit(self.layer, (0, 0))
 
     def get_interface_height(self):
-        return self.interface_height
\ No newline at end of file
+        return self.interface_height
@@ -0,0 +1,69 @@
+"""Soak-test / benchmark de la simulation en headless (sans fenêtre ni son) :
+
+    python -m src.soak --frames 100000
+    python -m src.soak --frames 1000000 --autopilot   # raquette pilotée (parties réalistes)
+"""
+import argparse
+import time
+from src.autopilot import Autopilot
+from src.constants import SEED_LIMIT
+from src.game import Game
+
+
+def run_soak(frames, level=1, seed=None, autopilot=False):
+    """Simule `frames` frames en headless et retourne des statistiques.
+
+    autopilot : la raquette est pilotée par Autopilot au lieu de rester immobile.
+    """
+    game = Game(headless=True, seed=seed)
+    if level != 1:
+        game.jump_to_level(level)
+    inputs = Autopilot(game) if autopilot else None
+
+    simulated = 0
+    restarts = 0
+    start = time.perf_counter()
+    while simulated < frames:
+        simulated += game.step(frames - simulated, inputs)
+        if game.game_over:
+            game.reset_game()
+            restarts += 1
+        elif game.victory:
+            game.start_next_level()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "frames": simulated,
+        "seconds": elapsed,
+        "frames_per_second": simulated / elapsed if elapsed > 0 else float("inf"),
+        "restarts": restarts,
+        "level": game.level,
+        "score": game.score,
+        "seed": game.seed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation headless de Neon Pulse")
+    parser.add_argument("--frames", type=int, default=60 * 60,
+                        help="nombre de frames à simuler")
+    parser.add_argument("--level", type=int, default=1,
+                        help="niveau de départ")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="raquette pilotée automatiquement")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine de la partie (aléatoire par défaut)")
+    args = parser.parse_args(argv)
+    if args.seed is not None and not 0 <= args.seed < SEED_LIMIT:
+        parser.error(f"--seed doit être compris entre 0 et {SEED_LIMIT - 1}")
+
+    stats = run_soak(args.frames, args.level, args.seed, args.autopilot)
+    print(f"{stats['frames']} frames en {stats['seconds']:.3f}s "
+          f"({stats['frames_per_second']:.0f} frames/s, "
+          f"{stats['frames_per_second'] / 60:.0f}x temps réel)")
+    print(f"niveau {stats['level']}, score {stats['score']}, "
+          f"{stats['restarts']} redémarrage(s), graine {stats['seed']}")
+
+
+if __name__ == "__main__":
+    main()
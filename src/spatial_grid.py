@@ -0,0 +1,64 @@
+import pygame
+from src.brick import Brick
+
+
+class BrickGrid:
+    """Grille uniforme (broad phase) pour les collisions balle / briques.
+
+    La taille des cellules est déduite de la disposition (taille des briques
+    par défaut). Chaque cellule garde les indices des briques actives qui la
+    recouvrent ; une balle ne teste que les cellules de sa boîte englobante.
+    """
+
+    def __init__(self, bricks, cell_width=None, cell_height=None):
+        self.bricks = bricks
+
+        if not len(self.bricks):
+            self.bounds = pygame.Rect(0, 0, 0, 0)
+            self.cell_width = self.cell_height = 1
+            self.columns = self.rows = 0
+            self.cells = []
+            return
+
+        self.cell_width = cell_width or min(brick.rect.width for brick in self.bricks)
+        self.cell_height = cell_height or min(brick.rect.height for brick in self.bricks)
+        self.bounds = self.bricks[0].rect.unionall([brick.rect for brick in self.bricks[1:]])
+        self.columns = (self.bounds.width - 1) // self.cell_width + 1
+        self.rows = (self.bounds.height - 1) // self.cell_height + 1
+        self.cells = [[] for _ in range(self.columns * self.rows)]
+
+        for brick in self.bricks:
+            if brick.active:
+                for cell in self.cells_for(brick.rect):
+                    self.cells[cell].append(brick.index)
+
+    def cells_for(self, rect):
+        """Indices des cellules recouvertes par rect (hors grille ignorées)"""
+        if not rect.colliderect(self.bounds):
+            return []
+        left = max(rect.left - self.bounds.left, 0) // self.cell_width
+        right = min(rect.right - 1 - self.bounds.left, self.bounds.width - 1) // self.cell_width
+        top = max(rect.top - self.bounds.top, 0) // self.cell_height
+        bottom = min(rect.bottom - 1 - self.bounds.top, self.bounds.height - 1) // self.cell_height
+        return [row * self.columns + column
+                for row in range(top, bottom + 1)
+                for column in range(left, right + 1)]
+
+    def query(self, rect):
+        """Briques actives candidates pour rect, dans l'ordre de la disposition"""
+        cells = self.cells_for(rect)
+        if not cells:
+            return []
+        if len(cells) == 1:
+            indices = self.cells[cells[0]]
+        else:
+            indices = sorted({i for cell in cells for i in self.cells[cell]})
+        return [Brick(self.bricks, i) for i in indices]
+
+    def remove(self, brick):
+        """Retire une brique détruite de ses cellules"""
+        if brick.store is not self.bricks:
+            return
+        for cell in self.cells_for(brick.rect):
+            if brick.index in self.cells[cell]:
+                self.cells[cell].remove(brick.index)
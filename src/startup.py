@@ -0,0 +1,52 @@
+"""Initialisation de pygame à la demande et mesure du démarrage.
+
+Aucun module de src n'ouvre de fenêtre à l'import : la fenêtre est créée
+par open_window() au premier besoin, et seuls les sous-systèmes utilisés par
+le jeu sont initialisés (ni joystick, ni caméra, contrairement à pygame.init()).
+Les polices sont initialisées par le registre d'assets au premier chargement.
+"""
+import time
+import pygame
+from src.constants import WIDTH, HEIGHT, WINDOW_TITLE
+
+
+def init_pygame(audio=True):
+    """Initialise l'affichage et, si demandé, le mixer (appels répétés sans effet)"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if audio and pygame.mixer.get_init() is None:
+        pygame.mixer.init()
+
+
+def open_window():
+    """Surface de la fenêtre du jeu, créée au premier appel"""
+    init_pygame()
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(WINDOW_TITLE)
+    return screen
+
+
+class StartupReport:
+    """Durée de chaque étape du démarrage (imports, init, assets, première frame)"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.stages = []
+
+    def mark(self, stage):
+        """Termine l'étape `stage` (commencée à la fin de la précédente)"""
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+    def format(self):
+        lines = [f"{stage:<12} {duration * 1000:8.1f} ms" for stage, duration in self.stages]
+        lines.append(f"{'total':<12} {self.total * 1000:8.1f} ms")
+        return "\n".join(lines)
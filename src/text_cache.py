@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+# Mémoire maximale des textes rendus gardés en cache (octets)
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+
+
+class SurfaceCache:
+    """Cache LRU de surfaces déjà rendues, borné en mémoire.
+
+    get(key, build) retourne la surface gardée pour key ou l'obtient avec
+    build() ; au-delà de max_bytes, les surfaces les moins récemment utilisées
+    sont oubliées. Les surfaces sont partagées : les blitter, sans les modifier.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, build):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self.entries[key] = surface
+        self.bytes += self.entry_size(surface)
+        # Toujours garder la dernière entrée, même plus grosse que le plafond
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.entry_size(evicted)
+            self.evictions += 1
+        return surface
+
+    @staticmethod
+    def entry_size(surface):
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def stats(self):
+        """Nombre d'entrées, mémoire occupée et hits/misses/évictions"""
+        return {
+            "count": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
@@ -0,0 +1,63 @@
+import time
+from contextlib import contextmanager
+from src.constants import SIMULATION_RATE
+
+
+class FixedTimestep:
+    """Accumulateur pour une simulation à pas fixe, indépendante du rendu.
+
+    advance() retourne le nombre de pas de simulation à exécuter pour le temps
+    écoulé depuis l'appel précédent ; alpha donne la fraction de pas restante,
+    utilisée pour interpoler les positions au rendu.
+    """
+
+    def __init__(self, rate=SIMULATION_RATE, max_steps=5):
+        self.rate = rate
+        self.dt = 1 / rate
+        # Limite de rattrapage par frame (évite la spirale de la mort)
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def reset(self):
+        """Repart de zéro (ex: après une pause ou un changement de scène)"""
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self):
+        """Ajoute le temps écoulé et retourne le nombre de pas à simuler"""
+        now = time.perf_counter()
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+
+        elapsed = min(now - self.last_time, self.max_steps * self.dt)
+        self.last_time = now
+        self.accumulator += elapsed
+
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction du pas suivant déjà écoulée (0..1)"""
+        return self.accumulator / self.dt
+
+
+@contextmanager
+def interpolated(entities, alpha):
+    """Place temporairement chaque entité entre previous_rect et rect pour le rendu"""
+    saved = []
+    if alpha < 1:
+        for entity in entities:
+            previous = entity.previous_rect
+            current = entity.rect
+            saved.append((entity, current.topleft))
+            current.topleft = (round(previous.x + (current.x - previous.x) * alpha),
+                               round(previous.y + (current.y - previous.y) * alpha))
+    try:
+        yield
+    finally:
+        for entity, topleft in saved:
+            entity.rect.topleft = topleft